@@ -0,0 +1 @@
+"""Project package structure."""
@@ -0,0 +1,76 @@
+"""Run the benchmark suite and compare it against a saved baseline.
+
+Run from the repository root, for example:
+
+    python -m benchmarks --output baseline.json
+    python -m benchmarks --baseline baseline.json --threshold 0.2
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks.suite import compare, FULL_MESSAGE_SIZES, \
+    FULL_SIDE_LENGTHS, get_case, QUICK_MESSAGE_SIZES, QUICK_SIDE_LENGTHS, \
+    REGRESSION_THRESHOLD, run_suite
+
+
+def main(argv=None) -> int:
+    """Run the benchmarks and return the exit code."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "--full", action="store_true",
+        help="sweep side lengths 2-16 and message sizes 1 KB-10 MB"
+    )
+    parser.add_argument("--side-length", type=int, nargs="+")
+    parser.add_argument("--message-size", type=int, nargs="+")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--filter", default="", help="only run cases starting with this name"
+    )
+    parser.add_argument("--output", help="write the results as JSON here")
+    parser.add_argument("--baseline", help="compare with these results")
+    parser.add_argument(
+        "--threshold", type=float, default=REGRESSION_THRESHOLD
+    )
+    args = parser.parse_args(argv)
+
+    # Pick the sweep, the explicit values win over the full sweep.
+    side_lengths = args.side_length or \
+        (FULL_SIDE_LENGTHS if args.full else QUICK_SIDE_LENGTHS)
+    message_sizes = args.message_size or \
+        (FULL_MESSAGE_SIZES if args.full else QUICK_MESSAGE_SIZES)
+
+    results = run_suite(
+        cases=get_case(side_lengths=side_lengths, message_sizes=message_sizes),
+        repeat=args.repeat,
+        name_filter=args.filter
+    )
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    # Report the regressions against the baseline, if any.
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            comparison = compare(
+                results=results,
+                baseline=json.load(baseline_file),
+                threshold=args.threshold
+            )
+        regressions = [each for each in comparison if each["regression"]]
+        for each in regressions:
+            print(
+                f"Regression: {each['name']} {each['params']} is "
+                f"{each['ratio']:.2f}x the baseline time.",
+                file=sys.stderr
+            )
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,438 @@
+"""Define the benchmark cases and the tools to run and compare them."""
+
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, \
+    NamedTuple, Optional
+
+import numpy as np
+
+from src.analyzers.bit_analyzer import analyze_bit
+from src.analyzers.key_analyzer import KeyAnalyzer
+from src.encbit.cube import Cube
+from src.encbit.cubie import Cubie
+from src.encbit.encryption import Encryption as BitEncryption
+from src.encbit.face import Face
+from src.encitem.encryption import Encryption as ItemEncryption
+from src.engine.backend import get_backend_names
+from src.engine.batch import encrypt_states
+from src.engine.bitslice import encrypt_states_bitsliced
+from src.engine.numpy_cube import LAYOUTS, NumpyCube
+from src.engine.permutation import apply_key, get_cube_size, \
+    get_key_permutation
+from src.helper.constant import CUBE_MOVE, CUBIE_LENGTH, CubieItem, Key, \
+    MOVE_ANGLE
+from src.helper.utility import generate_random_keys
+
+# Side lengths and message sizes in bytes of the quick and the full sweep.
+QUICK_SIDE_LENGTHS = [2, 3, 4]
+FULL_SIDE_LENGTHS = list(range(2, 17))
+QUICK_MESSAGE_SIZES = [1024]
+FULL_MESSAGE_SIZES = [1024, 10240, 102400, 1048576, 10485760]
+# Number of keys used by the benchmarks that need a key.
+KEY_LENGTH = 10
+# Number of cubes encrypted at once by the batch benchmarks.
+BATCH_SIZE = 16384
+# Slow down allowed before a result is a regression, 0.2 means 20% slower.
+REGRESSION_THRESHOLD = 0.2
+# Modules a short-lived process imports to encrypt, timed from a fresh start.
+STARTUP_MODULES = [
+    "src.encbit.encryption", "src.encitem.encryption", "src.engine.batch"
+]
+# Largest share of the pandas import time that importing the modules may
+# take once NumPy is loaded, so pulling in pandas again fails the guard.
+STARTUP_BUDGET = 0.5
+# The repository root, where the fresh processes import the modules from.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Case(NamedTuple):
+    """Define one benchmark, the setup returns the function to time."""
+
+    name: str
+    params: dict
+    setup: Callable[[], Callable[[], object]]
+    number: int = 1
+    size: int = 0
+
+
+def _get_message(size: int) -> str:
+    """Get a repeatable message with the desired number of bytes."""
+    sentence = "The quick brown fox jumps over the lazy dog. "
+    return (sentence * (size // len(sentence) + 1))[:size]
+
+
+def _get_key(side_length: int, length: int = KEY_LENGTH) -> List[Key]:
+    """Get a repeatable key for the side length, leaving the module RNG."""
+    return generate_random_keys(
+        length=length,
+        max_index=math.floor(side_length / 2),
+        rng=random.Random(0)
+    )
+
+
+def _get_cube_input(side_length: int) -> str:
+    """Get a repeatable binary input for one cube."""
+    return ("0110" * side_length ** 2 * 6)[:side_length ** 2 * 24]
+
+
+def _get_face(side_length: int) -> Face:
+    """Get one face filled with repeatable cubie items."""
+    return Face(
+        cube_face_input=[
+            CubieItem(content=content, marked=False)
+            for content in _get_cube_input(side_length)[:side_length ** 2 * 4]
+        ],
+        cube_side_length=side_length
+    )
+
+
+def _get_unit_case(side_length: int) -> Iterator[Case]:
+    """Get the benchmarks of the face operations."""
+    params = {"side_length": side_length}
+
+    def get_row():
+        face = _get_face(side_length=side_length)
+        return lambda: face.get_row(row_name="T1")
+
+    def fill_row():
+        face = _get_face(side_length=side_length)
+        row = face.get_row(row_name="T1").values
+        return lambda: face.fill_row(row_name="T1", input_list=row)
+
+    def rotate_face():
+        face = _get_face(side_length=side_length)
+        return lambda: face.rotate_by_angle(angle=90)
+
+    yield Case("face.get_row", params, get_row, number=100)
+    yield Case("face.fill_row", params, fill_row, number=100)
+    yield Case("face.rotate_by_angle", params, rotate_face, number=10)
+
+
+def _get_cube_case(side_length: int) -> Iterator[Case]:
+    """Get the benchmarks of the cube operations."""
+    params = {"side_length": side_length}
+
+    def get_cube():
+        return Cube(
+            cube_input=_get_cube_input(side_length=side_length),
+            cube_side_length=side_length
+        )
+
+    def shift(key: Key):
+        cube = get_cube()
+        return lambda: cube.shift(key=key)
+
+    def xor():
+        cube = get_cube()
+        return cube.xor
+
+    def shift_content():
+        cube = get_cube()
+        return cube.shift_cubie_content
+
+    def bit_analyzer():
+        key = _get_key(side_length=side_length)
+        cube_input = _get_cube_input(side_length=side_length)
+        return lambda: analyze_bit(
+            key=key,
+            side_length=side_length,
+            random_bits=cube_input[side_length ** 2 * 20:],
+            message_bits=cube_input[:side_length ** 2 * 20]
+        )
+
+    # Shift with every move and angle on the inner and the outer layer.
+    for move in CUBE_MOVE:
+        for angle in MOVE_ANGLE:
+            for index in sorted({1, math.floor(side_length / 2)}):
+                key = Key(move=move, angle=angle, index=index)
+                yield Case(
+                    "cube.shift",
+                    {**params, "move": move, "angle": angle, "index": index},
+                    lambda key=key: shift(key=key)
+                )
+    yield Case("cube.xor", params, xor)
+    yield Case("cube.shift_cubie_content", params, shift_content)
+    yield Case("analyze_bit", params, bit_analyzer)
+
+
+def _get_engine_case(side_length: int) -> Iterator[Case]:
+    """Get the benchmarks of a move as a full gather and as slices only."""
+    params = {"side_length": side_length}
+
+    def get_content() -> np.ndarray:
+        return np.zeros(get_cube_size(side_length), dtype=np.uint8)
+
+    def gather(key: Key):
+        content = get_content()
+        permutation = get_key_permutation(
+            key=key, cube_side_length=side_length
+        )
+        return lambda: content[permutation]
+
+    def slices(key: Key):
+        content = get_content()
+        apply_key(content=content, key=key, cube_side_length=side_length)
+        return lambda: apply_key(
+            content=content, key=key, cube_side_length=side_length
+        )
+
+    def layout_shift(layout: str, key: Key):
+        cube = NumpyCube(
+            cube_input=get_content(),
+            cube_side_length=side_length,
+            layout=layout
+        )
+        cube.shift(key=key)
+        return lambda: cube.shift(key=key)
+
+    # Compare the row and the column moves in every layout.
+    for layout in LAYOUTS:
+        for move in ["top", "right"]:
+            for index in sorted({1, math.floor(side_length / 2)}):
+                key = Key(move=move, angle=90, index=index)
+                yield Case(
+                    "numpy_cube.shift",
+                    {**params, "layout": layout, "move": move,
+                     "index": index},
+                    lambda layout=layout, key=key: layout_shift(
+                        layout=layout, key=key
+                    ),
+                    number=100
+                )
+
+    # Compare both kernels on the inner and the outer layer.
+    for index in sorted({1, math.floor(side_length / 2)}):
+        key = Key(move="right", angle=90, index=index)
+        yield Case(
+            "engine.gather",
+            {**params, "index": index},
+            lambda key=key: gather(key=key),
+            number=100
+        )
+        yield Case(
+            "engine.apply_key",
+            {**params, "index": index},
+            lambda key=key: slices(key=key),
+            number=100
+        )
+
+    # Compare one byte per bit with 64 cubes per word on a bulk batch.
+    def batch(function: Callable):
+        states = np.random.default_rng(0).integers(
+            0, 2, size=(BATCH_SIZE, get_cube_size(side_length)),
+            dtype=np.uint8
+        )
+        key = _get_key(side_length=side_length)
+        return lambda: function(
+            states=states, key=key, cube_side_length=side_length
+        )
+
+    for name, function in [("engine.batch", encrypt_states),
+                           ("engine.bitslice", encrypt_states_bitsliced)]:
+        yield Case(
+            name,
+            {**params, "cubes": BATCH_SIZE},
+            lambda function=function: batch(function=function)
+        )
+
+
+def _get_encryption_case(side_length: int,
+                         message_size: int) -> Iterator[Case]:
+    """Get the end to end benchmarks of both encryption protocols."""
+    params = {"side_length": side_length, "message_size": message_size}
+
+    def encrypt(protocol_class, backend: Optional[str] = None):
+        def setup():
+            key = _get_key(side_length=side_length)
+            protocol = protocol_class(
+                message=_get_message(size=message_size),
+                cube_side_length=side_length,
+                backend=backend
+            )
+            return lambda: protocol.encrypt(key=key)
+        return setup
+
+    def decrypt(protocol_class, backend: Optional[str] = None):
+        def setup():
+            protocol = protocol_class(
+                message=_get_message(size=message_size),
+                cube_side_length=side_length,
+                backend=backend
+            )
+            protocol.encrypt(key=_get_key(side_length=side_length))
+            return protocol.decrypt
+        return setup
+
+    # Time the reference cubes, whatever the default backend is.
+    for protocol, protocol_class in [("encbit", BitEncryption),
+                                     ("encitem", ItemEncryption)]:
+        yield Case(f"{protocol}.encrypt", params,
+                   encrypt(protocol_class, backend="pandas"),
+                   size=message_size)
+        yield Case(f"{protocol}.decrypt", params,
+                   decrypt(protocol_class, backend="pandas"),
+                   size=message_size)
+
+    # Time the other cube backends, the reference is timed above.
+    for backend in get_backend_names():
+        if backend == "pandas":
+            continue
+        for protocol, protocol_class in [("encbit", BitEncryption),
+                                         ("encitem", ItemEncryption)]:
+            yield Case(
+                "backend.encrypt",
+                {**params, "protocol": protocol, "backend": backend},
+                encrypt(protocol_class=protocol_class, backend=backend),
+                size=message_size
+            )
+
+
+def _get_startup_case() -> Iterator[Case]:
+    """Get the benchmarks of importing the modules in a new interpreter."""
+    def import_module(module: str):
+        return lambda: subprocess.run(
+            [sys.executable, "-c", f"import {module}"], check=True, cwd=ROOT
+        )
+
+    # The bare interpreter start is the floor of every import time.
+    yield Case("startup.python", {}, lambda: import_module(module="sys"))
+    # Pandas is the import the encryption path should not pay for.
+    yield Case("startup.pandas", {}, lambda: import_module(module="pandas"))
+    for module in STARTUP_MODULES:
+        yield Case(
+            "startup.import",
+            {"module": module},
+            lambda module=module: import_module(module=module)
+        )
+
+
+def get_case(side_lengths: Iterable[int] = QUICK_SIDE_LENGTHS,
+             message_sizes: Iterable[int] = QUICK_MESSAGE_SIZES) -> List[Case]:
+    """Get all benchmark cases of the sweep.
+
+    :param side_lengths: The side lengths of the cubes to benchmark.
+    :param message_sizes: The message sizes in bytes for the encryption.
+    :return: A list of benchmark cases.
+    """
+    # Each setup builds its own inputs, so only the running case is held.
+    cases = list(_get_startup_case())
+    for side_length in side_lengths:
+        cases.extend(_get_unit_case(side_length=side_length))
+        cases.extend(_get_cube_case(side_length=side_length))
+        cases.extend(_get_engine_case(side_length=side_length))
+        for message_size in message_sizes:
+            cases.extend(_get_encryption_case(
+                side_length=side_length, message_size=message_size
+            ))
+
+    # The cubie and the key analyzer do not depend on the cube.
+    cubie = Cubie([
+        CubieItem(content=content, marked=False) for content in "0110"
+    ])
+    cases.append(Case(
+        "cubie.rotate_by_angle",
+        {},
+        lambda: lambda: cubie.rotate_by_angle(angle=90),
+        number=1000
+    ))
+    cases.append(Case(
+        "key_analyzer.analyze",
+        {"key_length": 1000},
+        lambda: KeyAnalyzer(
+            key=_get_key(side_length=4, length=1000)
+        ).analyze
+    ))
+    return cases
+
+
+def run_case(case: Case, repeat: int = 3) -> dict:
+    """Time one benchmark case.
+
+    :param case: The benchmark case.
+    :param repeat: Number of times to set up and time the case.
+    :return: The result with the seconds per call of the case.
+    """
+    timings = []
+    for _ in range(repeat):
+        function = case.setup()
+        start = time.perf_counter()
+        for _ in range(case.number):
+            function()
+        timings.append((time.perf_counter() - start) / case.number)
+
+    best = min(timings)
+    return {
+        "name": case.name,
+        "params": case.params,
+        "seconds": best,
+        "median": statistics.median(timings),
+        "throughput": case.size / best if case.size and best else None
+    }
+
+
+def run_suite(cases: Iterable[Case],
+              repeat: int = 3,
+              name_filter: str = "") -> dict:
+    """Run the benchmark cases and collect machine-readable results.
+
+    :param cases: The benchmark cases.
+    :param repeat: Number of times to set up and time each case.
+    :param name_filter: Only run cases whose name starts with the filter.
+    :return: The results together with the environment information.
+    """
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cubie_length": CUBIE_LENGTH,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "results": [
+            run_case(case=case, repeat=repeat)
+            for case in cases if case.name.startswith(name_filter)
+        ]
+    }
+
+
+def _get_result_id(result: dict) -> str:
+    """Identify a result by its name and parameters."""
+    return json.dumps([result["name"], result["params"]], sort_keys=True)
+
+
+def compare(results: dict,
+            baseline: dict,
+            threshold: float = REGRESSION_THRESHOLD) -> List[dict]:
+    """Compare the results against a saved baseline.
+
+    :param results: The results from run_suite.
+    :param baseline: Results saved from an earlier run.
+    :param threshold: Slow down allowed before a result is a regression.
+    :return: One entry per result found in both, with the ratio of the
+        current time over the baseline time.
+    """
+    baseline_seconds: Dict[str, float] = {
+        _get_result_id(result): result["seconds"]
+        for result in baseline["results"]
+    }
+
+    comparison = []
+    for result in results["results"]:
+        result_id = _get_result_id(result)
+        if result_id in baseline_seconds and baseline_seconds[result_id]:
+            ratio = result["seconds"] / baseline_seconds[result_id]
+            comparison.append({
+                "name": result["name"],
+                "params": result["params"],
+                "ratio": ratio,
+                "regression": ratio > 1 + threshold
+            })
+    return comparison
@@ -0,0 +1,248 @@
+"""Encrypt, decrypt and benchmark files from the command line.
+
+Run from the repository root, for example:
+
+    python -m src keygen --side-length 4 --length 20 --output cube.key
+    python -m src encrypt --key cube.key --input log.txt --output log.ccub
+    python -m src decrypt --key cube.key < log.ccub > log.txt
+    python -m src append --key cube.key --input new.txt --output log.ccub
+    python -m src bench --side-length 4 --size 1048576 --workers 4
+
+The input and output default to stdin and stdout, and the key file holds a
+packed key from src.helper.key_codec, which also records the side length.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import sys
+import time
+from typing import Optional
+
+from src.engine.stream import AppendWriter, CODECS, decrypt_stream, \
+    DEFAULT_CHUNK_SIZE, encrypt_stream
+from src.helper.constant import WRONG_CHUNK_SIZE, WRONG_CUBE_SIDE_LENGTH, \
+    WRONG_KEY_SIDE_LENGTH, WRONG_WORKER_COUNT
+from src.helper.key_codec import decode_key_list, encode_keys, \
+    read_key_header
+from src.helper.utility import generate_random_keys
+
+# Number of keys generated when no length is given.
+DEFAULT_KEY_LENGTH = 20
+
+
+def _open(path: str, mode: str):
+    """Open the file, or the standard stream if the path is "-"."""
+    if path == "-":
+        stream = sys.stdin.buffer if "r" in mode else sys.stdout.buffer
+        return contextlib.nullcontext(stream)
+    return open(path, mode)
+
+
+def _read_key(path: str, side_length: Optional[int] = None):
+    """Read a key file and check it fits the side length, if one is given.
+
+    :return: The list of keys and the side length of the key.
+    """
+    with open(path, "rb") as key_file:
+        data = key_file.read()
+    key_side_length = read_key_header(data=data).side_length
+    if side_length is not None and side_length != key_side_length:
+        raise ValueError(WRONG_KEY_SIDE_LENGTH)
+    return decode_key_list(data=data), key_side_length
+
+
+def _check_stream_argument(args):
+    """Check the options shared by the commands that stream data."""
+    # Error check. The chunks and the workers should be positive.
+    assert args.chunk_size > 0, WRONG_CHUNK_SIZE
+    assert args.workers > 0, WRONG_WORKER_COUNT
+
+
+def _keygen(args) -> int:
+    """Write a random key for the side length."""
+    # Error check. The side length should be legal for a cube.
+    assert args.side_length > 1, WRONG_CUBE_SIDE_LENGTH
+
+    key = generate_random_keys(
+        length=args.length, max_index=math.floor(args.side_length / 2)
+    )
+    with _open(args.output, "wb") as output_file:
+        output_file.write(
+            encode_keys(key=key, cube_side_length=args.side_length)
+        )
+    return 0
+
+
+def _encrypt(args) -> int:
+    """Encrypt the input into a container."""
+    _check_stream_argument(args=args)
+    key, side_length = _read_key(path=args.key, side_length=args.side_length)
+    with _open(args.input, "rb") as input_file, \
+            _open(args.output, "wb") as output_file:
+        encrypt_stream(
+            source=input_file,
+            target=output_file,
+            key=key,
+            cube_side_length=side_length,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            codec=args.codec
+        )
+    return 0
+
+
+def _decrypt(args) -> int:
+    """Decrypt a container into the original input."""
+    _check_stream_argument(args=args)
+    key, side_length = _read_key(path=args.key)
+    with _open(args.input, "rb") as input_file, \
+            _open(args.output, "wb") as output_file:
+        decrypt_stream(
+            source=input_file,
+            target=output_file,
+            key=key,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            cube_side_length=side_length
+        )
+    return 0
+
+
+def _append(args) -> int:
+    """Append the input to a container, creating it if it does not exist."""
+    _check_stream_argument(args=args)
+    key, side_length = _read_key(path=args.key, side_length=args.side_length)
+    mode = "r+b" if os.path.exists(args.output) else "w+b"
+    with _open(args.input, "rb") as input_file, \
+            open(args.output, mode) as output_file, \
+            AppendWriter(
+                target=output_file,
+                key=key,
+                cube_side_length=side_length,
+                workers=args.workers) as writer:
+        for chunk in iter(lambda: input_file.read(args.chunk_size), b""):
+            writer.write(data=chunk, chunk_size=args.chunk_size)
+    return 0
+
+
+def _bench(args) -> int:
+    """Time encrypting and decrypting random bytes held in memory."""
+    # Error check. The side length should be legal for a cube.
+    assert args.side_length > 1, WRONG_CUBE_SIDE_LENGTH
+    _check_stream_argument(args=args)
+
+    data = os.urandom(args.size)
+    key = generate_random_keys(
+        length=args.length, max_index=math.floor(args.side_length / 2)
+    )
+
+    # Time both directions, keeping the container for the decryption.
+    container = io.BytesIO()
+    start = time.perf_counter()
+    cube_count = encrypt_stream(
+        source=io.BytesIO(data),
+        target=container,
+        key=key,
+        cube_side_length=args.side_length,
+        chunk_size=args.chunk_size,
+        workers=args.workers
+    )
+    encrypt_seconds = time.perf_counter() - start
+
+    decrypted = io.BytesIO()
+    start = time.perf_counter()
+    decrypt_stream(
+        source=io.BytesIO(container.getvalue()),
+        target=decrypted,
+        key=key,
+        chunk_size=args.chunk_size,
+        workers=args.workers
+    )
+    decrypt_seconds = time.perf_counter() - start
+
+    json.dump({
+        "side_length": args.side_length,
+        "size": args.size,
+        "key_length": args.length,
+        "workers": args.workers,
+        "cubes": cube_count,
+        "correct": decrypted.getvalue() == data,
+        "encrypt_seconds": encrypt_seconds,
+        "decrypt_seconds": decrypt_seconds,
+        "encrypt_throughput": args.size / encrypt_seconds,
+        "decrypt_throughput": args.size / decrypt_seconds
+    }, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+def _add_stream_argument(parser: argparse.ArgumentParser):
+    """Add the options shared by the commands that stream data."""
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="bytes read and processed at once")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes that work on the chunks")
+
+
+def main(argv=None) -> int:
+    """Run one command and return the exit code."""
+    parser = argparse.ArgumentParser(prog="python -m src")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    keygen = commands.add_parser("keygen", help="generate a random key")
+    keygen.add_argument("--side-length", type=int, required=True)
+    keygen.add_argument("--length", type=int, default=DEFAULT_KEY_LENGTH)
+    keygen.add_argument("--output", default="-")
+    keygen.set_defaults(function=_keygen)
+
+    encrypt = commands.add_parser("encrypt", help="encrypt a file")
+    encrypt.add_argument("--key", required=True, help="the key file")
+    encrypt.add_argument(
+        "--side-length", type=int, help="check the key is for this length"
+    )
+    encrypt.add_argument("--input", default="-")
+    encrypt.add_argument("--output", default="-")
+    encrypt.add_argument("--codec", choices=CODECS, default="none",
+                         help="compress the input before encrypting it")
+    _add_stream_argument(parser=encrypt)
+    encrypt.set_defaults(function=_encrypt)
+
+    decrypt = commands.add_parser("decrypt", help="decrypt a file")
+    decrypt.add_argument("--key", required=True, help="the key file")
+    decrypt.add_argument("--input", default="-")
+    decrypt.add_argument("--output", default="-")
+    _add_stream_argument(parser=decrypt)
+    decrypt.set_defaults(function=_decrypt)
+
+    append = commands.add_parser("append", help="append to a container")
+    append.add_argument("--key", required=True, help="the key file")
+    append.add_argument(
+        "--side-length", type=int, help="check the key is for this length"
+    )
+    append.add_argument("--input", default="-")
+    append.add_argument("--output", required=True, help="the container")
+    _add_stream_argument(parser=append)
+    append.set_defaults(function=_append)
+
+    bench = commands.add_parser("bench", help="measure the throughput")
+    bench.add_argument("--side-length", type=int, default=4)
+    bench.add_argument("--length", type=int, default=DEFAULT_KEY_LENGTH)
+    bench.add_argument("--size", type=int, default=DEFAULT_CHUNK_SIZE,
+                       help="bytes of random data to encrypt")
+    _add_stream_argument(parser=bench)
+    bench.set_defaults(function=_bench)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.function(args)
+    except (AssertionError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
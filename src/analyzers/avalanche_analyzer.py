@@ -0,0 +1,73 @@
+"""Defines the avalanche analyzer of the bit encryption."""
+
+from typing import List
+
+import numpy as np
+
+from src.engine.linear import compile_linear_map, get_dependency_count
+from src.engine.permutation import get_cube_size
+from src.helper.constant import Key
+
+
+class AvalancheAnalyzer:
+    """Check how many output bits change when one input bit is flipped."""
+
+    def __init__(self, key: List[Key], cube_side_length: int):
+        """Compile the encryption under the key into a linear map.
+
+        Since the encryption is linear over GF(2), flipping input bit j
+        flips exactly the output bits whose rows depend on input bit j, no
+        matter what the other input bits are.
+
+        :param key: The key to be analyzing.
+        :param cube_side_length: The length of the cube desired to be analyzed.
+        """
+        # Store the cube size and the compiled linear map.
+        self._cube_size = get_cube_size(cube_side_length=cube_side_length)
+        self._linear_map = compile_linear_map(
+            key=key, cube_side_length=cube_side_length
+        )
+
+    def get_flip_count(self) -> np.ndarray:
+        """Get the number of output bits flipped by flipping each input bit.
+
+        :return: An array with one count per input bit.
+        """
+        return get_dependency_count(linear_map=self._linear_map, axis=0)
+
+    def get_dependency_count(self) -> np.ndarray:
+        """Get the number of input bits that each output bit depends on.
+
+        :return: An array with one count per output bit.
+        """
+        return get_dependency_count(linear_map=self._linear_map, axis=1)
+
+    def get_avalanche_matrix(self) -> np.ndarray:
+        """Get which output bits flip when each input bit is flipped.
+
+        :return: A boolean array where [i, j] is True if flipping input bit i
+            flips output bit j.
+        """
+        return np.unpackbits(self._linear_map, axis=1).T.astype(bool)
+
+    def get_summary(self) -> dict:
+        """Summarize the avalanche profile of the key.
+
+        :return: The flip counts summary, where the ideal flip ratio of each
+            input bit is 0.5 under the strict avalanche criterion.
+        """
+        flip_count = self.get_flip_count()
+        dependency_count = self.get_dependency_count()
+        flip_ratio = flip_count / self._cube_size
+
+        return {
+            "mean_flip": float(flip_count.mean()),
+            "min_flip": int(flip_count.min()),
+            "max_flip": int(flip_count.max()),
+            "mean_flip_ratio": float(flip_ratio.mean()),
+            "avalanche_deviation": float(np.abs(flip_ratio - 0.5).mean()),
+            "min_dependency": int(dependency_count.min()),
+            "full_dependency_ratio": float(
+                np.mean(dependency_count == self._cube_size)
+            )
+        }
@@ -1,9 +1,16 @@
 """Check how many bits of input will be changed."""
 
-from typing import List
+from typing import List, Optional, Union
+
+import numpy as np
 
 from src.encbit.cube import Cube
-from src.helper.constant import Key
+from src.engine.batch import encrypt_states
+from src.helper.constant import CUBIE_LENGTH, Key, WRONG_CUBE_INPUT, \
+    WRONG_SAMPLE_SIZE
+
+# Bits of many inputs, as an array with one row or one string per input.
+BitRows = Union[np.ndarray, List[str]]
 
 
 def analyze_bit(key: List[Key],
@@ -34,3 +41,100 @@ def analyze_bit(key: List[Key],
         "0": cube.content.count("0"),
         "1": cube.content.count("1")
     }
+
+
+def _to_bit_array(bits: BitRows, bit_length: int) -> np.ndarray:
+    """Convert binary strings, or an array of bits, to a 2-D bit array.
+
+    :param bits: A list of binary strings or an array of zeros and ones.
+    :param bit_length: The number of bits each sample should hold.
+    :return: An array with one sample per row.
+    """
+    # Convert the strings to arrays of bits.
+    if not isinstance(bits, np.ndarray):
+        # Error check. Each sample should hold the desired number of bits.
+        assert all(len(each) == bit_length for each in bits), \
+            WRONG_CUBE_INPUT
+        bits = np.frombuffer(
+            "".join(bits).encode(), dtype=np.uint8
+        ).reshape(len(bits), bit_length) - ord("0")
+
+    # Error check. Each sample should hold the desired number of bits.
+    bits = np.asarray(bits, dtype=np.uint8)
+    assert bits.ndim == 2 and bits.shape[1] == bit_length, WRONG_CUBE_INPUT
+    return bits
+
+
+def analyze_bit_batch(key: List[Key],
+                      side_length: int,
+                      message_bits: Optional[BitRows] = None,
+                      random_bits: Optional[BitRows] = None,
+                      sample_size: Optional[int] = None,
+                      batch_size: int = 4096,
+                      seed: Optional[int] = None) -> dict:
+    """Count the zeros and ones in the encrypted result of many inputs.
+
+    Any input that is not given is generated uniformly at random, in which
+    case the sample size is required.
+
+    :param key: The desired key to use.
+    :param side_length: Desired length of the Rubik's Cube.
+    :param message_bits: Bits for the actual messages, one sample per row.
+    :param random_bits: Bits for the randomness, one sample per row.
+    :param sample_size: Number of samples to generate.
+    :param batch_size: Number of samples encrypted together at a time.
+    :param seed: Seed of the random generator for the generated inputs.
+    :return: Number of zeros and ones per sample and the summary of ones.
+    """
+    # Find the size of message and random parts in each cube.
+    random_size = side_length ** 2 * CUBIE_LENGTH
+    message_size = random_size * 5
+
+    # Convert the given inputs, or generate the missing ones.
+    generator = np.random.default_rng(seed)
+    if message_bits is not None:
+        message_bits = _to_bit_array(message_bits, message_size)
+        sample_size = len(message_bits)
+    if random_bits is not None:
+        random_bits = _to_bit_array(random_bits, random_size)
+        sample_size = len(random_bits)
+    assert sample_size is not None and sample_size > 0, WRONG_SAMPLE_SIZE
+    if message_bits is None:
+        message_bits = generator.integers(
+            0, 2, size=(sample_size, message_size), dtype=np.uint8
+        )
+    if random_bits is None:
+        random_bits = generator.integers(
+            0, 2, size=(sample_size, random_size), dtype=np.uint8
+        )
+
+    # Error check. Both inputs should hold the same number of samples.
+    assert len(message_bits) == len(random_bits), WRONG_CUBE_INPUT
+
+    # Encrypt the samples batch by batch and count the ones.
+    ones = np.concatenate([
+        encrypt_states(
+            states=np.concatenate([
+                message_bits[start: start + batch_size],
+                random_bits[start: start + batch_size]
+            ], axis=1),
+            key=key,
+            cube_side_length=side_length
+        ).sum(axis=1, dtype=np.int64)
+        for start in range(0, sample_size, batch_size)
+    ])
+    zeros = message_size + random_size - ones
+
+    # Summarize the number of ones over all samples.
+    return {
+        "0": zeros,
+        "1": ones,
+        "summary": {
+            "sample_size": sample_size,
+            "mean": float(ones.mean()),
+            "std": float(ones.std()),
+            "min": int(ones.min()),
+            "max": int(ones.max()),
+            "bias": float(ones.mean() / (message_size + random_size) - 0.5)
+        }
+    }
@@ -0,0 +1,215 @@
+"""Defines the analyzer of the cycle structure of the key permutations."""
+
+import math
+from collections import Counter
+from typing import List
+
+import numpy as np
+
+from src.engine.permutation import compose_permutation, \
+    get_content_shift_permutation, get_cube_size, get_key_permutation
+from src.engine.prefix_cache import PrefixCache
+from src.helper.constant import CUBE_MOVE, Key, WRONG_CUBE_INDEX, \
+    WRONG_SAMPLE_SIZE
+
+
+def get_cycle_label(permutations: np.ndarray) -> np.ndarray:
+    """Label each position with the smallest position on its cycle.
+
+    Each round takes the smallest label among the positions reached so far
+    and doubles the number of steps looked ahead, so the labels settle after
+    a number of rounds logarithmic in the permutation size.
+
+    :param permutations: An array with one permutation per row.
+    :return: An array of the same shape holding the labels.
+    """
+    permutations = np.atleast_2d(permutations)
+    size = permutations.shape[-1]
+
+    # Gather within each row through the flat array, which is faster.
+    offset = np.arange(len(permutations))[:, None] * size
+    label = np.array(permutations)
+    jump = permutations + offset
+    for _ in range(max(1, math.ceil(math.log2(size)))):
+        label = np.minimum(label, label.ravel()[jump])
+        jump = jump.ravel()[jump]
+    return np.minimum(label, np.arange(size))
+
+
+def get_cycle_length(permutations: np.ndarray) -> np.ndarray:
+    """Get the length of the cycle each position is on.
+
+    :param permutations: An array with one permutation per row.
+    :return: An array of the same shape holding the cycle lengths.
+    """
+    label = get_cycle_label(permutations=permutations)
+
+    # Count the positions sharing each label within each row.
+    size = permutations.shape[-1]
+    flat_label = label + np.arange(len(label))[:, None] * size
+    count = np.bincount(flat_label.ravel(), minlength=label.size)
+    return count[flat_label]
+
+
+class CycleAnalyzer:
+    """Decompose the permutations of keys into cycles."""
+
+    def __init__(self,
+                 cube_side_length: int,
+                 item: bool = False,
+                 with_shift: bool = False):
+        """Prepare the permutation of every single key.
+
+        :param cube_side_length: The length of the cube desired to be analyzed.
+        :param item: If True, use the layout of the cube that holds items.
+        :param with_shift: If True, shift the content before each key, as the
+            encryption does, otherwise only the moves are analyzed.
+        """
+        # Store the cube information.
+        self._side_length = cube_side_length
+        self._max_index = math.floor(cube_side_length / 2)
+        self._item = item
+        self._with_shift = with_shift
+        self._cube_size = get_cube_size(
+            cube_side_length=cube_side_length, item=item
+        )
+
+        # Stack the permutation of each move, quarter turns and index.
+        self._table = np.stack([
+            self._get_step_permutation(
+                key=Key(move=move, angle=quarter * 90, index=index)
+            )
+            for move in CUBE_MOVE
+            for quarter in range(4)
+            for index in range(1, self._max_index + 1)
+        ])
+
+        # Keys analyzed one at a time share the states of their prefixes.
+        self._cache = PrefixCache(
+            cube_side_length=cube_side_length,
+            item=item,
+            with_shift=with_shift
+        )
+
+    def _get_step_permutation(self, key: Key) -> np.ndarray:
+        """Get the permutation of one key, with the shift if asked to."""
+        permutation = get_key_permutation(
+            key=key, cube_side_length=self._side_length, item=self._item
+        )
+        if self._with_shift:
+            permutation = compose_permutation(
+                get_content_shift_permutation(cube_size=self._cube_size),
+                permutation
+            )
+        return permutation
+
+    def compile(self, key: List[Key]) -> np.ndarray:
+        """Combine the steps of a key into one permutation.
+
+        :param key: A list of keys.
+        :return: The read-only permutation of performing the whole key.
+        """
+        return self._cache.compile(key=key)
+
+    def analyze(self, key: List[Key]) -> dict:
+        """Get the cycle structure of the permutation of a key.
+
+        :param key: A list of keys.
+        :return: A dictionary with the order, which is the number of times
+            the key is repeated before the cube returns to where it started,
+            the number of fixed points, the number of cycles and a histogram
+            from each cycle length to the number of cycles of that length.
+        """
+        length = get_cycle_length(permutations=self.compile(key=key))[0]
+
+        # A cycle of length l is counted once for each of its l positions.
+        histogram = {
+            int(cycle_length): count // int(cycle_length)
+            for cycle_length, count in sorted(Counter(length.tolist()).items())
+        }
+        return {
+            "order": math.lcm(*histogram),
+            "fixed_points": histogram.get(1, 0),
+            "cycle_count": sum(histogram.values()),
+            "cycle_length": histogram
+        }
+
+    def compile_batch(self, key_array: np.ndarray) -> np.ndarray:
+        """Combine the steps of many keys of the same length at once.
+
+        :param key_array: An array of shape (B, L, 3) holding move code,
+            angle and index of L keys for each of B keys.
+        :return: An array with the permutation of each of the B keys.
+        """
+        key_array = np.asarray(key_array, dtype=np.int64).reshape(
+            len(key_array), -1, 3
+        )
+        move, angle, index = np.moveaxis(key_array, -1, 0)
+
+        # Error check. The index should be within the cube.
+        assert np.all((index >= 1) & (index <= self._max_index)), \
+            WRONG_CUBE_INDEX
+
+        # Find where the permutation of each key starts in the flat table.
+        start = (
+            (move * 4 + angle // 90 % 4) * self._max_index + index - 1
+        ) * self._cube_size
+
+        # Compose from the last key backwards, so each step is one lookup
+        # into the small table instead of a gather of whole permutations.
+        permutations = np.broadcast_to(
+            np.arange(self._cube_size), (len(key_array), self._cube_size)
+        )
+        table = self._table.ravel()
+        for step in reversed(range(key_array.shape[1])):
+            permutations = table[start[:, step, None] + permutations]
+        return np.array(permutations)
+
+    def _screen_chunk(self, key_array: np.ndarray, max_order: int):
+        """Get the capped order and the fixed points of a chunk of keys."""
+        length = get_cycle_length(
+            permutations=self.compile_batch(key_array=key_array)
+        )
+
+        # Take the common multiple one position at a time, capping it early
+        # so it never grows past the int64 range.
+        order = np.ones(len(length), dtype=np.int64)
+        for column in length.T:
+            order = np.minimum(np.lcm(order, column), max_order + 1)
+        return order, (length == 1).sum(axis=1)
+
+    def screen(self,
+               key_array: np.ndarray,
+               max_order: int,
+               chunk_size: int = 1024) -> dict:
+        """Find the keys whose permutation has a short order.
+
+        :param key_array: An array of shape (B, L, 3) holding move code,
+            angle and index of L keys for each of B keys.
+        :param max_order: The largest order regarded as weak.
+        :param chunk_size: Number of keys analyzed at once, small enough for
+            the permutations to stay in the cache.
+        :return: A dictionary with the order of each key, where orders above
+            max_order are reported as max_order + 1, the number of fixed
+            points of each key and a mask of the weak keys.
+        """
+        # Error check. There should be at least one key per chunk.
+        assert chunk_size > 0, WRONG_SAMPLE_SIZE
+
+        order, fixed_points = [], []
+        for start in range(0, len(key_array), chunk_size):
+            chunk_order, chunk_fixed_points = self._screen_chunk(
+                key_array=key_array[start: start + chunk_size],
+                max_order=max_order
+            )
+            order.append(chunk_order)
+            fixed_points.append(chunk_fixed_points)
+        order = np.concatenate(order or [np.zeros(0, dtype=np.int64)])
+
+        return {
+            "order": order,
+            "fixed_points": np.concatenate(
+                fixed_points or [np.zeros(0, dtype=np.int64)]
+            ),
+            "weak": order <= max_order
+        }
@@ -1,12 +1,151 @@
 """Defines the CubieItem location analyzer."""
 
 import math
-from typing import List
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
 
-from src.encbit.cube import Cube
+import numpy as np
+
+from src.engine.permutation import BIT_FACE_ORDER, get_key_permutation, \
+    invert_permutation, ITEM_FACE_ORDER
 from src.helper.constant import CUBE_MOVE, Key, MOVE_ANGLE
 
 
+@lru_cache(maxsize=None)
+def _get_report_order(cube_side_length: int) -> np.ndarray:
+    """Map each content position to the location reported for it.
+
+    Cube.get_tracked_location counts the locations with the faces in the
+    order top, front, right, back, left, down, while the content holds the
+    down face before the back and left faces.
+
+    :param cube_side_length: The side length of the cube.
+    :return: The reported location of each content position.
+    """
+    face_size = cube_side_length ** 2 * 4
+    report = np.concatenate([
+        np.arange(face_size) + ITEM_FACE_ORDER.index(face) * face_size
+        for face in BIT_FACE_ORDER
+    ])
+    report.setflags(write=False)
+    return report
+
+
+@lru_cache(maxsize=None)
+def get_destination_table(
+        cube_side_length: int) -> Tuple[Tuple[Key, ...], np.ndarray]:
+    """Get where each tracked location goes under every key, without shift.
+
+    :param cube_side_length: The side length of the cube.
+    :return: All keys with any angle, and an array where [k, p] is the
+        location of the item tracked at p after performing key k.
+    """
+    keys = tuple(
+        Key(move=move, angle=angle, index=index)
+        for move in CUBE_MOVE
+        for index in range(1, math.floor(cube_side_length / 2) + 1)
+        for angle in MOVE_ANGLE
+    )
+    report = _get_report_order(cube_side_length=cube_side_length)
+
+    # The item at content position p moves to the inverse permutation of p.
+    table = np.stack([
+        report[invert_permutation(get_key_permutation(
+            key=key, cube_side_length=cube_side_length
+        ))]
+        for key in keys
+    ])
+    table.setflags(write=False)
+    return keys, table
+
+
+@lru_cache(maxsize=None)
+def get_location_table(
+        cube_side_length: int) -> Tuple[Tuple[Key, ...], np.ndarray]:
+    """Get where each tracked location goes under every key, with shift.
+
+    :param cube_side_length: The side length of the cube.
+    :return: All keys with any angle, and an array where [k, p] is the
+        location of the item tracked at p after performing key k and
+        shifting the content.
+    """
+    keys, table = get_destination_table(cube_side_length=cube_side_length)
+    report = _get_report_order(cube_side_length=cube_side_length)
+
+    # Shifting the content marks the location after the reported one.
+    table = report[(table + 1) % len(report)]
+    table.setflags(write=False)
+    return keys, table
+
+
+@lru_cache(maxsize=None)
+def _get_key_row(cube_side_length: int) -> Dict[Key, int]:
+    """Map each key to its row in the location tables."""
+    keys = get_destination_table(cube_side_length=cube_side_length)[0]
+    return {key: row for row, key in enumerate(keys)}
+
+
+def _get_destination(cube_side_length: int, key: Key, position):
+    """Get the location of items right after performing a key.
+
+    :param cube_side_length: The side length of the cube.
+    :param key: Any key on the cube.
+    :param position: Content positions of the items, as an int or array.
+    :return: The location of the items, before shifting the content.
+    """
+    # A key that turns a full circle leaves the items where they are.
+    if key.angle % 360 == 0:
+        return _get_report_order(cube_side_length=cube_side_length)[position]
+
+    table = get_destination_table(cube_side_length=cube_side_length)[1]
+    return table[
+        _get_key_row(cube_side_length=cube_side_length)[
+            key._replace(angle=key.angle % 360)
+        ],
+        position
+    ]
+
+
+def iter_location(cube_side_length: int,
+                  track_item_locations: Iterable[int],
+                  keys: Iterable[Key]) -> Iterator[np.ndarray]:
+    """Track the locations of many items one key at a time.
+
+    :param cube_side_length: The side length of the cube.
+    :param track_item_locations: Locations of the items of interest.
+    :param keys: The cube movements, which may also be a generator.
+    :return: A generator of the locations of all items, starting with the
+        locations before any movement.
+    """
+    report = _get_report_order(cube_side_length=cube_side_length)
+
+    # Keep the marked positions in the content and report each step.
+    position = np.array(list(track_item_locations), dtype=np.int64)
+    yield position.copy()
+    for key in keys:
+        position = (_get_destination(
+            cube_side_length=cube_side_length, key=key, position=position
+        ) + 1) % len(report)
+        yield report[position]
+
+
+def track_location(cube_side_length: int,
+                   track_item_locations: Iterable[int],
+                   keys: Iterable[Key]) -> np.ndarray:
+    """Track the locations of many items when moves are performed.
+
+    :param cube_side_length: The side length of the cube.
+    :param track_item_locations: Locations of the items of interest.
+    :param keys: The cube movements.
+    :return: An array with one row per step and one column per item.
+    """
+    return np.stack(list(iter_location(
+        cube_side_length=cube_side_length,
+        track_item_locations=track_item_locations,
+        keys=keys
+    )))
+
+
 class CubieLocationAnalyzer:
     """Create the location analyzer based on the location to keep track of."""
 
@@ -40,16 +179,11 @@ class CubieLocationAnalyzer:
         :param key: The possible key that moves the location.
         :return: If the key actually moves the item. (Not Equal = True)
         """
-        # Make a new copy of the cube.
-        temp_cube = Cube(
-            cube_input="_" * self._cube_size,
+        return bool(_get_destination(
             cube_side_length=self._side_length,
-            track_location=self._track_item_location
-        )
-        # Perform the desired shift.
-        temp_cube.shift(key=key)
-        # Return True if the location is changed.
-        return temp_cube.get_tracked_location() != self._track_item_location
+            key=key,
+            position=self._track_item_location
+        ) != self._track_item_location)
 
     def _get_effective_key(self) -> List[Key]:
         """Get all the keys that move the tracked item with fixed 90 degrees.
@@ -78,18 +212,12 @@ class CubieLocationAnalyzer:
         :param key: One known effective key.
         :return: New location of the tracked item.
         """
-        # Make a new copy of the cube.
-        temp_cube = Cube(
-            cube_input="_" * self._cube_size,
+        report = _get_report_order(cube_side_length=self._side_length)
+        return int(report[(_get_destination(
             cube_side_length=self._side_length,
-            track_location=self._track_item_location
-        )
-        # Perform the desired shift and shift the src.
-        temp_cube.shift(key=key)
-        temp_cube.shift_cubie_content()
-
-        # Return the new location of the tracked item.
-        return temp_cube.get_tracked_location()
+            key=key,
+            position=self._track_item_location
+        ) + 1) % self._cube_size])
 
     def get_all_location(self) -> List[int]:
         """Get all possible locations of the tracked item.
@@ -101,30 +229,14 @@ class CubieLocationAnalyzer:
             for key in self._get_all_effective_key()
         ]
 
-    @staticmethod
-    def _get_location_after_key(key: Key, cube: Cube) -> int:
-        """Perform a move on the cube and find the tracked bit.
-
-        :param key: Indicate the movement on the cube.
-        :param cube: The cube object.
-        :return: The new location of the tracked bit.
-        """
-        cube.shift(key=key)
-        cube.shift_cubie_content()
-        return cube.get_tracked_location()
-
     def location_tracker(self, keys: List[Key]) -> List[int]:
         """Track the position of a specific bit when moves are performed.
 
         :param keys: A list of cube movements.
         :return: A list of integers which each represent a location.
         """
-        cube = Cube(
-            cube_input="_" * self._cube_size,
+        return track_location(
             cube_side_length=self._side_length,
-            track_location=self._track_item_location
-        )
-
-        return [self._track_item_location] + [
-            self._get_location_after_key(key=key, cube=cube) for key in keys
-        ]
+            track_item_locations=[self._track_item_location],
+            keys=keys
+        )[:, 0].tolist()
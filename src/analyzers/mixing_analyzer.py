@@ -0,0 +1,125 @@
+"""Defines the analyzer of how fast a tracked bit spreads over the cube."""
+
+import math
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from src.engine.permutation import compose_permutation, \
+    get_content_shift_permutation, get_cube_size, get_key_permutation
+from src.helper.constant import CUBE_MOVE, Key, MOVE_ANGLE
+
+# Default distance to the uniform distribution regarded as mixed.
+MIXING_DISTANCE = 0.25
+
+
+class MixingAnalyzer:
+    """Follow the distribution of a tracked bit under random keys."""
+
+    def __init__(self, cube_side_length: int):
+        """Build the transition of a tracked bit under one encryption step.
+
+        One step shifts the content and then performs a key picked uniformly
+        at random, the same way as generate_random_keys picks each key. The
+        transition matrix is kept as a stack of permutations, one per key,
+        so each row of the matrix has at most one entry per key and each
+        matrix-vector product is one gather per key.
+
+        :param cube_side_length: The length of the cube desired to be analyzed.
+        """
+        # Store the total cube size.
+        self._cube_size = get_cube_size(cube_side_length=cube_side_length)
+
+        # Combine the content shift with every possible key.
+        shift = get_content_shift_permutation(cube_size=self._cube_size)
+        self._transition = np.stack([
+            compose_permutation(shift, get_key_permutation(
+                key=Key(move=move, angle=angle, index=index),
+                cube_side_length=cube_side_length
+            ))
+            for move in CUBE_MOVE
+            for angle in MOVE_ANGLE
+            for index in range(1, math.floor(cube_side_length / 2) + 1)
+        ])
+
+    def _get_start(self, locations: Iterable[int]) -> np.ndarray:
+        """Put all probability of each tracked bit on its location."""
+        locations = list(locations)
+        distribution = np.zeros((self._cube_size, len(locations)))
+        distribution[locations, np.arange(len(locations))] = 1
+        return distribution
+
+    def _step(self, distribution: np.ndarray) -> np.ndarray:
+        """Advance the distributions by one encryption step.
+
+        :param distribution: An array with one column per tracked bit.
+        :return: The distributions after the step.
+        """
+        # The bit at position permutation[p] moves to p under a permutation.
+        result = np.zeros_like(distribution)
+        for permutation in self._transition:
+            result += distribution[permutation]
+        return result / len(self._transition)
+
+    def _get_distance(self, distribution: np.ndarray) -> float:
+        """Get the largest total variation distance to uniform."""
+        return float(
+            np.abs(distribution - 1 / self._cube_size).sum(axis=0).max() / 2
+        )
+
+    def get_distance(self,
+                     step: int,
+                     locations: Iterable[int] = (0,)) -> List[float]:
+        """Get the distance to uniform after each number of steps.
+
+        :param step: Number of steps to follow the tracked bits.
+        :param locations: The content positions the tracked bits start from.
+        :return: The largest total variation distance over the tracked bits
+            to the uniform distribution, for each step.
+        """
+        distribution = self._get_start(locations=locations)
+
+        distance = []
+        for _ in range(step):
+            distribution = self._step(distribution=distribution)
+            distance.append(self._get_distance(distribution=distribution))
+        return distance
+
+    def get_mixing_time(self,
+                        locations: Iterable[int] = (0,),
+                        distance: float = MIXING_DISTANCE,
+                        max_step: int = 10000) -> int:
+        """Get the number of steps until the tracked bits are mixed.
+
+        :param locations: The content positions the tracked bits start from.
+        :param distance: The total variation distance regarded as mixed.
+        :param max_step: Number of steps to give up after.
+        :return: The first step where every tracked bit is within the
+            distance to uniform, or -1 if it is not reached in max_step.
+        """
+        distribution = self._get_start(locations=locations)
+
+        for step in range(1, max_step + 1):
+            distribution = self._step(distribution=distribution)
+            if self._get_distance(distribution=distribution) <= distance:
+                return step
+        return -1
+
+
+def recommend_key_length(side_lengths: Iterable[int] = range(2, 21),
+                         locations: Iterable[int] = (0,),
+                         distance: float = MIXING_DISTANCE) -> Dict[int, int]:
+    """Recommend a key length for each side length by its mixing time.
+
+    :param side_lengths: The side lengths of the cubes to analyze.
+    :param locations: The content positions the tracked bits start from.
+    :param distance: The total variation distance regarded as mixed.
+    :return: A dictionary from each side length to the recommended length.
+    """
+    locations = list(locations)
+    return {
+        side_length: MixingAnalyzer(
+            cube_side_length=side_length
+        ).get_mixing_time(locations=locations, distance=distance)
+        for side_length in side_lengths
+    }
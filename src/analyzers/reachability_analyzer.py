@@ -0,0 +1,102 @@
+"""Defines the analyzer of how far a tracked item can spread over steps."""
+
+from typing import Iterable, List
+
+import numpy as np
+
+from src.analyzers.location_analyzer import get_destination_table, \
+    get_location_table
+from src.engine.permutation import get_cube_size
+
+
+class ReachabilityAnalyzer:
+    """Expand the set of locations an item can reach, one step at a time."""
+
+    def __init__(self, cube_side_length: int):
+        """Build the move transition graph of the cube.
+
+        The neighbors of a location are the same as the result of
+        CubieLocationAnalyzer.get_all_location for that location, they are
+        stored as a table with one row per key plus one row for the content
+        shift, where a key that does not move the item points to the content
+        shift neighbor instead.
+
+        :param cube_side_length: The length of the cube desired to be analyzed.
+        """
+        # Store the total cube size.
+        self._cube_size = get_cube_size(cube_side_length=cube_side_length)
+
+        # Get where each location goes under each key.
+        keys, destination_table = get_destination_table(
+            cube_side_length=cube_side_length
+        )
+        location_table = get_location_table(
+            cube_side_length=cube_side_length
+        )[1]
+        shift_location = (np.arange(self._cube_size) + 1) % self._cube_size
+
+        # A key is effective if the same move by 90 degrees moves the item.
+        basic_row = [
+            keys.index(key._replace(angle=90)) for key in keys
+        ]
+        effective = destination_table[basic_row] != np.arange(self._cube_size)
+
+        # Stack the content shift with the effective key locations.
+        self._neighbor_table = np.vstack([
+            shift_location,
+            np.where(effective, location_table, shift_location)
+        ])
+
+    def get_neighbor(self, location: int) -> List[int]:
+        """Get all locations an item can reach in one step.
+
+        :param location: The location of the item.
+        :return: A sorted list of the distinct locations.
+        """
+        return np.unique(self._neighbor_table[:, location]).tolist()
+
+    def expand(self, locations: Iterable[int], step: int) -> List[np.ndarray]:
+        """Find the locations reachable in exactly each number of steps.
+
+        :param locations: The locations the items start from.
+        :param step: Number of steps to expand.
+        :return: A boolean mask of the reachable locations for each step.
+        """
+        # Start with the frontier holding the starting locations.
+        frontier = np.zeros(self._cube_size, dtype=bool)
+        frontier[list(locations)] = True
+
+        masks = []
+        for _ in range(step):
+            # Mark every neighbor of every location in the frontier.
+            next_frontier = np.zeros(self._cube_size, dtype=bool)
+            next_frontier[
+                self._neighbor_table[:, np.flatnonzero(frontier)]
+            ] = True
+            masks.append(next_frontier)
+            frontier = next_frontier
+        return masks
+
+    def get_reachable_size(self,
+                           locations: Iterable[int],
+                           step: int,
+                           cumulative: bool = False) -> List[int]:
+        """Count the locations reachable after each number of steps.
+
+        :param locations: The locations the items start from.
+        :param step: Number of steps to expand.
+        :param cumulative: If True, count the locations reachable within the
+            steps, including the starting locations, instead of in exactly the
+            steps.
+        :return: The number of reachable locations for each step.
+        """
+        locations = list(locations)
+        masks = self.expand(locations=locations, step=step)
+
+        # Accumulate the reached locations when asked to.
+        if cumulative:
+            start = np.zeros(self._cube_size, dtype=bool)
+            start[locations] = True
+            masks = np.logical_or.accumulate([start] + masks)[1:]
+
+        return [int(mask.sum()) for mask in masks]
@@ -7,6 +7,7 @@ from src.encbit.face import Face
 from src.helper.constant import CubeMove, CUBIE_LENGTH, CubieItem, Key, \
     WRONG_CUBE_INPUT, WRONG_CUBE_MOVE, \
     WRONG_CUBE_SIDE_LENGTH
+from src.helper.metrics import timed
 from src.helper.utility import xor
 
 
@@ -148,6 +149,7 @@ class Cube:
         # If no location was found, throw a value error.
         raise ValueError("No Tracked Location")
 
+    @timed("shift_content", engine="encbit", backend="pandas")
     def shift_cubie_content(self):
         """Shift the cube binary representation to right by one bit."""
         # Get the shifted src by padding the last bit to the first.
@@ -164,6 +166,7 @@ class Cube:
             cube_side_length=self._side_length
         )
 
+    @timed("shift_content_back", engine="encbit", backend="pandas")
     def shift_cubie_content_back(self):
         """Shift the cube binary representation to the left by one bit."""
         # Get the shifted src by padding the first bit to the last.
@@ -180,6 +183,10 @@ class Cube:
             track_location=track_location
         )
 
+    # The shared cube engine interface names the content shift this way.
+    shift_content = shift_cubie_content
+    shift_content_back = shift_cubie_content_back
+
     def _shift_t(self, index: int):
         """Shift the top layer with the index clockwise by 90 degrees.
 
@@ -401,6 +408,7 @@ class Cube:
         )
         self._down_face.fill_col(col_name=f"L{index}", input_list=temp_col)
 
+    @timed("shift", engine="encbit", backend="pandas")
     def shift(self, key: Key):
         """Shift the cube with a move in a certain number of angles.
 
@@ -437,6 +445,7 @@ class Cube:
         else:
             raise ValueError(WRONG_CUBE_MOVE)
 
+    @timed("xor", engine="encbit", backend="pandas")
     def xor(self):
         """Xor the random face with each other faces."""
         # Find the xor result and use it as the new src to initiate class.
@@ -1,35 +1,50 @@
 """Defines the encryption protocol for encrypting bits."""
 
+from __future__ import annotations
+
 import math
 import random
 from collections import deque
-from typing import List
-
-import numpy as np
+from typing import List, Optional, TYPE_CHECKING
 
-from src.encbit.cube import Cube
+from src.engine.backend import get_backend
 from src.helper.constant import CUBIE_LENGTH, Key
+from src.helper.metrics import count_processed
 from src.helper.utility import binary_to_string, string_to_binary
 
+# Only the batch functions need NumPy, so they import it.
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class Encryption:
     """Perform encryption and decryption of the input."""
 
-    def __init__(self, message: str, cube_side_length: int):
+    def __init__(self,
+                 message: str,
+                 cube_side_length: int,
+                 backend: Optional[str] = None):
         """Put the message into a cube and create a queue to hold keys.
 
         :param message: The message to encrypt.
         :param cube_side_length: The desired length of cube side.
+        :param backend: Name of the cube backend, or None for the default.
         """
         # Store the important information for another method to access.
         self._message = message
         self._max_index = math.floor(cube_side_length / 2)
         self._random_size = cube_side_length ** 2 * CUBIE_LENGTH
         self._message_size = cube_side_length ** 2 * 5 * CUBIE_LENGTH
+        self._cube_byte_size = cube_side_length ** 2 * 6 * CUBIE_LENGTH // 8
 
-        # Get the cubes.
+        # Get the cubes from the backend.
+        get_cube = get_backend(name=backend)
         self._cubes = [
-            Cube(cube_input=input_str, cube_side_length=cube_side_length)
+            get_cube(
+                cube_input=input_str,
+                cube_side_length=cube_side_length,
+                item=False
+            )
             for input_str in self._get_binary_to_encrypt
         ]
 
@@ -56,15 +71,18 @@ class Encryption:
         cube_required = int(len(binary_str_padded) / self._message_size)
 
         # Split the binary into the number of cubes required.
-        binary_chunks = np.array_split(
-            ary=list(binary_str_padded), indices_or_sections=cube_required
-        )
+        binary_chunks = [
+            binary_str_padded[start: start + self._message_size]
+            for start in range(
+                0, cube_required * self._message_size, self._message_size
+            )
+        ]
 
         random_bits = [self._get_random_str for _ in range(cube_required)]
 
         # Return input for each cube.
         return [
-            "".join(binary) + random_bits[index]
+            binary + random_bits[index]
             for index, binary in enumerate(binary_chunks)
         ]
 
@@ -107,6 +125,14 @@ class Encryption:
 
         :param key: A list of keys used for encryption.
         """
+        # Count the processed cubes and bytes.
+        count_processed(
+            cube_count=len(self._cubes),
+            byte_count=len(self._cubes) * self._cube_byte_size,
+            engine="encbit",
+            operation="encrypt"
+        )
+
         # Loop through all the keys.
         for each_key in key:
             # Shift all the cubes.
@@ -114,7 +140,7 @@ class Encryption:
                 # Xor cube.
                 cube.xor()
                 # Shuffle bits.
-                cube.shift_cubie_content()
+                cube.shift_content()
                 # Shift cube.
                 cube.shift(key=each_key)
             # Append the used key to a key list.
@@ -122,6 +148,14 @@ class Encryption:
 
     def decrypt(self):
         """Decrypt the message to plain text."""
+        # Count the processed cubes and bytes.
+        count_processed(
+            cube_count=len(self._cubes),
+            byte_count=len(self._cubes) * self._cube_byte_size,
+            engine="encbit",
+            operation="decrypt"
+        )
+
         while self._key:
             # Pop the key from saved keys.
             each_key = self._key.pop()
@@ -135,7 +169,7 @@ class Encryption:
                     )
                 )
                 # Shift src backward by one space.
-                cube.shift_cubie_content_back()
+                cube.shift_content_back()
                 # Xor the cube.
                 cube.xor()
 
@@ -153,3 +187,117 @@ class Encryption:
 
         # Convert the un-pad binary to a string and return it.
         return binary_to_string(up_pad_binary)
+
+
+def _bits_to_str(bits: np.ndarray) -> str:
+    """Format an array of bits as a binary string."""
+    return (bits + ord("0")).astype("uint8").tobytes().decode()
+
+
+def _str_to_bits(binary: str) -> np.ndarray:
+    """Read a binary string as an array of bits."""
+    import numpy as np
+
+    return np.frombuffer(binary.encode(), dtype=np.uint8) - ord("0")
+
+
+def encrypt_many(messages: List[str],
+                 key: List[Key],
+                 cube_side_length: int) -> List[str]:
+    """Encrypt many messages with the same key in one batch of cubes.
+
+    Each message is padded to its own cubes the same way as in Encryption,
+    then the cubes of all messages are encrypted together and split back.
+
+    :param messages: The messages to encrypt.
+    :param key: A list of keys used for encryption.
+    :param cube_side_length: The desired length of cube side.
+    :return: The encrypted binary of each message, the same as what
+        get_current_binary returns after encrypting the message alone.
+    """
+    # Nothing to encrypt, so skip building an empty batch.
+    if not messages:
+        return []
+
+    import numpy as np
+
+    from src.engine.batch import encrypt_states
+
+    message_size = cube_side_length ** 2 * 5 * CUBIE_LENGTH
+    random_size = cube_side_length ** 2 * CUBIE_LENGTH
+
+    # Pad every message and find how many cubes each one fills.
+    binaries = [
+        Encryption._pad_binary_str(
+            input_string=string_to_binary(message), block_size=message_size
+        )
+        for message in messages
+    ]
+    cube_counts = [len(binary) // message_size for binary in binaries]
+
+    # Fill the message faces and the random face of all cubes at once.
+    message_bits = _str_to_bits("".join(binaries)).reshape(-1, message_size)
+    random_bits = np.random.default_rng().integers(
+        0, 2, size=(len(message_bits), random_size), dtype=np.uint8
+    )
+    count_processed(
+        cube_count=len(message_bits),
+        byte_count=len(message_bits) * (message_size + random_size) // 8,
+        engine="encbit",
+        operation="encrypt_many"
+    )
+
+    # Encrypt the whole batch and split it back per message.
+    states = encrypt_states(
+        states=np.hstack([message_bits, random_bits]),
+        key=key,
+        cube_side_length=cube_side_length
+    )
+    return [
+        _bits_to_str(cubes.ravel())
+        for cubes in np.split(states, np.cumsum(cube_counts)[:-1])
+    ]
+
+
+def decrypt_many(binaries: List[str],
+                 key: List[Key],
+                 cube_side_length: int) -> List[str]:
+    """Decrypt many messages encrypted with the same key in one batch.
+
+    :param binaries: The encrypted binary of each message.
+    :param key: The list of keys used for encryption.
+    :param cube_side_length: The desired length of cube side.
+    :return: The original messages.
+    """
+    # Nothing to decrypt, so skip building an empty batch.
+    if not binaries:
+        return []
+
+    import numpy as np
+
+    from src.engine.batch import decrypt_states
+
+    cube_size = cube_side_length ** 2 * 6 * CUBIE_LENGTH
+    message_size = cube_side_length ** 2 * 5 * CUBIE_LENGTH
+    cube_counts = [len(binary) // cube_size for binary in binaries]
+    count_processed(
+        cube_count=sum(cube_counts),
+        byte_count=sum(cube_counts) * cube_size // 8,
+        engine="encbit",
+        operation="decrypt_many"
+    )
+
+    # Decrypt the cubes of all messages at once.
+    states = decrypt_states(
+        states=_str_to_bits("".join(binaries)).reshape(-1, cube_size),
+        key=key,
+        cube_side_length=cube_side_length
+    )
+
+    # Un-pad the message faces of each message and convert them back.
+    return [
+        binary_to_string(_bits_to_str(cubes.ravel()).rstrip("0")[:-1])
+        for cubes in np.split(
+            states[:, :message_size], np.cumsum(cube_counts)[:-1]
+        )
+    ]
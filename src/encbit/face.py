@@ -1,22 +1,29 @@
 """Define contents and operations of one cube face that contains bits."""
 
+from __future__ import annotations
+
 import itertools
 import math
 from collections import deque
-from typing import List
+from typing import List, TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
 
 from src.encbit.cubie import Cubie
 from src.helper.constant import CUBIE_LENGTH, CubieItem, \
     WRONG_CUBE_FACE_INPUT, WRONG_FRAME_COLUMN_NAME, WRONG_FRAME_INDEX_NAME, \
     WRONG_SIDE_LENGTH
+from src.helper.metrics import timed
+from src.helper.utility import load_pandas
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class Face:
     """Create a cube face with the desired side length on inputs."""
 
+    @timed("face_init", engine="encbit")
     def __init__(self,
                  cube_face_input: List[CubieItem],
                  cube_side_length: int):
@@ -44,7 +51,7 @@ class Face:
         ]
 
         # Fill in the cube face matrix with the cubies.
-        self._face_cubie_frame = pd.DataFrame(
+        self._face_cubie_frame = load_pandas().DataFrame(
             data=np.array_split(
                 ary=face_input_cubie_list,
                 indices_or_sections=cube_side_length
@@ -178,7 +185,7 @@ class Face:
 
         # Rotate the face itself.
         self._face_cubie_frame.update(
-            pd.DataFrame(
+            load_pandas().DataFrame(
                 data=np.rot90(
                     self._face_cubie_frame.values, int(4 - angle / 90)
                 ),
@@ -7,6 +7,7 @@ import numpy as np
 from src.encitem.face import Face
 from src.helper.constant import CubeMove, Key, WRONG_CUBE_INPUT, \
     WRONG_CUBE_MOVE, WRONG_CUBE_SIDE_LENGTH
+from src.helper.metrics import timed
 
 
 class Cube:
@@ -69,6 +70,7 @@ class Cube:
             self._right_face.get_item_list + self._back_face.get_item_list + \
             self._left_face.get_item_list + self._down_face.get_item_list
 
+    @timed("shift_content", engine="encitem", backend="pandas")
     def shift_content(self):
         """Shift the cube binary representation to right by one item."""
         # Get the shifted src by padding the last bit to the first.
@@ -78,6 +80,7 @@ class Cube:
             cube_input=shifted_content, cube_side_length=self._side_length
         )
 
+    @timed("shift_content_back", engine="encitem", backend="pandas")
     def shift_content_back(self):
         """Shift the cube binary representation to the left by one item."""
         # Get the shifted src by padding the first bit to the last.
@@ -258,6 +261,7 @@ class Cube:
         )
         self._down_face.fill_col(col_name=f"L{index}", input_list=temp_col)
 
+    @timed("shift", engine="encitem", backend="pandas")
     def shift(self, key: Key):
         """Shift the cube with a move in a certain number of angles.
 
@@ -3,28 +3,32 @@
 import random
 import string
 from collections import deque
-from typing import List
+from typing import List, Optional
 
-import numpy as np
-
-from src.encitem.cube import Cube
+from src.engine.backend import get_backend
 from src.helper.constant import Key
+from src.helper.metrics import count_processed
 
 
 class Encryption:
     """Perform encryption and decryption of the input."""
 
-    def __init__(self, message: str, cube_side_length: int):
+    def __init__(self,
+                 message: str,
+                 cube_side_length: int,
+                 backend: Optional[str] = None):
         """Put the message into a cube and create a queue to hold keys.
 
         :param message: The message to encrypt.
         :param cube_side_length: The desired length of cube side.
+        :param backend: Name of the cube backend, or None for the default.
         """
         # Remove blanks and punctuations.
         message = self.process_string(message=message)
 
         # Store the important information for another method to access.
         chunk_size = cube_side_length ** 2 * 6
+        self._chunk_size = chunk_size
         self.pad_size = chunk_size - len(message) % chunk_size
 
         # Make sure that the message is all lowercase and pad it.
@@ -33,16 +37,18 @@ class Encryption:
         )
 
         # Split the message into chunks that fits in the cube.
-        messages = np.array_split(
-            ary=list(message),
-            indices_or_sections=int(len(message) / chunk_size)
-        )
+        messages = [
+            list(message[start: start + chunk_size])
+            for start in range(0, len(message), chunk_size)
+        ]
 
-        # Get the cubes.
+        # Get the cubes from the backend.
+        get_cube = get_backend(name=backend)
         self._cubes = [
-            Cube(
-                cube_input=message.tolist(),
-                cube_side_length=cube_side_length
+            get_cube(
+                cube_input=message,
+                cube_side_length=cube_side_length,
+                item=True
             )
             for message in messages
         ]
@@ -66,6 +72,14 @@ class Encryption:
 
         :param key: A list of keys used for encryption.
         """
+        # Count the processed cubes and items, each item is one byte.
+        count_processed(
+            cube_count=len(self._cubes),
+            byte_count=len(self._cubes) * self._chunk_size,
+            engine="encitem",
+            operation="encrypt"
+        )
+
         # Loop through all the keys.
         for each_key in key:
             # Shift all the cubes.
@@ -79,6 +93,14 @@ class Encryption:
 
     def decrypt(self):
         """Decrypt the message to plain text."""
+        # Count the processed cubes and items, each item is one byte.
+        count_processed(
+            cube_count=len(self._cubes),
+            byte_count=len(self._cubes) * self._chunk_size,
+            engine="encitem",
+            operation="decrypt"
+        )
+
         # While there are still keys, keep running.
         while self._key:
             # Pop the key from saved keys.
@@ -1,16 +1,25 @@
 """Define contents and operations of one cube face that contains items."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import numpy as np
-import pandas as pd
 
 from src.helper.constant import WRONG_CUBE_FACE_INPUT, \
     WRONG_FRAME_COLUMN_NAME, WRONG_FRAME_INDEX_NAME, WRONG_SIDE_LENGTH
-from src.helper.utility import get_frame_column, get_frame_index
+from src.helper.metrics import timed
+from src.helper.utility import get_frame_column, get_frame_index, \
+    load_pandas
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class Face:
     """Create a cube face with the required side length on inputs."""
 
+    @timed("face_init", engine="encitem")
     def __init__(self, face_input: list, side_length: int):
         """Initialize one cube face.
 
@@ -24,7 +33,7 @@ class Face:
         self._side_length = side_length
 
         # Fill in the cube face matrix with the cubies.
-        self._face_item_frame = pd.DataFrame(
+        self._face_item_frame = load_pandas().DataFrame(
             data=np.array_split(
                 ary=face_input,
                 indices_or_sections=side_length
@@ -72,7 +81,7 @@ class Face:
         """Rotate the cube face by the desired angle."""
         # Rotate the face itself.
         self._face_item_frame.update(
-            pd.DataFrame(
+            load_pandas().DataFrame(
                 data=np.rot90(
                     self._face_item_frame.values, int(4 - angle / 90)
                 ),
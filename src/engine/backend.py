@@ -0,0 +1,158 @@
+"""Define the registry of interchangeable cube engines.
+
+Both encryption protocols only need a few operations of a cube, so any
+class providing them can hold the content of the cubes. A backend is a
+function that builds such a cube, registered under a name:
+
+    - pandas: the reference cubes of src.encbit and src.encitem
+    - numpy: the flat array cube of src.engine.numpy_cube
+    - numba: the flat array cube with moves compiled by Numba, registered
+      only when Numba is installed
+    - stdlib: the cube of src.engine.stdlib_cube, which only needs the
+      standard library
+
+The encryption classes take the name of a backend, and otherwise use the
+default one, which the environment variable CUBECRYPTO_BACKEND may set
+before the first import. Without it, the default is the fastest backend
+installed: numba, then numpy, then stdlib. None of them imports pandas, so
+the reference cubes are only loaded when asked for by name.
+"""
+
+import os
+from importlib.util import find_spec
+from typing import Callable, Dict, List, Optional, Protocol, Union
+
+from src.helper.constant import Key, WRONG_BACKEND
+
+
+class CubeEngine(Protocol):
+    """Define the operations the encryption protocols perform on a cube."""
+
+    @property
+    def content(self) -> Union[str, list]:
+        """Get the content as a binary string, or a list of items."""
+
+    @property
+    def message_content(self) -> str:
+        """Get the bits on the faces that hold a message, for cubes of bits."""
+
+    def shift(self, key: Key):
+        """Shift the cube with a move in a certain number of angles."""
+
+    def shift_content(self):
+        """Shift the content to the right by one position."""
+
+    def shift_content_back(self):
+        """Shift the content to the left by one position."""
+
+    def xor(self):
+        """Xor the random face with each other face, for cubes of bits."""
+
+
+# A backend builds a cube from the input, the side length and whether the
+# cube holds items instead of bits.
+Backend = Callable[[Union[str, list], int, bool], CubeEngine]
+
+# The registered backends by name.
+BACKENDS: Dict[str, Backend] = {}
+
+
+def register_backend(name: str, backend: Backend):
+    """Register a backend under a name, replacing any with the same name.
+
+    :param name: Name to select the backend by.
+    :param backend: A function that takes the cube input, the side length
+        and whether the cube holds items, and returns the cube.
+    """
+    BACKENDS[name] = backend
+
+
+def get_backend_names() -> List[str]:
+    """Get the names of the registered backends."""
+    return list(BACKENDS)
+
+
+def get_backend(name: Optional[str] = None) -> Backend:
+    """Get a registered backend.
+
+    :param name: Name of the backend, or None for the default one.
+    :return: The function that builds the cubes.
+    """
+    name = DEFAULT_BACKEND if name is None else name
+
+    # Error check. The backend should be registered.
+    if name not in BACKENDS:
+        raise ValueError(WRONG_BACKEND)
+    return BACKENDS[name]
+
+
+def get_metric_labels(cube: CubeEngine) -> Dict[str, str]:
+    """Get the labels of the timings of a cube built by a backend.
+
+    :param cube: A cube with the item and backend attributes.
+    :return: The protocol the cube serves and the backend it belongs to.
+    """
+    return {
+        "engine": "encitem" if cube.item else "encbit",
+        "backend": cube.backend
+    }
+
+
+def _get_pandas_cube(cube_input: Union[str, list],
+                     cube_side_length: int,
+                     item: bool) -> CubeEngine:
+    """Build one of the reference cubes, importing it on first use."""
+    if item:
+        from src.encitem.cube import Cube
+    else:
+        from src.encbit.cube import Cube
+    return Cube(cube_input=cube_input, cube_side_length=cube_side_length)
+
+
+def _get_numpy_cube(cube_input: Union[str, list],
+                    cube_side_length: int,
+                    item: bool) -> CubeEngine:
+    """Build a cube that keeps its content in one flat array."""
+    from src.engine.numpy_cube import NumpyCube
+
+    return NumpyCube(
+        cube_input=cube_input, cube_side_length=cube_side_length, item=item
+    )
+
+
+def _get_stdlib_cube(cube_input: Union[str, list],
+                     cube_side_length: int,
+                     item: bool) -> CubeEngine:
+    """Build a cube that only needs the standard library."""
+    from src.engine.stdlib_cube import StdlibCube
+
+    return StdlibCube(
+        cube_input=cube_input, cube_side_length=cube_side_length, item=item
+    )
+
+
+def _get_numba_cube(cube_input: Union[str, list],
+                    cube_side_length: int,
+                    item: bool) -> CubeEngine:
+    """Build a flat array cube whose moves are compiled by Numba."""
+    from src.engine.numba_cube import NumbaCube
+
+    return NumbaCube(
+        cube_input=cube_input, cube_side_length=cube_side_length, item=item
+    )
+
+
+register_backend(name="pandas", backend=_get_pandas_cube)
+register_backend(name="numpy", backend=_get_numpy_cube)
+register_backend(name="stdlib", backend=_get_stdlib_cube)
+# The numba cube is built on the numpy one, so it needs both installed.
+if find_spec("numpy") is not None and find_spec("numba") is not None:
+    register_backend(name="numba", backend=_get_numba_cube)
+
+# The backend used when none is given.
+DEFAULT_BACKEND = os.environ.get(
+    "CUBECRYPTO_BACKEND",
+    "numba" if "numba" in BACKENDS
+    else "numpy" if find_spec("numpy") is not None
+    else "stdlib"
+)
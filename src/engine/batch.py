@@ -0,0 +1,304 @@
+"""Define the encryption steps over a batch of cubes held as NumPy arrays.
+
+A batch is a 2-D array where each row is the content of one cube, laid out
+in the same order as the content of the cube classes, and each value is one
+bit. Every step of the encryption is a gather or an XOR over the whole
+batch at once. Internally the batch is transposed so that each position of
+the cube is one contiguous row, which keeps both steps on contiguous memory.
+
+When every cube has its own key, the batch is kept one cube per row instead,
+and each step gathers every row with the permutation of its own key.
+"""
+
+import math
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+from src.engine.permutation import compose_permutation, \
+    get_content_shift_permutation, get_cube_size, get_key_permutation
+from src.helper.constant import CUBE_MOVE, CUBIE_LENGTH, Key, \
+    WRONG_CUBE_INDEX, WRONG_CUBE_INPUT, WRONG_KEY_COUNT
+from src.helper.key_codec import keys_to_array
+
+# Number of cubes with their own keys that are run through the steps at once.
+ROW_CHUNK_SIZE = 1024
+
+
+def _xor_random_face(positions: np.ndarray, cube_side_length: int):
+    """Xor the random face with each other face of a transposed batch.
+
+    :param positions: The transposed batch, which is updated in place.
+    :param cube_side_length: The side length of the cubes.
+    """
+    # Find where the random face starts.
+    random_start = cube_side_length ** 2 * 5 * CUBIE_LENGTH
+
+    # Xor the five message faces with the random face.
+    message = positions[:random_start].reshape(
+        5, random_start // 5, *positions.shape[1:]
+    )
+    message ^= positions[random_start:]
+
+
+def xor_random_face(states: np.ndarray, cube_side_length: int) -> np.ndarray:
+    """Xor the random face with each other face of every cube.
+
+    :param states: The batch of cube contents.
+    :param cube_side_length: The side length of the cubes.
+    :return: The batch after the XOR step.
+    """
+    positions = np.array(states.T, order="C")
+    _xor_random_face(positions=positions, cube_side_length=cube_side_length)
+    return np.ascontiguousarray(positions.T)
+
+
+def encrypt_positions(positions: np.ndarray,
+                      key: List[Key],
+                      cube_side_length: int) -> np.ndarray:
+    """Encrypt a transposed batch, where each row is one cube position.
+
+    The steps only move rows and XOR them together, so each row may hold
+    any integer type, for example bits of many cubes packed into bytes.
+
+    :param positions: The transposed batch, which may be updated in place.
+    :param key: A list of keys used for encryption.
+    :param cube_side_length: The side length of the cubes.
+    :return: The encrypted transposed batch.
+    """
+    # Error check. There should be one row per position of the cube.
+    assert len(positions) == get_cube_size(cube_side_length), \
+        WRONG_CUBE_INPUT
+
+    shift = get_content_shift_permutation(cube_size=len(positions))
+    for each_key in key:
+        # Xor cube, then shuffle bits and shift cube with one gather.
+        _xor_random_face(
+            positions=positions, cube_side_length=cube_side_length
+        )
+        positions = positions[compose_permutation(shift, get_key_permutation(
+            key=each_key, cube_side_length=cube_side_length
+        ))]
+    return positions
+
+
+def decrypt_positions(positions: np.ndarray,
+                      key: List[Key],
+                      cube_side_length: int) -> np.ndarray:
+    """Decrypt a transposed batch, where each row is one cube position.
+
+    :param positions: The transposed batch, which may be updated in place.
+    :param key: The list of keys used for encryption.
+    :param cube_side_length: The side length of the cubes.
+    :return: The decrypted transposed batch.
+    """
+    # Error check. There should be one row per position of the cube.
+    assert len(positions) == get_cube_size(cube_side_length), \
+        WRONG_CUBE_INPUT
+
+    shift_back = get_content_shift_permutation(
+        cube_size=len(positions), step=-1
+    )
+    for each_key in reversed(key):
+        # Reverse the cube shift move and shift bits back with one gather.
+        positions = positions[compose_permutation(get_key_permutation(
+            key=each_key._replace(angle=360 - each_key.angle % 360),
+            cube_side_length=cube_side_length
+        ), shift_back)]
+        # Xor the cube.
+        _xor_random_face(
+            positions=positions, cube_side_length=cube_side_length
+        )
+    return positions
+
+
+def encrypt_states(states: np.ndarray,
+                   key: List[Key],
+                   cube_side_length: int) -> np.ndarray:
+    """Encrypt a batch of cube contents based on a given key.
+
+    :param states: The batch of cube contents.
+    :param key: A list of keys used for encryption.
+    :param cube_side_length: The side length of the cubes.
+    :return: The encrypted batch.
+    """
+    return np.ascontiguousarray(encrypt_positions(
+        positions=np.array(states.T, order="C"),
+        key=key,
+        cube_side_length=cube_side_length
+    ).T)
+
+
+def decrypt_states(states: np.ndarray,
+                   key: List[Key],
+                   cube_side_length: int) -> np.ndarray:
+    """Decrypt a batch of cube contents that was encrypted with the key.
+
+    :param states: The batch of encrypted cube contents.
+    :param key: The list of keys used for encryption.
+    :param cube_side_length: The side length of the cubes.
+    :return: The decrypted batch.
+    """
+    return np.ascontiguousarray(decrypt_positions(
+        positions=np.array(states.T, order="C"),
+        key=key,
+        cube_side_length=cube_side_length
+    ).T)
+
+
+def get_key_batch(keys: List[List[Key]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Pad keys of different lengths to one array.
+
+    :param keys: One list of keys for each cube.
+    :return: An array of shape (N, L, 3) holding move code, angle and index
+        of the keys, padded with identity moves, and a mask of shape (N, L)
+        that is False where a key was padded.
+    """
+    length = max([len(key) for key in keys], default=0)
+    key_array = np.tile(
+        np.array([0, 0, 1], dtype=np.int64), (len(keys), length, 1)
+    )
+    active = np.zeros((len(keys), length), dtype=bool)
+    for row, key in enumerate(keys):
+        if key:
+            key_array[row, :len(key)] = keys_to_array(key=key)
+            active[row, :len(key)] = True
+    return key_array, active
+
+
+@lru_cache(maxsize=None)
+def _get_step_table(cube_side_length: int, decrypt: bool) -> np.ndarray:
+    """Stack the permutation of one encryption or decryption step per key.
+
+    The rows follow the move code, then the quarter turns, then the index,
+    and one last row holds the identity for the padded steps.
+    """
+    cube_size = get_cube_size(cube_side_length=cube_side_length)
+    table = np.stack([
+        compose_permutation(get_key_permutation(
+            key=Key(move=move, angle=(4 - quarter) % 4 * 90, index=index),
+            cube_side_length=cube_side_length
+        ), get_content_shift_permutation(cube_size=cube_size, step=-1))
+        if decrypt else
+        compose_permutation(
+            get_content_shift_permutation(cube_size=cube_size),
+            get_key_permutation(
+                key=Key(move=move, angle=quarter * 90, index=index),
+                cube_side_length=cube_side_length
+            )
+        )
+        for move in CUBE_MOVE
+        for quarter in range(4)
+        for index in range(1, math.floor(cube_side_length / 2) + 1)
+    ] + [np.arange(cube_size)])
+    table.setflags(write=False)
+    return table
+
+
+def _get_step_row(key_array: np.ndarray,
+                  active: np.ndarray,
+                  cube_side_length: int) -> np.ndarray:
+    """Find the row of the step table for each key of each cube."""
+    max_index = math.floor(cube_side_length / 2)
+    move, angle, index = np.moveaxis(key_array, -1, 0)
+
+    # Error check. The index should be within the cube.
+    assert np.all(~active | ((index >= 1) & (index <= max_index))), \
+        WRONG_CUBE_INDEX
+
+    row = (move * 4 + angle // 90 % 4) * max_index + index - 1
+    return np.where(active, row, len(CUBE_MOVE) * 4 * max_index)
+
+
+def _xor_active(states: np.ndarray,
+                active: np.ndarray,
+                cube_side_length: int):
+    """Xor the random face with each other face of the active cubes.
+
+    :param states: The batch of cube contents, which is updated in place.
+    :param active: A mask of the cubes to XOR.
+    :param cube_side_length: The side length of the cubes.
+    """
+    random_start = cube_side_length ** 2 * 5 * CUBIE_LENGTH
+    message = states[:, :random_start].reshape(len(states), 5, -1)
+    message ^= (states[:, random_start:] * active[:, None])[:, None]
+
+
+def _run_by_row(states: np.ndarray,
+                row: np.ndarray,
+                active: np.ndarray,
+                cube_side_length: int,
+                decrypt: bool) -> np.ndarray:
+    """Run the steps of every cube with its own permutation per step."""
+    table = _get_step_table(cube_side_length=cube_side_length, decrypt=decrypt)
+    steps = range(row.shape[1])
+
+    # Each cube gathers through the flat chunk, whose indices stay small
+    # enough to be kept in the cache.
+    result = np.empty_like(states)
+    for start in range(0, len(states), ROW_CHUNK_SIZE):
+        chunk = np.array(states[start: start + ROW_CHUNK_SIZE])
+        offset = np.arange(len(chunk))[:, None] * chunk.shape[1]
+        for step in reversed(steps) if decrypt else steps:
+            chunk_row = row[start: start + ROW_CHUNK_SIZE, step]
+            chunk_active = active[start: start + ROW_CHUNK_SIZE, step]
+            if not decrypt:
+                _xor_active(chunk, chunk_active, cube_side_length)
+            chunk = chunk.ravel()[table[chunk_row] + offset]
+            if decrypt:
+                _xor_active(chunk, chunk_active, cube_side_length)
+        result[start: start + ROW_CHUNK_SIZE] = chunk
+    return result
+
+
+def encrypt_states_by_row(states: np.ndarray,
+                          key_array: np.ndarray,
+                          active: np.ndarray,
+                          cube_side_length: int) -> np.ndarray:
+    """Encrypt a batch where every cube has its own key.
+
+    :param states: The batch of cube contents.
+    :param key_array: The padded keys from get_key_batch.
+    :param active: The mask of the steps that were not padded.
+    :param cube_side_length: The side length of the cubes.
+    :return: The encrypted batch.
+    """
+    # Error check. There should be one key per cube.
+    assert states.shape[1] == get_cube_size(cube_side_length), \
+        WRONG_CUBE_INPUT
+    assert len(key_array) == len(states), WRONG_KEY_COUNT
+
+    return _run_by_row(
+        states=states,
+        row=_get_step_row(key_array, active, cube_side_length),
+        active=active,
+        cube_side_length=cube_side_length,
+        decrypt=False
+    )
+
+
+def decrypt_states_by_row(states: np.ndarray,
+                          key_array: np.ndarray,
+                          active: np.ndarray,
+                          cube_side_length: int) -> np.ndarray:
+    """Decrypt a batch where every cube has its own key.
+
+    :param states: The batch of encrypted cube contents.
+    :param key_array: The padded keys from get_key_batch.
+    :param active: The mask of the steps that were not padded.
+    :param cube_side_length: The side length of the cubes.
+    :return: The decrypted batch.
+    """
+    # Error check. There should be one key per cube.
+    assert states.shape[1] == get_cube_size(cube_side_length), \
+        WRONG_CUBE_INPUT
+    assert len(key_array) == len(states), WRONG_KEY_COUNT
+
+    return _run_by_row(
+        states=states,
+        row=_get_step_row(key_array, active, cube_side_length),
+        active=active,
+        cube_side_length=cube_side_length,
+        decrypt=True
+    )
@@ -0,0 +1,178 @@
+"""Define the cube moves as a replay on faces of any representation.
+
+Each move reads and writes whole rows and columns of the faces, turning the
+cubies it writes and, for an outer layer, the whole face. The replay only
+talks to the faces through the Face protocol, so the NumPy permutations of
+src.engine.permutation and the tuples of src.engine.stdlib_cube follow the
+same move logic, and this module needs nothing beyond the standard library.
+"""
+
+import math
+from typing import Dict, Protocol, Sequence
+
+from src.helper.constant import CubeMove, CUBIE_LENGTH, WRONG_CUBE_INDEX, \
+    WRONG_CUBE_MOVE, WRONG_CUBE_SIDE_LENGTH
+
+# The order in which the faces are stored in the content of each cube.
+BIT_FACE_ORDER = ("top", "front", "right", "down", "back", "left")
+ITEM_FACE_ORDER = ("top", "front", "right", "back", "left", "down")
+
+
+def get_cube_size(cube_side_length: int, item: bool = False) -> int:
+    """Get the length of the content of one cube.
+
+    :param cube_side_length: The side length of the cube.
+    :param item: If True, the cube holds one item per cubie.
+    :return: The length of the cube content.
+    """
+    return cube_side_length ** 2 * 6 * (1 if item else CUBIE_LENGTH)
+
+
+class Face(Protocol):
+    """Define the operations the moves perform on one face."""
+
+    def get_row(self, row: int) -> Sequence:
+        """Get a copy of the cubies of one row."""
+
+    def get_col(self, col: int) -> Sequence:
+        """Get a copy of the cubies of one column."""
+
+    def set_row(self, row: int, cubies: Sequence, angle: int = 0):
+        """Replace one row, turning each cubie by the angle."""
+
+    def set_col(self, col: int, cubies: Sequence, angle: int = 0):
+        """Replace one column, turning each cubie by the angle."""
+
+    def rotate(self):
+        """Rotate the face and its cubies clockwise by 90 degrees."""
+
+
+def _get_outer_position(max_index: int, index: int) -> int:
+    """Get the row position of T{index}, which is also the column of L{index}.
+
+    The row D{index} and the column R{index} are mirrored from this position,
+    so they are found by counting the same number of positions from the end.
+    """
+    return max_index - index
+
+
+def _shift_t(faces: Dict[str, Face], index: int, max_index: int):
+    """Shift the top layer with the index clockwise by 90 degrees."""
+    if index == max_index:
+        faces["top"].rotate()
+    row = _get_outer_position(max_index, index)
+
+    # back -> right -> front -> left -> back
+    temp_row = faces["left"].get_row(row)
+    faces["left"].set_row(row, faces["front"].get_row(row))
+    faces["front"].set_row(row, faces["right"].get_row(row))
+    faces["right"].set_row(row, faces["back"].get_row(row))
+    faces["back"].set_row(row, temp_row)
+
+
+def _shift_d(faces: Dict[str, Face], index: int, max_index: int):
+    """Shift the down layer with the index clockwise by 90 degrees."""
+    if index == max_index:
+        faces["down"].rotate()
+    row = -1 - _get_outer_position(max_index, index)
+
+    # back -> left -> front -> right -> back
+    temp_row = faces["left"].get_row(row)
+    faces["left"].set_row(row, faces["back"].get_row(row))
+    faces["back"].set_row(row, faces["right"].get_row(row))
+    faces["right"].set_row(row, faces["front"].get_row(row))
+    faces["front"].set_row(row, temp_row)
+
+
+def _shift_f(faces: Dict[str, Face], index: int, max_index: int):
+    """Shift the front layer with the index clockwise by 90 degrees."""
+    if index == max_index:
+        faces["front"].rotate()
+    outer = _get_outer_position(max_index, index)
+
+    # top -> right -> down -> left -> top
+    temp_row = faces["top"].get_row(-1 - outer)
+    faces["top"].set_row(
+        -1 - outer, faces["left"].get_col(-1 - outer)[::-1], 90
+    )
+    faces["left"].set_col(-1 - outer, faces["down"].get_row(outer), 90)
+    faces["down"].set_row(outer, faces["right"].get_col(outer)[::-1], 90)
+    faces["right"].set_col(outer, temp_row, 90)
+
+
+def _shift_b(faces: Dict[str, Face], index: int, max_index: int):
+    """Shift the back layer with the index clockwise by 90 degrees."""
+    if index == max_index:
+        faces["back"].rotate()
+    outer = _get_outer_position(max_index, index)
+
+    # top -> left -> down -> right -> top
+    temp_row = faces["top"].get_row(outer)
+    faces["top"].set_row(outer, faces["right"].get_col(-1 - outer), 270)
+    faces["right"].set_col(
+        -1 - outer, faces["down"].get_row(-1 - outer)[::-1], 270
+    )
+    faces["down"].set_row(-1 - outer, faces["left"].get_col(outer), 270)
+    faces["left"].set_col(outer, temp_row[::-1], 270)
+
+
+def _shift_r(faces: Dict[str, Face], index: int, max_index: int):
+    """Shift the right layer with the index clockwise by 90 degrees."""
+    if index == max_index:
+        faces["right"].rotate()
+    col = -1 - _get_outer_position(max_index, index)
+    back_col = _get_outer_position(max_index, index)
+
+    # top -> back -> down -> front -> top
+    temp_col = faces["front"].get_col(col)
+    faces["front"].set_col(col, faces["down"].get_col(col))
+    faces["down"].set_col(col, faces["back"].get_col(back_col)[::-1], 180)
+    faces["back"].set_col(back_col, faces["top"].get_col(col)[::-1], 180)
+    faces["top"].set_col(col, temp_col)
+
+
+def _shift_l(faces: Dict[str, Face], index: int, max_index: int):
+    """Shift the left layer with the index clockwise by 90 degrees."""
+    if index == max_index:
+        faces["left"].rotate()
+    col = _get_outer_position(max_index, index)
+    back_col = -1 - _get_outer_position(max_index, index)
+
+    # top -> front -> down -> back -> top
+    temp_col = faces["front"].get_col(col)
+    faces["front"].set_col(col, faces["top"].get_col(col))
+    faces["top"].set_col(col, faces["back"].get_col(back_col)[::-1], 180)
+    faces["back"].set_col(back_col, faces["down"].get_col(col)[::-1], 180)
+    faces["down"].set_col(col, temp_col)
+
+
+# Map each legal move to the function that replays it.
+_SHIFT_FUNCTION = {
+    CubeMove.top.value: _shift_t,
+    CubeMove.down.value: _shift_d,
+    CubeMove.front.value: _shift_f,
+    CubeMove.back.value: _shift_b,
+    CubeMove.right.value: _shift_r,
+    CubeMove.left.value: _shift_l
+}
+
+
+def replay_move(faces: Dict[str, Face],
+                move: str,
+                index: int,
+                cube_side_length: int):
+    """Replay one move by 90 degrees on the faces.
+
+    :param faces: The six faces by name, which are changed in place.
+    :param move: Name of the move.
+    :param index: The layer selected for the move.
+    :param cube_side_length: The side length of the cube.
+    """
+    # Error check. The move, index and side length should be legal.
+    if move not in _SHIFT_FUNCTION:
+        raise ValueError(WRONG_CUBE_MOVE)
+    assert cube_side_length > 1, WRONG_CUBE_SIDE_LENGTH
+    max_index = math.floor(cube_side_length / 2)
+    assert 1 <= index <= max_index, WRONG_CUBE_INDEX
+
+    _SHIFT_FUNCTION[move](faces, index, max_index)
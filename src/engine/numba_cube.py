@@ -0,0 +1,67 @@
+"""Define the flat array cube whose moves are compiled by Numba.
+
+Numba is optional, so this module is only imported by the numba backend,
+which is registered when Numba is installed. The cubes holding items keep
+Python objects, which Numba does not compile, so they move as NumpyCube.
+"""
+
+import numba
+import numpy as np
+
+from src.engine.numpy_cube import get_layout_shift, get_layout_slices, \
+    NumpyCube
+from src.helper.constant import Key
+
+
+@numba.njit(cache=True)
+def _move(state: np.ndarray, destination: np.ndarray, source: np.ndarray):
+    """Copy the sources to the destinations in place."""
+    # Read every source first, since a source may also be a destination.
+    value = np.empty(len(source), dtype=state.dtype)
+    for position in range(len(source)):
+        value[position] = state[source[position]]
+    for position in range(len(destination)):
+        state[destination[position]] = value[position]
+
+
+@numba.njit(cache=True)
+def _permute(state: np.ndarray, permutation: np.ndarray) -> np.ndarray:
+    """Gather the state by the permutation into a new array."""
+    result = np.empty_like(state)
+    for position in range(len(permutation)):
+        result[position] = state[permutation[position]]
+    return result
+
+
+class NumbaCube(NumpyCube):
+    """Create a flat array cube whose moves run as compiled loops."""
+
+    # Name of the backend in the labels of the timings.
+    backend = "numba"
+
+    def _shift_key(self, key: Key):
+        """Perform the key on the stored content."""
+        if self._item:
+            super()._shift_key(key=key)
+            return
+
+        destination, source = get_layout_slices(
+            key=key,
+            cube_side_length=self._side_length,
+            item=self._item,
+            layout=self._layout
+        )
+        _move(self._state, destination, source)
+
+    def _shift_state(self, step: int):
+        """Shift the content to the right by the number of positions."""
+        if self._item:
+            super()._shift_state(step=step)
+            return
+
+        self._state = _permute(self._state, get_layout_shift(
+            layout=self._layout,
+            cube_side_length=self._side_length,
+            item=self._item,
+            step=step
+        ))
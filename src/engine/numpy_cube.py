@@ -0,0 +1,348 @@
+"""Define a cube that keeps its whole content in one flat NumPy array.
+
+The cube performs the same steps as the cube classes, each as an in place
+operation on the array. Internally the content may be stored in another
+layout than the content order, and it is converted back whenever the
+content is read or written:
+
+    - row: every face is stored row by row, the same as the content
+    - column: every face is stored column by column, so the columns that
+      the right and left moves turn are contiguous
+
+Both layouts keep each face in its own block and every cubie contiguous, so
+the XOR of the faces is the same for both.
+
+A search over keys can copy the stored array with snapshot and go back to it
+with restore, or keep a history of the steps and undo them one by one, which
+performs the inverse of each step instead of building the cube again.
+"""
+
+from functools import lru_cache
+from typing import Tuple, Union
+
+import numpy as np
+
+from src.engine.backend import get_metric_labels
+from src.engine.permutation import compose_permutation, \
+    get_content_shift_permutation, get_cube_size, get_key_slices, \
+    invert_permutation
+from src.helper.constant import CUBIE_LENGTH, Key, WRONG_CUBE_INPUT, \
+    WRONG_CUBE_ITEM, WRONG_CUBE_LAYOUT, WRONG_CUBE_SIDE_LENGTH, \
+    WRONG_UNDO_COUNT
+from src.helper.metrics import timed
+
+# The layouts a cube may store its content in.
+LAYOUTS = ("row", "column")
+
+
+@lru_cache(maxsize=None)
+def get_layout_permutation(layout: str,
+                           cube_side_length: int,
+                           item: bool = False) -> np.ndarray:
+    """Get the content position stored at each place of the layout.
+
+    :param layout: Name of the layout.
+    :param cube_side_length: The side length of the cube.
+    :param item: If True, the cube holds one item per cubie.
+    :return: A read-only array where the layout at i holds content[array[i]].
+    """
+    # Error check. The layout should be known.
+    if layout not in LAYOUTS:
+        raise ValueError(WRONG_CUBE_LAYOUT)
+
+    positions = np.arange(
+        get_cube_size(cube_side_length=cube_side_length, item=item)
+    ).reshape(
+        6, cube_side_length, cube_side_length, 1 if item else CUBIE_LENGTH
+    )
+    if layout == "column":
+        positions = positions.transpose(0, 2, 1, 3)
+
+    permutation = positions.reshape(-1)
+    permutation.setflags(write=False)
+    return permutation
+
+
+@lru_cache(maxsize=None)
+def _get_layout_inverse(layout: str,
+                        cube_side_length: int,
+                        item: bool) -> np.ndarray:
+    """Get the place in the layout of each content position."""
+    inverse = invert_permutation(get_layout_permutation(
+        layout=layout, cube_side_length=cube_side_length, item=item
+    ))
+    inverse.setflags(write=False)
+    return inverse
+
+
+@lru_cache(maxsize=None)
+def get_layout_slices(key: Key,
+                      cube_side_length: int,
+                      item: bool = False,
+                      layout: str = "row") -> Tuple[np.ndarray, np.ndarray]:
+    """Get the places changed by one key in the layout.
+
+    :param key: A named tuple that holds information for one shift.
+    :param cube_side_length: The side length of the cube.
+    :param item: If True, the cube holds one item per cubie.
+    :param layout: Name of the layout.
+    :return: The changed places and the places they take content from.
+    """
+    destination, source = get_key_slices(
+        key=key, cube_side_length=cube_side_length, item=item
+    )
+    if layout == "row":
+        return destination, source
+
+    # Move both sides of the slices to the layout, in order of destination.
+    inverse = _get_layout_inverse(
+        layout=layout, cube_side_length=cube_side_length, item=item
+    )
+    order = np.argsort(inverse[destination])
+    destination = inverse[destination][order]
+    source = inverse[source][order]
+    destination.setflags(write=False)
+    source.setflags(write=False)
+    return destination, source
+
+
+@lru_cache(maxsize=None)
+def get_layout_shift(layout: str,
+                     cube_side_length: int,
+                     item: bool,
+                     step: int) -> np.ndarray:
+    """Get the content shift as a permutation of the layout.
+
+    :param layout: Name of the layout.
+    :param cube_side_length: The side length of the cube.
+    :param item: If True, the cube holds one item per cubie.
+    :param step: Number of positions to shift the content to the right.
+    :return: A read-only permutation of the stored content.
+    """
+    layout_permutation = get_layout_permutation(
+        layout=layout, cube_side_length=cube_side_length, item=item
+    )
+    permutation = compose_permutation(
+        _get_layout_inverse(
+            layout=layout, cube_side_length=cube_side_length, item=item
+        ),
+        get_content_shift_permutation(
+            cube_size=layout_permutation.size, step=step
+        ),
+        layout_permutation
+    )
+    permutation.setflags(write=False)
+    return permutation
+
+
+class NumpyCube:
+    """Create a cube whose content is held in one flat array."""
+
+    # Name of the backend in the labels of the timings.
+    backend = "numpy"
+
+    def __init__(self,
+                 cube_input: Union[str, list, np.ndarray],
+                 cube_side_length: int,
+                 item: bool = False,
+                 layout: str = "row",
+                 keep_history: bool = False):
+        """Initialize the cube with an input of the desired length.
+
+        :param cube_input: A binary string or an array of bits, or a list of
+            items when the cube holds items.
+        :param cube_side_length: The desired side length of the cube.
+        :param item: If True, the cube holds one item per cubie.
+        :param layout: Name of the layout to store the content in.
+        :param keep_history: If True, remember each step so it can be undone.
+        """
+        # Error check. The side length and the layout should be legal.
+        assert cube_side_length > 1, WRONG_CUBE_SIDE_LENGTH
+        if layout not in LAYOUTS:
+            raise ValueError(WRONG_CUBE_LAYOUT)
+
+        # Save the side length, the kind of content and the layout.
+        self._side_length = cube_side_length
+        self._item = item
+        self._layout = layout
+        self._cube_size = get_cube_size(
+            cube_side_length=cube_side_length, item=item
+        )
+
+        # Store the content in the layout and start an empty history.
+        self._history = [] if keep_history else None
+        self.set_state(state=cube_input)
+
+    @property
+    def side_length(self) -> int:
+        """Get the side length of the cube."""
+        return self._side_length
+
+    @property
+    def item(self) -> bool:
+        """Get whether the cube holds one item per cubie."""
+        return self._item
+
+    @property
+    def layout(self) -> str:
+        """Get the name of the layout the content is stored in."""
+        return self._layout
+
+    def get_state(self) -> np.ndarray:
+        """Get a copy of the content as an array in the content order."""
+        return self._state[_get_layout_inverse(
+            layout=self._layout,
+            cube_side_length=self._side_length,
+            item=self._item
+        )]
+
+    def set_state(self, state: Union[str, list, np.ndarray]):
+        """Replace the content of the cube.
+
+        :param state: The new content in the content order.
+        """
+        # Turn a binary string into an array of bits.
+        if isinstance(state, str) and not self._item:
+            state = np.frombuffer(state.encode(), dtype=np.uint8) - ord("0")
+        state = np.asarray(state)
+
+        # Error check. The input should fill the entire cube.
+        assert state.shape == (self._cube_size,), WRONG_CUBE_INPUT
+
+        self._state = state[get_layout_permutation(
+            layout=self._layout,
+            cube_side_length=self._side_length,
+            item=self._item
+        )]
+        self._clear_history()
+
+    def _clear_history(self):
+        """Forget the steps done so far, if the history is kept."""
+        if self._history is not None:
+            self._history.clear()
+
+    def snapshot(self) -> np.ndarray:
+        """Copy the stored content, in the layout it is stored in.
+
+        :return: A copy that restore takes to return to the current content.
+        """
+        return self._state.copy()
+
+    def restore(self, snapshot: np.ndarray):
+        """Return to the content of a snapshot and forget the history.
+
+        :param snapshot: A copy from the snapshot method of this cube.
+        """
+        # Error check. The snapshot should fill the entire cube.
+        assert snapshot.shape == self._state.shape, WRONG_CUBE_INPUT
+
+        self._state[:] = snapshot
+        self._clear_history()
+
+    @property
+    def content(self) -> Union[str, list]:
+        """Get the content as a binary string, or a list of items."""
+        state = self.get_state()
+        if self._item:
+            return state.tolist()
+        return (state + ord("0")).astype(np.uint8).tobytes().decode()
+
+    @property
+    def message_content(self) -> str:
+        """Get the bits on the faces that hold a message as a string."""
+        assert not self._item, WRONG_CUBE_ITEM
+        return self.content[:self._side_length ** 2 * 5 * CUBIE_LENGTH]
+
+    @property
+    def random_content(self) -> str:
+        """Get the bits on the face that holds random bits as a string."""
+        assert not self._item, WRONG_CUBE_ITEM
+        return self.content[self._side_length ** 2 * 5 * CUBIE_LENGTH:]
+
+    @timed("shift", get_labels=get_metric_labels)
+    def shift(self, key: Key):
+        """Shift the cube with a move in a certain number of angles.
+
+        :param key: A named tuple that holds information for one shift.
+        """
+        self._shift_key(key=key)
+        if self._history is not None:
+            self._history.append(("shift", key))
+
+    def _shift_key(self, key: Key):
+        """Perform the key on the stored content."""
+        destination, source = get_layout_slices(
+            key=key,
+            cube_side_length=self._side_length,
+            item=self._item,
+            layout=self._layout
+        )
+        self._state[destination] = self._state[source]
+
+    def _shift_state(self, step: int):
+        """Shift the content to the right by the number of positions."""
+        self._state = self._state[get_layout_shift(
+            layout=self._layout,
+            cube_side_length=self._side_length,
+            item=self._item,
+            step=step
+        )]
+
+    @timed("shift_content", get_labels=get_metric_labels)
+    def shift_cubie_content(self):
+        """Shift the content to the right by one position."""
+        self._shift_state(step=1)
+        if self._history is not None:
+            self._history.append(("content", 1))
+
+    @timed("shift_content_back", get_labels=get_metric_labels)
+    def shift_cubie_content_back(self):
+        """Shift the content to the left by one position."""
+        self._shift_state(step=-1)
+        if self._history is not None:
+            self._history.append(("content", -1))
+
+    # The cube that holds items names the content shift differently.
+    shift_content = shift_cubie_content
+    shift_content_back = shift_cubie_content_back
+
+    @timed("xor", get_labels=get_metric_labels)
+    def xor(self):
+        """Xor the random face with each other face."""
+        # Error check. Only the cube that holds bits has a random face.
+        assert not self._item, WRONG_CUBE_ITEM
+        self._xor()
+        if self._history is not None:
+            self._history.append(("xor", None))
+
+    def _xor(self):
+        """Xor the stored random face with each other stored face."""
+        # Both layouts store the faces in the same blocks and the same order.
+        random_start = self._side_length ** 2 * 5 * CUBIE_LENGTH
+        message = self._state[:random_start].reshape(5, -1)
+        message ^= self._state[random_start:]
+
+    @property
+    def history_size(self) -> int:
+        """Get the number of steps that can be undone."""
+        return 0 if self._history is None else len(self._history)
+
+    def undo(self, count: int = 1):
+        """Undo the latest steps by performing their inverse.
+
+        :param count: Number of steps to undo.
+        """
+        # Error check. There should be enough steps in the history.
+        assert 0 <= count <= self.history_size, WRONG_UNDO_COUNT
+
+        for _ in range(count):
+            step, value = self._history.pop()
+            if step == "shift":
+                self._shift_key(
+                    key=value._replace(angle=360 - value.angle % 360)
+                )
+            elif step == "content":
+                self._shift_state(step=-value)
+            else:
+                # The XOR step is its own inverse.
+                self._xor()
@@ -0,0 +1,324 @@
+"""Define the cube moves as permutations of a flat cube content.
+
+A permutation here is an integer array where new_content[position] equals
+old_content[permutation[position]], so applying a move to a NumPy content is
+a single gather. The permutations are derived by replaying the moves of
+src.engine.moves on arrays of positions.
+"""
+
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+from src.engine.moves import BIT_FACE_ORDER, get_cube_size, \
+    ITEM_FACE_ORDER, replay_move
+from src.helper.constant import CUBIE_LENGTH, Key
+
+
+def _rotate_cubie(cubies: np.ndarray, angle: int) -> np.ndarray:
+    """Rotate the content of each cubie by the angle, as Cubie does."""
+    return np.roll(cubies, int(angle / 90), axis=-1)
+
+
+class _ArrayFace:
+    """Hold the positions of one face as an array of rows of cubies."""
+
+    def __init__(self, positions: np.ndarray):
+        """Wrap the positions of a face, which are changed in place.
+
+        :param positions: An array of shape (side, side, cubie length).
+        """
+        self._positions = positions
+
+    def __getitem__(self, key) -> np.ndarray:
+        """Get a copy of the positions of the selected rows and columns."""
+        return self._positions[key].copy()
+
+    def __setitem__(self, key, value: np.ndarray):
+        """Replace the positions of the selected rows and columns."""
+        self._positions[key] = value
+
+    def get_row(self, row: int) -> np.ndarray:
+        """Get a copy of the cubies of one row."""
+        return self[row]
+
+    def get_col(self, col: int) -> np.ndarray:
+        """Get a copy of the cubies of one column."""
+        return self[:, col]
+
+    def set_row(self, row: int, cubies: np.ndarray, angle: int = 0):
+        """Replace one row, turning each cubie by the angle."""
+        self[row] = _rotate_cubie(cubies=cubies, angle=angle)
+
+    def set_col(self, col: int, cubies: np.ndarray, angle: int = 0):
+        """Replace one column, turning each cubie by the angle."""
+        self[:, col] = _rotate_cubie(cubies=cubies, angle=angle)
+
+    def rotate(self):
+        """Rotate the face and its cubies by 90 degrees, as Face does."""
+        self[:] = np.rot90(_rotate_cubie(cubies=self[:], angle=90), 3)
+
+
+class _FaceView(_ArrayFace):
+    """Stand in for one face, handing out positions and recording writes.
+
+    The move functions only read rows, columns or the whole face and never
+    read what they wrote before, so handing out the original positions and
+    recording each write gives the move without laying out the whole cube.
+    """
+
+    def __init__(self,
+                 start: int,
+                 cube_side_length: int,
+                 cubie_length: int,
+                 writes: list):
+        """Set where the face starts in the content and where to record.
+
+        :param start: Position of the first item of the face.
+        :param cube_side_length: The side length of the cube.
+        :param cubie_length: Number of items in each cubie.
+        :param writes: A list to append the written and read positions to.
+        """
+        self._start = start
+        self._side_length = cube_side_length
+        self._cubie_length = cubie_length
+        self._writes = writes
+
+    def __getitem__(self, key) -> np.ndarray:
+        """Get the positions of the selected rows and columns."""
+        row_key, col_key = \
+            key if isinstance(key, tuple) else (key, slice(None))
+        rows = np.arange(self._side_length)[row_key]
+        cols = np.arange(self._side_length)[col_key]
+        cubies = np.add.outer(rows * self._side_length, cols)
+        return self._start + np.add.outer(
+            cubies * self._cubie_length, np.arange(self._cubie_length)
+        )
+
+    def __setitem__(self, key, value: np.ndarray):
+        """Record that the selected positions take the given positions."""
+        self._writes.append((self[key].reshape(-1), np.reshape(value, -1)))
+
+
+@lru_cache(maxsize=None)
+def get_move_slices(move: str,
+                    index: int,
+                    cube_side_length: int,
+                    item: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Get only the positions changed by one move by 90 degrees.
+
+    Moving an inner layer changes four rows or columns, so the positions are
+    found without touching the rest of the cube. Moving an outer layer also
+    turns a whole face.
+
+    :param move: Name of the move.
+    :param index: The layer selected for the move.
+    :param cube_side_length: The side length of the cube.
+    :param item: If True, use the layout of the cube that holds items.
+    :return: Two read-only arrays, where after the move the content at each
+        position of the first array is the content before the move at the
+        same place in the second array.
+    """
+    # Replay the move on views of the faces that record the writes.
+    face_order = ITEM_FACE_ORDER if item else BIT_FACE_ORDER
+    cubie_length = 1 if item else CUBIE_LENGTH
+    face_size = cube_side_length ** 2 * cubie_length
+    writes = []
+    replay_move(
+        faces={
+            face: _FaceView(
+                start=face_index * face_size,
+                cube_side_length=cube_side_length,
+                cubie_length=cubie_length,
+                writes=writes
+            )
+            for face_index, face in enumerate(face_order)
+        },
+        move=move,
+        index=index,
+        cube_side_length=cube_side_length
+    )
+
+    # Keep the positions whose content changes, sorted by destination.
+    destination = np.concatenate([written for written, _ in writes])
+    source = np.concatenate([read for _, read in writes])
+    changed = destination != source
+    order = np.argsort(destination[changed])
+    destination = destination[changed][order]
+    source = source[changed][order]
+    destination.setflags(write=False)
+    source.setflags(write=False)
+    return destination, source
+
+
+@lru_cache(maxsize=None)
+def get_key_slices(key: Key,
+                   cube_side_length: int,
+                   item: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Get only the positions changed by one key, with any angle.
+
+    :param key: A named tuple that holds information for one shift.
+    :param cube_side_length: The side length of the cube.
+    :param item: If True, use the layout of the cube that holds items.
+    :return: The changed positions and the positions they take content from.
+    """
+    destination, source = get_move_slices(
+        move=key.move,
+        index=key.index,
+        cube_side_length=cube_side_length,
+        item=item
+    )
+
+    # The move maps the changed positions onto themselves, so turning more
+    # than once is a permutation of the changed positions only.
+    step = np.searchsorted(destination, source)
+    local = np.arange(destination.size)
+    for _ in range(int(key.angle / 90) % 4):
+        local = local[step]
+
+    # Drop the positions that return to where they started.
+    changed = local != np.arange(destination.size)
+    destination = destination[changed]
+    source = destination[local[changed]]
+    source.setflags(write=False)
+    return destination, source
+
+
+def apply_key(content: np.ndarray,
+              key: Key,
+              cube_side_length: int,
+              item: bool = False):
+    """Perform one key on the content in place, touching only what moves.
+
+    :param content: The cube content, or a transposed batch with one row per
+        position, which is updated in place.
+    :param key: A named tuple that holds information for one shift.
+    :param cube_side_length: The side length of the cube.
+    :param item: If True, use the layout of the cube that holds items.
+    """
+    destination, source = get_key_slices(
+        key=key, cube_side_length=cube_side_length, item=item
+    )
+    # The gather on the right copies the content before it is written.
+    content[destination] = content[source]
+
+
+@lru_cache(maxsize=None)
+def get_move_permutation(move: str,
+                         index: int,
+                         cube_side_length: int,
+                         item: bool = False) -> np.ndarray:
+    """Get the permutation of one move by 90 degrees.
+
+    :param move: Name of the move.
+    :param index: The layer selected for the move.
+    :param cube_side_length: The side length of the cube.
+    :param item: If True, use the layout of the cube that holds items.
+    :return: A read-only permutation of the cube content.
+    """
+    # Lay the positions out as faces of cubies.
+    face_order = ITEM_FACE_ORDER if item else BIT_FACE_ORDER
+    cubie_length = 1 if item else CUBIE_LENGTH
+    positions = np.arange(
+        get_cube_size(cube_side_length=cube_side_length, item=item)
+    ).reshape(6, cube_side_length, cube_side_length, cubie_length)
+
+    # Replay the move on the positions.
+    replay_move(
+        faces=dict(zip(face_order, map(_ArrayFace, positions))),
+        move=move,
+        index=index,
+        cube_side_length=cube_side_length
+    )
+
+    # Flatten the faces back to the content order.
+    permutation = positions.reshape(-1)
+    permutation.setflags(write=False)
+    return permutation
+
+
+@lru_cache(maxsize=None)
+def get_key_permutation(key: Key,
+                        cube_side_length: int,
+                        item: bool = False) -> np.ndarray:
+    """Get the permutation of one key, which may turn more than 90 degrees.
+
+    :param key: A named tuple that holds information for one shift.
+    :param cube_side_length: The side length of the cube.
+    :param item: If True, use the layout of the cube that holds items.
+    :return: A read-only permutation of the cube content.
+    """
+    move_permutation = get_move_permutation(
+        move=key.move,
+        index=key.index,
+        cube_side_length=cube_side_length,
+        item=item
+    )
+
+    # Apply the 90 degrees move the desired number of times.
+    permutation = np.arange(move_permutation.size)
+    for _ in range(int(key.angle / 90) % 4):
+        permutation = permutation[move_permutation]
+    permutation.setflags(write=False)
+    return permutation
+
+
+@lru_cache(maxsize=None)
+def get_content_shift_permutation(cube_size: int,
+                                  step: int = 1) -> np.ndarray:
+    """Get the permutation that shifts the content to the right by steps.
+
+    :param cube_size: The length of the cube content.
+    :param step: Number of positions to shift, negative to shift left.
+    :return: A read-only permutation of the cube content.
+    """
+    permutation = np.roll(np.arange(cube_size), step)
+    permutation.setflags(write=False)
+    return permutation
+
+
+def compose_permutation(*permutations: np.ndarray) -> np.ndarray:
+    """Get the permutation of applying the inputs one after another.
+
+    :param permutations: Permutations, in the order they are applied.
+    :return: The combined permutation.
+    """
+    result = permutations[0]
+    for permutation in permutations[1:]:
+        result = result[permutation]
+    return result
+
+
+def invert_permutation(permutation: np.ndarray) -> np.ndarray:
+    """Get the permutation that undoes the input permutation."""
+    inverse = np.empty_like(permutation)
+    inverse[permutation] = np.arange(permutation.size)
+    return inverse
+
+
+def compile_key(key: List[Key],
+                cube_side_length: int,
+                item: bool = False) -> np.ndarray:
+    """Combine the moves of a list of keys into one permutation.
+
+    Only the cube moves are combined, the content shift and XOR steps of the
+    encryption are not part of the result.
+
+    :param key: A list of keys.
+    :param cube_side_length: The side length of the cube.
+    :param item: If True, use the layout of the cube that holds items.
+    :return: The permutation of performing all the keys in order.
+    """
+    permutation = np.arange(
+        get_cube_size(cube_side_length=cube_side_length, item=item)
+    )
+    for each_key in key:
+        # Composing with a key only changes the positions the key moves.
+        apply_key(
+            content=permutation,
+            key=each_key,
+            cube_side_length=cube_side_length,
+            item=item
+        )
+    return permutation
@@ -0,0 +1,200 @@
+"""Define a cache of compiled key prefixes for sweeps over many keys.
+
+Keys that share a prefix share the state compiled for that prefix. The
+cache keeps the states in a trie with one node per key, so compiling a key
+walks down to the deepest cached prefix and only performs the keys after
+it, storing the state of each new prefix on the way. The state may be:
+
+    - the permutation of the moves, optionally with the content shift
+    - the GF(2) matrix of the encryption from src.engine.linear
+
+The states are evicted least recently used first once they take more bytes
+than the cache allows, except the one stored last, and a node without a
+state or children is removed.
+"""
+
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from src.engine.batch import encrypt_positions
+from src.engine.linear import compile_linear_map
+from src.engine.permutation import compose_permutation, \
+    get_content_shift_permutation, get_cube_size, get_key_permutation
+from src.helper.constant import Key, WRONG_CACHE_SIZE
+
+# Default number of bytes the cached states may take.
+DEFAULT_MAX_BYTES = 1 << 26
+
+
+class _PrefixNode:
+    """Hold the state of one prefix and the prefixes that extend it."""
+
+    __slots__ = ("parent", "key", "children", "state")
+
+    def __init__(self, parent, key):
+        self.parent = parent
+        self.key = key
+        self.children = {}
+        self.state = None
+
+
+class PrefixCache:
+    """Compile keys on top of the cached states of their prefixes."""
+
+    def __init__(self,
+                 cube_side_length: int,
+                 item: bool = False,
+                 with_shift: bool = False,
+                 linear: bool = False,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize an empty cache.
+
+        :param cube_side_length: The side length of the cube.
+        :param item: If True, use the layout of the cube that holds items.
+        :param with_shift: If True, shift the content before each key, as the
+            encryption does, otherwise only the moves are compiled.
+        :param linear: If True, compile the whole encryption step into a
+            GF(2) matrix instead of a permutation.
+        :param max_bytes: Number of bytes the cached states may take.
+        """
+        # Error check. The budget should not be negative.
+        assert max_bytes >= 0, WRONG_CACHE_SIZE
+
+        # Store the cube information.
+        self._side_length = cube_side_length
+        self._item = item
+        self._with_shift = with_shift
+        self._linear = linear
+        self._max_bytes = max_bytes
+        self._cube_size = get_cube_size(
+            cube_side_length=cube_side_length, item=item
+        )
+
+        # The empty prefix is always kept and never counted.
+        self._root = _PrefixNode(parent=None, key=None)
+        self._root.state = self._get_initial_state()
+        self._lru = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Get the number of bytes the cached states take."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        """Get the number of cached prefixes."""
+        return len(self._lru)
+
+    def _get_initial_state(self) -> np.ndarray:
+        """Get the state of the empty key."""
+        if self._linear:
+            state = compile_linear_map(
+                key=[], cube_side_length=self._side_length
+            )
+        else:
+            state = np.arange(self._cube_size)
+        state.setflags(write=False)
+        return state
+
+    def _extend(self, state: np.ndarray, key: Key) -> np.ndarray:
+        """Perform one more key on top of the state of a prefix."""
+        if self._linear:
+            state = encrypt_positions(
+                positions=np.array(state),
+                key=[key],
+                cube_side_length=self._side_length
+            )
+        else:
+            permutation = get_key_permutation(
+                key=key, cube_side_length=self._side_length, item=self._item
+            )
+            if self._with_shift:
+                permutation = compose_permutation(
+                    get_content_shift_permutation(cube_size=self._cube_size),
+                    permutation
+                )
+            state = compose_permutation(state, permutation)
+        state.setflags(write=False)
+        return state
+
+    def _store(self, node: _PrefixNode, state: np.ndarray):
+        """Cache the state of a node and evict states over the budget.
+
+        The node just stored is the end of the path being extended, so it is
+        kept even when it alone takes more than the budget.
+        """
+        node.state = state
+        self._lru[node] = None
+        self._nbytes += state.nbytes
+        while self._nbytes > self._max_bytes and len(self._lru) > 1:
+            self._evict(node=self._lru.popitem(last=False)[0])
+
+    def _evict(self, node: _PrefixNode):
+        """Drop the state of a node and remove the nodes left empty."""
+        self._nbytes -= node.state.nbytes
+        node.state = None
+        while node is not self._root and node.state is None \
+                and not node.children:
+            del node.parent.children[node.key]
+            node = node.parent
+
+    def compile(self, key: List[Key]) -> np.ndarray:
+        """Get the state of a key, reusing the longest cached prefix.
+
+        :param key: A list of keys.
+        :return: The read-only state after performing the whole key.
+        """
+        key = [each_key._replace(angle=each_key.angle % 360)
+               for each_key in key]
+
+        # Find the deepest prefix that still holds a state.
+        node, cached, depth = self._root, self._root, 0
+        for step, each_key in enumerate(key):
+            node = node.children.get(each_key)
+            if node is None:
+                break
+            if node.state is not None:
+                cached, depth = node, step + 1
+        self.hits += depth
+        self.misses += len(key) - depth
+        if cached is not self._root:
+            self._lru.move_to_end(cached)
+
+        # Perform the rest of the keys, caching each new prefix.
+        node, state = cached, cached.state
+        for each_key in key[depth:]:
+            child = node.children.get(each_key)
+            if child is None:
+                child = node.children[each_key] = _PrefixNode(
+                    parent=node, key=each_key
+                )
+            node = child
+            state = self._extend(state=state, key=each_key)
+            self._store(node=node, state=state)
+        return state
+
+    def iter_extension(
+            self,
+            key: List[Key],
+            extensions: Iterable[Key]) -> Iterator[Tuple[Key, np.ndarray]]:
+        """Get the states of a key followed by each one of many keys.
+
+        The key is compiled once, and each extension costs a single step.
+
+        :param key: A list of keys shared by all the results.
+        :param extensions: The keys to perform after it, one at a time.
+        :return: A generator of each extension with its state.
+        """
+        self.compile(key=key)
+        for extension in extensions:
+            yield extension, self.compile(key=list(key) + [extension])
+
+    def clear(self):
+        """Drop every cached state except the empty key."""
+        self._root.children.clear()
+        self._lru.clear()
+        self._nbytes = 0
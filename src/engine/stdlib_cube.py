@@ -0,0 +1,238 @@
+"""Define a cube that only needs the Python standard library.
+
+Short-lived workers spend most of their time importing NumPy and pandas, so
+this cube keeps its content in a bytearray of "0" and "1" characters, or a
+list of items, and moves it with permutations held as tuples. They follow
+the same convention as src.engine.permutation, where the new content at
+position p is the old content at permutation[p], and are found by replaying
+the moves of src.engine.moves on nested lists of positions. The XOR step
+reads the faces as Python integers.
+"""
+
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, List, Tuple, Union
+
+from src.engine.backend import get_metric_labels
+from src.engine.moves import BIT_FACE_ORDER, get_cube_size, \
+    ITEM_FACE_ORDER, replay_move
+from src.helper.constant import CUBIE_LENGTH, Key, WRONG_CUBE_INPUT, \
+    WRONG_CUBE_ITEM, WRONG_CUBE_SIDE_LENGTH
+from src.helper.metrics import timed
+
+
+def _rotate_cubie(cubies: list, angle: int) -> list:
+    """Rotate the content of each cubie by the angle, as Cubie does."""
+    return [
+        cubie[-step:] + cubie[:-step] if step else cubie
+        for cubie in cubies
+        for step in [int(angle / 90) % len(cubie)]
+    ]
+
+
+class _ListFace:
+    """Hold the positions of one face as a list of rows of cubie tuples."""
+
+    def __init__(self, rows: List[List[Tuple[int, ...]]]):
+        """Wrap the rows of a face, which are changed in place.
+
+        :param rows: A list of rows, each a list of cubies of positions.
+        """
+        self.rows = rows
+
+    def get_row(self, row: int) -> list:
+        """Get a copy of the cubies of one row."""
+        return list(self.rows[row])
+
+    def get_col(self, col: int) -> list:
+        """Get a copy of the cubies of one column."""
+        return [cubies[col] for cubies in self.rows]
+
+    def set_row(self, row: int, cubies: list, angle: int = 0):
+        """Replace one row, turning each cubie by the angle."""
+        self.rows[row] = _rotate_cubie(cubies=cubies, angle=angle)
+
+    def set_col(self, col: int, cubies: list, angle: int = 0):
+        """Replace one column, turning each cubie by the angle."""
+        for cubie_row, cubie in zip(
+                self.rows, _rotate_cubie(cubies=cubies, angle=angle)):
+            cubie_row[col] = cubie
+
+    def rotate(self):
+        """Rotate the face and its cubies clockwise by 90 degrees."""
+        size = len(self.rows)
+        rotated = [_rotate_cubie(cubies=row, angle=90) for row in self.rows]
+        self.rows = [
+            [rotated[size - 1 - col][row] for col in range(size)]
+            for row in range(size)
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_move_tuple(move: str,
+                   index: int,
+                   cube_side_length: int,
+                   item: bool = False) -> Tuple[int, ...]:
+    """Get the permutation of one move by 90 degrees as a tuple.
+
+    :param move: Name of the move.
+    :param index: The layer selected for the move.
+    :param cube_side_length: The side length of the cube.
+    :param item: If True, use the layout of the cube that holds items.
+    :return: A permutation of the cube content.
+    """
+    # Lay the positions out as faces of cubies.
+    face_order = ITEM_FACE_ORDER if item else BIT_FACE_ORDER
+    cubie_length = 1 if item else CUBIE_LENGTH
+    face_size = cube_side_length ** 2 * cubie_length
+    row_size = cube_side_length * cubie_length
+    faces = {
+        face: _ListFace(rows=[
+            [
+                tuple(range(start, start + cubie_length))
+                for start in range(
+                    face_index * face_size + row * row_size,
+                    face_index * face_size + (row + 1) * row_size,
+                    cubie_length
+                )
+            ]
+            for row in range(cube_side_length)
+        ])
+        for face_index, face in enumerate(face_order)
+    }
+
+    # Replay the move on the positions.
+    replay_move(
+        faces=faces,
+        move=move,
+        index=index,
+        cube_side_length=cube_side_length
+    )
+
+    # Flatten the faces back to the content order.
+    return tuple(
+        position
+        for face in face_order
+        for row in faces[face].rows
+        for cubie in row
+        for position in cubie
+    )
+
+
+@lru_cache(maxsize=None)
+def get_key_getter(key: Key,
+                   cube_side_length: int,
+                   item: bool = False) -> Callable:
+    """Get a function that gathers the content in the order of a key.
+
+    :param key: A named tuple that holds information for one shift.
+    :param cube_side_length: The side length of the cube.
+    :param item: If True, use the layout of the cube that holds items.
+    :return: An itemgetter that returns the new content as a tuple.
+    """
+    move = get_move_tuple(
+        move=key.move,
+        index=key.index,
+        cube_side_length=cube_side_length,
+        item=item
+    )
+
+    # Apply the 90 degrees move the desired number of times.
+    permutation = tuple(range(len(move)))
+    for _ in range(int(key.angle / 90) % 4):
+        permutation = tuple(permutation[position] for position in move)
+    return itemgetter(*permutation)
+
+
+class StdlibCube:
+    """Create a cube whose content is a bytearray or a list of items."""
+
+    __slots__ = ("_side_length", "_item", "_random_start", "_state")
+
+    # Name of the backend in the labels of the timings.
+    backend = "stdlib"
+
+    def __init__(self,
+                 cube_input: Union[str, list],
+                 cube_side_length: int,
+                 item: bool = False):
+        """Initialize the cube with an input of the desired length.
+
+        :param cube_input: A binary string, or a list of items when the cube
+            holds items.
+        :param cube_side_length: The desired side length of the cube.
+        :param item: If True, the cube holds one item per cubie.
+        """
+        # Error check. The side length and the input should fit the cube.
+        assert cube_side_length > 1, WRONG_CUBE_SIDE_LENGTH
+        assert len(cube_input) == get_cube_size(
+            cube_side_length=cube_side_length, item=item
+        ), WRONG_CUBE_INPUT
+
+        self._side_length = cube_side_length
+        self._item = item
+        self._random_start = cube_side_length ** 2 * 5 * CUBIE_LENGTH
+        self._state = list(cube_input) if item \
+            else bytearray(cube_input.encode("ascii"))
+
+    @property
+    def item(self) -> bool:
+        """Get whether the cube holds one item per cubie."""
+        return self._item
+
+    @property
+    def content(self) -> Union[str, list]:
+        """Get the content as a binary string, or a list of items."""
+        if self._item:
+            return list(self._state)
+        return self._state.decode("ascii")
+
+    @property
+    def message_content(self) -> str:
+        """Get the bits on the faces that hold a message as a string."""
+        assert not self._item, WRONG_CUBE_ITEM
+        return self._state[:self._random_start].decode("ascii")
+
+    @property
+    def random_content(self) -> str:
+        """Get the bits on the face that holds random bits as a string."""
+        assert not self._item, WRONG_CUBE_ITEM
+        return self._state[self._random_start:].decode("ascii")
+
+    @timed("shift", get_labels=get_metric_labels)
+    def shift(self, key: Key):
+        """Shift the cube with a move in a certain number of angles.
+
+        :param key: A named tuple that holds information for one shift.
+        """
+        content = get_key_getter(
+            key=key, cube_side_length=self._side_length, item=self._item
+        )(self._state)
+        self._state = list(content) if self._item else bytearray(content)
+
+    @timed("shift_content", get_labels=get_metric_labels)
+    def shift_content(self):
+        """Shift the content to the right by one position."""
+        self._state = self._state[-1:] + self._state[:-1]
+
+    @timed("shift_content_back", get_labels=get_metric_labels)
+    def shift_content_back(self):
+        """Shift the content to the left by one position."""
+        self._state = self._state[1:] + self._state[:1]
+
+    # The cube that holds bits names the content shift this way.
+    shift_cubie_content = shift_content
+    shift_cubie_content_back = shift_content_back
+
+    @timed("xor", get_labels=get_metric_labels)
+    def xor(self):
+        """Xor the random face with each other face."""
+        # Error check. Only the cube that holds bits has a random face.
+        assert not self._item, WRONG_CUBE_ITEM
+        random_face = self._state[self._random_start:]
+        message = int(self._state[:self._random_start], 2) ^ int(
+            random_face * 5, 2
+        )
+        self._state = bytearray(
+            format(message, f"0{self._random_start}b").encode("ascii")
+        ) + random_face
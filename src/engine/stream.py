@@ -0,0 +1,665 @@
+"""Define the cube container and the streaming encryption of byte streams.
+
+A container starts with a small header followed by the encrypted cubes:
+
+    - the magic bytes and the format version
+    - the cube side length as an unsigned LEB128 varint
+    - the codec the bytes were compressed with before packing, one byte,
+      which containers of version 1 do not hold since they are never
+      compressed
+
+Each cube holds the same content as one encbit cube, the message bits of
+the top, front, right, down and back faces followed by the random bits of
+the left face. Its 24 * n ** 2 bits are packed into 3 * n ** 2 bytes and
+the cubes are stored back to back, so cube i starts at the end of the header
+plus i times the cube bytes. The message is padded the same way as in
+Encryption._pad_binary_str, a one bit and then zeros up to the end of the
+last cube, so the message length does not need to be stored.
+
+Since only the last cube holds the padding, a container grows by decrypting
+its last cube, dropping the padding and encrypting the cubes from there on,
+so appending costs the appended bytes plus one cube. Likewise a byte range
+is read by decrypting only the cubes that hold it. Both need the cubes to
+hold the bytes as they are, so they only work on uncompressed containers.
+"""
+
+import io
+import lzma
+import os
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Callable, Iterable, Iterator, List, \
+    NamedTuple, Optional
+
+import numpy as np
+
+from src.engine.bitslice import decrypt_states_bitsliced, \
+    encrypt_states_bitsliced
+from src.helper.constant import CUBIE_LENGTH, Key, WRONG_CHUNK_SIZE, \
+    WRONG_CONTAINER_CODEC, WRONG_CONTAINER_DATA, WRONG_KEY_SIDE_LENGTH, \
+    WRONG_WORKER_COUNT
+from src.helper.key_codec import decode_varint, encode_varint
+
+# Magic bytes and version written in front of every container.
+CONTAINER_MAGIC = b"CCUB"
+CONTAINER_VERSION = 2
+# The codecs the bytes may be compressed with, in the order of their code.
+CODECS = ("none", "zlib", "lzma")
+# Default number of input bytes read and encrypted at once.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class ContainerHeader(NamedTuple):
+    """Define the information stored in front of the cubes."""
+
+    side_length: int
+    offset: int
+    codec: str = "none"
+
+
+def get_message_bits(cube_side_length: int) -> int:
+    """Get the number of message bits one cube holds."""
+    return cube_side_length ** 2 * 5 * CUBIE_LENGTH
+
+
+def get_cube_bytes(cube_side_length: int) -> int:
+    """Get the number of bytes one packed cube takes in the container."""
+    return cube_side_length ** 2 * 6 * CUBIE_LENGTH // 8
+
+
+def _check_codec(codec: str):
+    """Raise an error if the codec is not known."""
+    if codec not in CODECS:
+        raise ValueError(WRONG_CONTAINER_CODEC)
+
+
+def write_container_header(cube_side_length: int,
+                           codec: str = "none") -> bytes:
+    """Get the header of a container.
+
+    :param cube_side_length: The side length of the cubes in the container.
+    :param codec: Name of the codec the bytes are compressed with.
+    :return: The header bytes.
+    """
+    _check_codec(codec=codec)
+    return b"".join([
+        CONTAINER_MAGIC,
+        bytes([CONTAINER_VERSION]),
+        encode_varint(cube_side_length),
+        bytes([CODECS.index(codec)])
+    ])
+
+
+def read_container_header(source: BinaryIO) -> ContainerHeader:
+    """Read the header of a container, leaving the stream at the cubes.
+
+    :param source: A binary stream positioned at the start of the container.
+    :return: The side length of the cubes, where the cubes start and the
+        codec the bytes were compressed with.
+    """
+    # Error check. The data should start with the magic and a version.
+    data = source.read(len(CONTAINER_MAGIC) + 1)
+    if len(data) != len(CONTAINER_MAGIC) + 1 \
+            or data[:-1] != CONTAINER_MAGIC \
+            or data[-1] not in (1, CONTAINER_VERSION):
+        raise ValueError(WRONG_CONTAINER_DATA)
+
+    # Read the varint one byte at a time, so nothing after it is consumed.
+    while True:
+        byte = source.read(1)
+        if not byte:
+            raise ValueError(WRONG_CONTAINER_DATA)
+        data += byte
+        if not byte[0] & 0x80:
+            break
+
+    side_length, offset = decode_varint(data, len(CONTAINER_MAGIC) + 1)
+    if side_length < 2:
+        raise ValueError(WRONG_CONTAINER_DATA)
+    if data[len(CONTAINER_MAGIC)] == 1:
+        return ContainerHeader(side_length=side_length, offset=offset)
+
+    # Error check. The codec should be known.
+    codec = source.read(1)
+    if not codec or codec[0] >= len(CODECS):
+        raise ValueError(WRONG_CONTAINER_DATA)
+    return ContainerHeader(
+        side_length=side_length, offset=offset + 1, codec=CODECS[codec[0]]
+    )
+
+
+def _get_random_bits(cube_count: int, cube_side_length: int) -> np.ndarray:
+    """Get random bits for the random face of each cube."""
+    random_size = cube_side_length ** 2 * CUBIE_LENGTH
+    random_bytes = os.urandom(-(-cube_count * random_size // 8))
+    return np.unpackbits(
+        np.frombuffer(random_bytes, dtype=np.uint8)
+    )[:cube_count * random_size].reshape(cube_count, random_size)
+
+
+def encrypt_block(message_bits: np.ndarray,
+                  key: List[Key],
+                  cube_side_length: int) -> bytes:
+    """Fill cubes with the message bits and random bits, then encrypt them.
+
+    :param message_bits: An array with the message bits of one cube per row.
+    :param key: A list of keys used for encryption.
+    :param cube_side_length: The side length of the cubes.
+    :return: The packed encrypted cubes.
+    """
+    states = np.hstack([message_bits, _get_random_bits(
+        cube_count=len(message_bits), cube_side_length=cube_side_length
+    )])
+    return np.packbits(encrypt_states_bitsliced(
+        states=states, key=key, cube_side_length=cube_side_length
+    ), axis=1).tobytes()
+
+
+def decrypt_block(data: bytes,
+                  key: List[Key],
+                  cube_side_length: int) -> np.ndarray:
+    """Decrypt packed cubes and take out their message bits.
+
+    :param data: The packed encrypted cubes.
+    :param key: The list of keys used for encryption.
+    :param cube_side_length: The side length of the cubes.
+    :return: An array with the message bits of one cube per row.
+    """
+    # Error check. The data should hold whole cubes.
+    cube_bytes = get_cube_bytes(cube_side_length=cube_side_length)
+    if len(data) % cube_bytes:
+        raise ValueError(WRONG_CONTAINER_DATA)
+
+    states = np.unpackbits(
+        np.frombuffer(data, dtype=np.uint8).reshape(-1, cube_bytes), axis=1
+    )
+    return decrypt_states_bitsliced(
+        states=states, key=key, cube_side_length=cube_side_length
+    )[:, :get_message_bits(cube_side_length=cube_side_length)]
+
+
+def _map_block(function: Callable,
+               blocks: Iterable[tuple],
+               workers: int) -> Iterator:
+    """Apply the function to each block, keeping the order of the blocks.
+
+    With more than one worker the blocks run in separate processes, while at
+    most twice as many blocks as workers are held in memory at once.
+
+    :param function: A function that takes the items of one block.
+    :param blocks: The blocks, which may also be a generator.
+    :param workers: Number of processes to use.
+    :return: A generator of the results.
+    """
+    if workers <= 1:
+        for block in blocks:
+            yield function(*block)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for block in blocks:
+            pending.append(executor.submit(function, *block))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _read_chunk(source: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """Read the stream in chunks until it ends."""
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _pad_message(pending: np.ndarray, message_bits: int) -> np.ndarray:
+    """Pad the rest with a one bit and zeros to the end of the last cube."""
+    padding = np.zeros(message_bits - len(pending), dtype=np.uint8)
+    padding[0] = 1
+    return np.concatenate([pending, padding]).reshape(1, -1)
+
+
+def _unpad_message(last_cube: np.ndarray) -> np.ndarray:
+    """Drop the last one bit and the zeros after it from the last cube."""
+    # Error check. The last cube should hold the padding.
+    if last_cube is None or not last_cube.any():
+        raise ValueError(WRONG_CONTAINER_DATA)
+    return last_cube[:len(last_cube) - 1 - int(np.argmax(last_cube[::-1]))]
+
+
+def _compress_chunk(chunks: Iterable[bytes],
+                    codec: str) -> Iterator[bytes]:
+    """Compress the chunks as one stream with the codec."""
+    if codec == "none":
+        yield from chunks
+        return
+
+    compressor = zlib.compressobj() if codec == "zlib" \
+        else lzma.LZMACompressor()
+    for chunk in chunks:
+        yield compressor.compress(chunk)
+    yield compressor.flush()
+
+
+def _get_decompressor(codec: str):
+    """Get an object that decompresses a stream of the codec, if any."""
+    if codec == "zlib":
+        return zlib.decompressobj()
+    if codec == "lzma":
+        return lzma.LZMADecompressor()
+    return None
+
+
+def _get_message_block(chunks: Iterable[bytes],
+                       key: List[Key],
+                       cube_side_length: int) -> Iterator[tuple]:
+    """Split the chunks into blocks of whole cubes of message bits."""
+    message_bits = get_message_bits(cube_side_length=cube_side_length)
+    pending = np.zeros(0, dtype=np.uint8)
+
+    for chunk in chunks:
+        # Keep the bits that do not fill a whole cube for the next chunk.
+        bits = np.concatenate([
+            pending, np.unpackbits(np.frombuffer(chunk, dtype=np.uint8))
+        ])
+        full_size = len(bits) // message_bits * message_bits
+        pending = bits[full_size:]
+        if full_size:
+            yield bits[:full_size].reshape(-1, message_bits), key, \
+                cube_side_length
+
+    yield _pad_message(pending=pending, message_bits=message_bits), key, \
+        cube_side_length
+
+
+def encrypt_stream(source: BinaryIO,
+                   target: BinaryIO,
+                   key: List[Key],
+                   cube_side_length: int,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   workers: int = 1,
+                   codec: str = "none") -> int:
+    """Encrypt a byte stream into a container.
+
+    :param source: The binary stream to encrypt.
+    :param target: The binary stream to write the container to.
+    :param key: A list of keys used for encryption.
+    :param cube_side_length: The side length of the cubes.
+    :param chunk_size: Number of input bytes to read and encrypt at once.
+    :param workers: Number of processes to encrypt the chunks with.
+    :param codec: Name of the codec to compress the bytes with first.
+    :return: The number of cubes written.
+    """
+    # Error check. The chunks and the workers should be positive.
+    assert chunk_size > 0, WRONG_CHUNK_SIZE
+    assert workers > 0, WRONG_WORKER_COUNT
+
+    target.write(write_container_header(
+        cube_side_length=cube_side_length, codec=codec
+    ))
+
+    cube_bytes = get_cube_bytes(cube_side_length=cube_side_length)
+    cube_count = 0
+    for data in _map_block(
+            function=encrypt_block,
+            blocks=_get_message_block(
+                chunks=_compress_chunk(
+                    chunks=_read_chunk(source=source, chunk_size=chunk_size),
+                    codec=codec
+                ),
+                key=key,
+                cube_side_length=cube_side_length
+            ),
+            workers=workers):
+        target.write(data)
+        cube_count += len(data) // cube_bytes
+    return cube_count
+
+
+def _bits_to_bytes(bits: np.ndarray, pending: np.ndarray):
+    """Pack the pending and the new bits into whole bytes.
+
+    :return: The packed bytes and the bits left over.
+    """
+    bits = np.concatenate([pending, bits])
+    full_size = len(bits) // 8 * 8
+    return np.packbits(bits[:full_size]).tobytes(), bits[full_size:]
+
+
+def decrypt_stream(source: BinaryIO,
+                   target: BinaryIO,
+                   key: List[Key],
+                   chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   workers: int = 1,
+                   cube_side_length: Optional[int] = None) -> int:
+    """Decrypt a container into the original byte stream.
+
+    :param source: The binary stream holding the container.
+    :param target: The binary stream to write the decrypted bytes to.
+    :param key: The list of keys used for encryption.
+    :param chunk_size: Number of container bytes to read and decrypt at once.
+    :param workers: Number of processes to decrypt the chunks with.
+    :param cube_side_length: The side length the key was made for, which
+        should match the container when it is given.
+    :return: The number of cubes read.
+    """
+    # Error check. The chunks and the workers should be positive.
+    assert chunk_size > 0, WRONG_CHUNK_SIZE
+    assert workers > 0, WRONG_WORKER_COUNT
+
+    header = read_container_header(source=source)
+    if cube_side_length not in (None, header.side_length):
+        raise ValueError(WRONG_KEY_SIDE_LENGTH)
+    side_length = header.side_length
+    cube_bytes = get_cube_bytes(cube_side_length=side_length)
+
+    # Decompress the bytes on their way to the target.
+    decompressor = _get_decompressor(codec=header.codec)
+
+    def write(data: bytes):
+        target.write(
+            decompressor.decompress(data) if decompressor else data
+        )
+
+    # Read whole cubes, at least one at a time.
+    chunk_size = max(chunk_size // cube_bytes, 1) * cube_bytes
+    blocks = (
+        (chunk, key, side_length)
+        for chunk in _read_chunk(source=source, chunk_size=chunk_size)
+    )
+
+    # Hold back the last cube, since only that one holds the padding.
+    last_cube, pending, cube_count = None, np.zeros(0, dtype=np.uint8), 0
+    for message in _map_block(
+            function=decrypt_block, blocks=blocks, workers=workers):
+        cube_count += len(message)
+        if last_cube is not None:
+            message = np.vstack([last_cube[None], message])
+        data, pending = _bits_to_bytes(
+            bits=message[:-1].ravel(), pending=pending
+        )
+        write(data)
+        last_cube = message[-1]
+
+    data, pending = _bits_to_bytes(
+        bits=_unpad_message(last_cube=last_cube), pending=pending
+    )
+    if len(pending):
+        raise ValueError(WRONG_CONTAINER_DATA)
+    write(data)
+
+    # Error check. The compressed stream should have ended.
+    if decompressor and not decompressor.eof:
+        raise ValueError(WRONG_CONTAINER_DATA)
+    return cube_count
+
+
+class ContainerReader:
+    """Decrypt any byte range of a container without reading the rest.
+
+    Cube i starts at the header offset plus i times the cube bytes, so a
+    range only reads and decrypts the cubes that hold its bits.
+    """
+
+    def __init__(self, source: BinaryIO, key: List[Key]):
+        """Read the header and find the number of cubes.
+
+        :param source: A seekable binary stream holding the container.
+        :param key: The list of keys used for encryption.
+        """
+        self._source = source
+        self._key = key
+
+        source.seek(0)
+        header = read_container_header(source=source)
+        if header.codec != "none":
+            raise ValueError(WRONG_CONTAINER_CODEC)
+        self._side_length = header.side_length
+        self._offset = header.offset
+        self._cube_bytes = get_cube_bytes(cube_side_length=self._side_length)
+        self._message_bits = get_message_bits(
+            cube_side_length=self._side_length
+        )
+
+        # Error check. The container should hold whole cubes.
+        size = source.seek(0, io.SEEK_END) - self._offset
+        if size < self._cube_bytes or size % self._cube_bytes:
+            raise ValueError(WRONG_CONTAINER_DATA)
+        self._cube_count = size // self._cube_bytes
+        self._size = None
+
+    @property
+    def side_length(self) -> int:
+        """Get the side length of the cubes in the container."""
+        return self._side_length
+
+    @property
+    def cube_count(self) -> int:
+        """Get the number of cubes in the container."""
+        return self._cube_count
+
+    @property
+    def size(self) -> int:
+        """Get the number of decrypted bytes, found from the last cube."""
+        if self._size is None:
+            last_bits = len(_unpad_message(last_cube=self._decrypt_cube(
+                first=self._cube_count - 1, count=1
+            )))
+            self._size = (
+                (self._cube_count - 1) * self._message_bits + last_bits
+            ) // 8
+        return self._size
+
+    def __len__(self) -> int:
+        """Get the number of decrypted bytes."""
+        return self.size
+
+    def _decrypt_cube(self, first: int, count: int) -> np.ndarray:
+        """Decrypt consecutive cubes into one array of message bits."""
+        self._source.seek(self._offset + first * self._cube_bytes)
+        return decrypt_block(
+            data=self._source.read(count * self._cube_bytes),
+            key=self._key,
+            cube_side_length=self._side_length
+        ).ravel()
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> bytes:
+        """Decrypt the bytes from start to stop, as a slice would take them.
+
+        :param start: The first byte, which may count from the end.
+        :param stop: The byte after the last one, or None for the end.
+        :return: The decrypted bytes.
+        """
+        start, stop, _ = slice(start, stop).indices(self.size)
+        if start >= stop:
+            return b""
+
+        # Find the cubes that hold the bits of the range.
+        first = start * 8 // self._message_bits
+        last = (stop * 8 - 1) // self._message_bits
+        bits = self._decrypt_cube(first=first, count=last - first + 1)
+        bit_start = start * 8 - first * self._message_bits
+        return np.packbits(
+            bits[bit_start: bit_start + (stop - start) * 8]
+        ).tobytes()
+
+
+class AppendWriter:
+    """Append bytes to a container, encrypting only the cubes that change.
+
+    The cubes before the last one never change when more bytes arrive, so
+    only the bits of the last, padded cube are kept. Each write encrypts the
+    cubes it fills and then the kept bits as a new last cube, so the target
+    always holds a complete container whose last cube the next write
+    replaces.
+    """
+
+    def __init__(self,
+                 target: BinaryIO,
+                 key: List[Key],
+                 cube_side_length: Optional[int] = None,
+                 workers: int = 1):
+        """Start a new container or reopen an existing one to append to.
+
+        :param target: A seekable binary stream opened for reading and
+            writing, either empty or holding a container.
+        :param key: A list of keys used for encryption.
+        :param cube_side_length: The side length of the cubes, which should
+            match the container when it already exists.
+        :param workers: Number of processes to encrypt the cubes with.
+        """
+        # Error check. The workers should be positive.
+        assert workers > 0, WRONG_WORKER_COUNT
+
+        self._target = target
+        self._key = key
+        self._workers = workers
+
+        target.seek(0, io.SEEK_END)
+        if target.tell() == 0:
+            # Error check. A new container needs the side length.
+            if cube_side_length is None:
+                raise ValueError(WRONG_CONTAINER_DATA)
+            target.write(write_container_header(cube_side_length))
+            self._side_length = cube_side_length
+            self._pending = np.zeros(0, dtype=np.uint8)
+            self._end = target.tell()
+            self._write_last_cube()
+        else:
+            self._reopen(cube_side_length=cube_side_length)
+
+    def _reopen(self, cube_side_length: int):
+        """Read back the bits of the last cube of an existing container."""
+        self._target.seek(0)
+        header = read_container_header(source=self._target)
+        if header.codec != "none":
+            raise ValueError(WRONG_CONTAINER_CODEC)
+        if cube_side_length not in (None, header.side_length):
+            raise ValueError(WRONG_KEY_SIDE_LENGTH)
+        self._side_length = header.side_length
+
+        # Error check. The container should hold whole cubes.
+        cube_bytes = get_cube_bytes(cube_side_length=self._side_length)
+        size = self._target.seek(0, io.SEEK_END) - header.offset
+        if size < cube_bytes or size % cube_bytes:
+            raise ValueError(WRONG_CONTAINER_DATA)
+
+        # Only the last cube holds the padding and the bits after the cubes.
+        self._end = self._target.seek(-cube_bytes, io.SEEK_END)
+        self._pending = _unpad_message(last_cube=decrypt_block(
+            data=self._target.read(cube_bytes),
+            key=self._key,
+            cube_side_length=self._side_length
+        )[0])
+
+    @property
+    def side_length(self) -> int:
+        """Get the side length of the cubes in the container."""
+        return self._side_length
+
+    def write(self, data: bytes, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Encrypt the cubes the bytes fill, keeping the bits left over.
+
+        :param data: The bytes to append.
+        :param chunk_size: Number of bytes to encrypt at once.
+        :return: The number of cubes written.
+        """
+        # Error check. The chunks should be positive.
+        assert chunk_size > 0, WRONG_CHUNK_SIZE
+
+        message_bits = get_message_bits(cube_side_length=self._side_length)
+        blocks = []
+        for start in range(0, len(data), chunk_size):
+            bits = np.concatenate([self._pending, np.unpackbits(
+                np.frombuffer(data[start: start + chunk_size], dtype=np.uint8)
+            )])
+            full_size = len(bits) // message_bits * message_bits
+            self._pending = bits[full_size:]
+            if full_size:
+                blocks.append((
+                    bits[:full_size].reshape(-1, message_bits),
+                    self._key,
+                    self._side_length
+                ))
+
+        self._target.seek(self._end)
+        cube_count = 0
+        for block in _map_block(
+                function=encrypt_block, blocks=blocks, workers=self._workers):
+            self._target.write(block)
+            cube_count += len(block) // get_cube_bytes(self._side_length)
+        self._end = self._target.tell()
+        self._write_last_cube()
+        return cube_count
+
+    def _write_last_cube(self):
+        """Write the kept bits as the padded last cube of the container."""
+        self._target.seek(self._end)
+        self._target.write(encrypt_block(
+            message_bits=_pad_message(
+                pending=self._pending,
+                message_bits=get_message_bits(self._side_length)
+            ),
+            key=self._key,
+            cube_side_length=self._side_length
+        ))
+        self._target.truncate()
+
+    def flush(self):
+        """Flush the container written so far to the target."""
+        self._target.flush()
+
+    def close(self):
+        """Flush the container, leaving the target open."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def encrypt_bytes(data: bytes,
+                  key: List[Key],
+                  cube_side_length: int,
+                  workers: int = 1,
+                  codec: str = "none") -> bytes:
+    """Encrypt bytes into a container held in memory.
+
+    :param data: The bytes to encrypt.
+    :param key: A list of keys used for encryption.
+    :param cube_side_length: The side length of the cubes.
+    :param workers: Number of processes to encrypt with.
+    :param codec: Name of the codec to compress the bytes with first.
+    :return: The container.
+    """
+    target = io.BytesIO()
+    encrypt_stream(
+        source=io.BytesIO(data),
+        target=target,
+        key=key,
+        cube_side_length=cube_side_length,
+        workers=workers,
+        codec=codec
+    )
+    return target.getvalue()
+
+
+def decrypt_bytes(data: bytes, key: List[Key], workers: int = 1) -> bytes:
+    """Decrypt a container held in memory.
+
+    :param data: The container.
+    :param key: The list of keys used for encryption.
+    :param workers: Number of processes to decrypt with.
+    :return: The decrypted bytes.
+    """
+    target = io.BytesIO()
+    decrypt_stream(
+        source=io.BytesIO(data), target=target, key=key, workers=workers
+    )
+    return target.getvalue()
@@ -57,6 +57,34 @@ WRONG_CUBE_FACE_INPUT = "The input length does not match the desired length " \
 WRONG_CUBE_MOVE = "The input cube move is undefined."
 WRONG_CUBE_SIDE_LENGTH = "The input cube side length is too short."
 WRONG_CUBE_INPUT = "The input length does not match size of the entire cube."
+WRONG_CUBE_INDEX = "The input cube move index is out of range."
+WRONG_CUBE_LAYOUT = "The input cube layout is undefined."
+WRONG_UNDO_COUNT = "There are not enough steps in the history to undo."
+WRONG_CACHE_SIZE = "The cache size should not be negative."
+WRONG_LINEAR_MAP_SIZE = "The linear map of the cube exceeds the memory " \
+    "budget."
+WRONG_BACKEND = "The cube backend is not registered."
+WRONG_CUBE_ITEM = "The cube that holds items has no random face."
 
 # Error messages for cross-project usage.
 WRONG_ROTATION_ANGLE = "Wrong rotation angle for the cube."
+
+# Error messages for the key serialization.
+WRONG_KEY_INDEX = "The key index does not fit the cube side length."
+WRONG_KEY_DATA = "The input bytes are not a valid packed key."
+WRONG_KEY_COUNT = "There should be one key for each cube."
+
+# Error messages for the analyzers.
+WRONG_SAMPLE_SIZE = "The number of samples should be positive."
+
+# Error messages for the ciphertext container.
+WRONG_CONTAINER_DATA = "The input bytes are not a valid cube container."
+WRONG_CONTAINER_CODEC = "The container codec is undefined or not supported."
+WRONG_KEY_SIDE_LENGTH = "The key was made for a different cube side length."
+WRONG_CHUNK_SIZE = "The chunk size should be positive."
+WRONG_WORKER_COUNT = "The number of workers should be positive."
+
+# Error messages for the text conversion.
+WRONG_BINARY_LENGTH = "The binary string does not hold whole bytes."
+WRONG_BINARY_STRING = "The binary string holds characters other than 0 " \
+    "and 1."
@@ -0,0 +1,216 @@
+"""Define the packed binary serialization of keys.
+
+A packed key starts with a small header followed by a bit stream of fixed
+width records, one record per key:
+
+    - 3 bits for the move, the position of the move in CUBE_MOVE
+    - 2 bits for the angle, the number of clockwise quarter turns
+    - index bits for the layer index, just enough to hold the max index
+
+The header holds the magic bytes, the format version, the cube side length
+and the number of keys, where the last two are unsigned LEB128 varints.
+"""
+
+import math
+from typing import List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from src.helper.constant import CUBE_MOVE, Key, WRONG_CUBE_MOVE, \
+    WRONG_KEY_DATA, WRONG_KEY_INDEX, WRONG_ROTATION_ANGLE
+
+# Magic bytes and version written in front of every packed key.
+KEY_MAGIC = b"CKEY"
+KEY_VERSION = 1
+# Number of bits used to store the move and the angle of one key.
+KEY_MOVE_BITS = 3
+KEY_ANGLE_BITS = 2
+
+
+class KeyHeader(NamedTuple):
+    """Define the information stored in front of a packed key."""
+
+    side_length: int
+    key_count: int
+    offset: int
+
+
+def get_index_bits(cube_side_length: int) -> int:
+    """Get the number of bits needed to store the index of a key.
+
+    :param cube_side_length: The side length of the cube the key is for.
+    :return: The number of bits to hold the max index of the cube.
+    """
+    return max(1, math.floor(cube_side_length / 2).bit_length())
+
+
+def keys_to_array(key: List[Key]) -> np.ndarray:
+    """Convert a list of keys to an integer array.
+
+    :param key: A list of keys.
+    :return: An array of shape (len(key), 3) holding move code, angle, index.
+    """
+    # Find the move code of each key, which is its position in CUBE_MOVE.
+    try:
+        move_code = [CUBE_MOVE.index(each_key.move) for each_key in key]
+    except ValueError:
+        raise ValueError(WRONG_CUBE_MOVE) from None
+
+    # Stack the three fields as columns.
+    return np.array(
+        [
+            move_code,
+            [each_key.angle for each_key in key],
+            [each_key.index for each_key in key]
+        ],
+        dtype=np.int64
+    ).reshape(3, -1).T
+
+
+def array_to_keys(key_array: np.ndarray) -> List[Key]:
+    """Convert an integer array back to a list of keys.
+
+    :param key_array: An array of shape (N, 3) holding move code, angle, index.
+    :return: The list of keys.
+    """
+    return [
+        Key(move=CUBE_MOVE[move], angle=int(angle), index=int(index))
+        for move, angle, index in np.asarray(key_array).tolist()
+    ]
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as an unsigned LEB128 varint."""
+    encoded = bytearray()
+    while True:
+        # Take the lowest seven bits, set the high bit if more bytes follow.
+        byte, value = value & 0x7F, value >> 7
+        encoded.append(byte | 0x80 if value else byte)
+        if not value:
+            return bytes(encoded)
+
+
+def decode_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    """Decode an unsigned LEB128 varint starting at the offset.
+
+    :return: The decoded value and the offset right after it.
+    """
+    value, shift = 0, 0
+    while offset < len(data):
+        byte = data[offset]
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        offset += 1
+        if not byte & 0x80:
+            return value, offset
+
+    # The data ended in the middle of the varint.
+    raise ValueError(WRONG_KEY_DATA)
+
+
+def encode_keys(key: Union[List[Key], np.ndarray],
+                cube_side_length: int) -> bytes:
+    """Pack a list of keys, or its array form, into bytes.
+
+    Angles are stored as quarter turns modulo 360, so for example a key with
+    angle 360 is decoded with angle 0, which is the same move on the cube.
+
+    :param key: A list of keys or an array from keys_to_array.
+    :param cube_side_length: The side length of the cube the key is for.
+    :return: The packed key.
+    """
+    # Get the key as an array.
+    key_array = np.asarray(key, dtype=np.int64) \
+        if isinstance(key, np.ndarray) else keys_to_array(key=key)
+    key_array = key_array.reshape(-1, 3)
+    move, angle, index = key_array.T
+
+    # Error check. The move code should point to a legal move.
+    if np.any((move < 0) | (move >= len(CUBE_MOVE))):
+        raise ValueError(WRONG_CUBE_MOVE)
+    # Error check. The index should be within the cube.
+    assert np.all(
+        (index >= 0) & (index <= math.floor(cube_side_length / 2))
+    ), WRONG_KEY_INDEX
+    # Error check. The angle should be whole quarter turns.
+    assert np.all(angle % 90 == 0), WRONG_ROTATION_ANGLE
+
+    # Put all fields of one key into one integer.
+    index_bits = get_index_bits(cube_side_length=cube_side_length)
+    width = KEY_MOVE_BITS + KEY_ANGLE_BITS + index_bits
+    record = (move << (KEY_ANGLE_BITS + index_bits)) | \
+        ((angle // 90 % 4) << index_bits) | index
+
+    # Spread each record over its bits, most significant bit first.
+    record_bits = (record[:, None] >> np.arange(width - 1, -1, -1)) & 1
+
+    # Write the header and the bit stream.
+    return b"".join([
+        KEY_MAGIC,
+        bytes([KEY_VERSION]),
+        encode_varint(cube_side_length),
+        encode_varint(len(key_array)),
+        np.packbits(record_bits.astype(np.uint8)).tobytes()
+    ])
+
+
+def read_key_header(data: bytes) -> KeyHeader:
+    """Read the header of a packed key.
+
+    :param data: The packed key.
+    :return: The side length, the number of keys and where the keys start.
+    """
+    # Error check. The data should start with the magic and version.
+    if data[:len(KEY_MAGIC)] != KEY_MAGIC or \
+            data[len(KEY_MAGIC): len(KEY_MAGIC) + 1] != bytes([KEY_VERSION]):
+        raise ValueError(WRONG_KEY_DATA)
+
+    # Read the side length and the number of keys.
+    side_length, offset = decode_varint(data, len(KEY_MAGIC) + 1)
+    key_count, offset = decode_varint(data, offset)
+
+    return KeyHeader(
+        side_length=side_length, key_count=key_count, offset=offset
+    )
+
+
+def decode_keys(data: bytes) -> np.ndarray:
+    """Unpack bytes into the array form of the keys.
+
+    :param data: The packed key.
+    :return: An array of shape (N, 3) holding move code, angle, index.
+    """
+    # Read the header and find the size of each record.
+    header = read_key_header(data=data)
+    index_bits = get_index_bits(cube_side_length=header.side_length)
+    width = KEY_MOVE_BITS + KEY_ANGLE_BITS + index_bits
+
+    # Error check. The data should hold all the records.
+    body = np.frombuffer(data, dtype=np.uint8, offset=header.offset)
+    if body.size != math.ceil(header.key_count * width / 8):
+        raise ValueError(WRONG_KEY_DATA)
+
+    # Get the bits of each record and assemble the integers.
+    record_bits = np.unpackbits(body)[:header.key_count * width]
+    record = record_bits.reshape(-1, width).astype(np.int64) @ \
+        (1 << np.arange(width - 1, -1, -1, dtype=np.int64))
+
+    # Split each integer back to its fields.
+    move = record >> (KEY_ANGLE_BITS + index_bits)
+    angle = (record >> index_bits) & ((1 << KEY_ANGLE_BITS) - 1)
+    index = record & ((1 << index_bits) - 1)
+
+    # Error check. The move code should point to a legal move.
+    if np.any(move >= len(CUBE_MOVE)):
+        raise ValueError(WRONG_KEY_DATA)
+
+    return np.stack([move, angle * 90, index], axis=1)
+
+
+def decode_key_list(data: bytes) -> List[Key]:
+    """Unpack bytes into a list of keys.
+
+    :param data: The packed key.
+    :return: The list of keys.
+    """
+    return array_to_keys(key_array=decode_keys(data=data))
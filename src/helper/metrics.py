@@ -0,0 +1,247 @@
+"""Define the opt-in counters and timing histograms of the hot paths.
+
+The registry is off by default, so an instrumented function only pays for one
+attribute check. Turn it on with REGISTRY.enable(), or by setting the
+environment variable CUBECRYPTO_METRICS to 1 before the first import. Timed
+operations may be nested, for example shifting the cube content also
+initializes the faces again, so the time of an operation includes the time
+of the operations it calls.
+"""
+
+import bisect
+import functools
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Prefix of every metric name.
+METRIC_PREFIX = "cubecrypto"
+# Upper bounds of the timing histogram buckets in seconds.
+TIME_BUCKETS = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005,
+    0.01, 0.05, 0.1, 0.5, 1.0, 5.0
+)
+# Names of the metrics recorded by the instrumented code.
+OPERATION_SECONDS = "operation_seconds"
+BYTES_PROCESSED = "bytes_processed_total"
+CUBES_PROCESSED = "cubes_processed_total"
+# Escape sequences of the characters not allowed in label values.
+LABEL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+# Labels of a metric stored as a sorted tuple of name and value pairs.
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class MetricsRegistry:
+    """Hold counters and histograms, each identified by name and labels."""
+
+    def __init__(self, enabled: bool = False):
+        """Create an empty registry.
+
+        :param enabled: Whether the registry records from the start.
+        """
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, List[float]]] = {}
+
+    def enable(self):
+        """Start recording the metrics."""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording the metrics, the recorded values are kept."""
+        self.enabled = False
+
+    def reset(self):
+        """Remove all the recorded values."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def increment(self, name: str, value: float = 1, **labels: str):
+        """Add the value to a counter, if the registry is enabled.
+
+        :param name: Name of the counter.
+        :param value: The amount to add.
+        :param labels: Labels that tell apart counters with the same name.
+        """
+        if not self.enabled:
+            return
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            counter = self._counters.setdefault(name, {})
+            counter[key] = counter.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str):
+        """Record one value in a histogram, if the registry is enabled.
+
+        Each histogram is stored as the count of each bucket, including the
+        last unbounded one, followed by the total count and the sum.
+
+        :param name: Name of the histogram.
+        :param value: The value to record, in seconds for timings.
+        :param labels: Labels that tell apart histograms with the same name.
+        """
+        if not self.enabled:
+            return
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            histogram = self._histograms.setdefault(name, {}).setdefault(
+                key, [0] * (len(TIME_BUCKETS) + 3)
+            )
+            histogram[bisect.bisect_left(TIME_BUCKETS, value)] += 1
+            histogram[-2] += 1
+            histogram[-1] += value
+
+    def to_dict(self) -> dict:
+        """Export all recorded values as a dictionary.
+
+        :return: The counters and histograms, with cumulative bucket counts
+            keyed by their upper bound.
+        """
+        with self._lock:
+            return {
+                "counters": {
+                    name: [
+                        {"labels": dict(key), "value": value}
+                        for key, value in counter.items()
+                    ]
+                    for name, counter in self._counters.items()
+                },
+                "histograms": {
+                    name: [
+                        {
+                            "labels": dict(key),
+                            "buckets": self._get_cumulative_bucket(values),
+                            "count": values[-2],
+                            "sum": values[-1]
+                        }
+                        for key, values in histogram.items()
+                    ]
+                    for name, histogram in self._histograms.items()
+                }
+            }
+
+    @staticmethod
+    def _get_cumulative_bucket(values: List[float]) -> Dict[str, int]:
+        """Get the number of values up to each bucket bound."""
+        buckets, total = {}, 0
+        for bound, count in zip(TIME_BUCKETS + ("+Inf",), values):
+            total += count
+            buckets[str(bound)] = total
+        return buckets
+
+    @staticmethod
+    def _format_labels(labels: dict) -> str:
+        """Format labels in the Prometheus text format.
+
+        The backslash, the double quote and the line feed in each value are
+        escaped, as the exposition format requires.
+        """
+        if not labels:
+            return ""
+        return "{" + ",".join(
+            f'{name}="{str(value).translate(LABEL_ESCAPES)}"'
+            for name, value in labels.items()
+        ) + "}"
+
+    def to_prometheus(self) -> str:
+        """Export all recorded values in the Prometheus text format.
+
+        :return: The exposition text of all metrics.
+        """
+        exported = self.to_dict()
+        lines = []
+        for name, counters in exported["counters"].items():
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} counter")
+            lines.extend(
+                f"{METRIC_PREFIX}_{name}"
+                f"{self._format_labels(counter['labels'])} {counter['value']}"
+                for counter in counters
+            )
+        for name, histograms in exported["histograms"].items():
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} histogram")
+            for histogram in histograms:
+                for bound, count in histogram["buckets"].items():
+                    labels = self._format_labels(
+                        {**histogram["labels"], "le": bound}
+                    )
+                    lines.append(
+                        f"{METRIC_PREFIX}_{name}_bucket{labels} {count}"
+                    )
+                labels = self._format_labels(histogram["labels"])
+                lines.append(
+                    f"{METRIC_PREFIX}_{name}_sum{labels} {histogram['sum']}"
+                )
+                lines.append(
+                    f"{METRIC_PREFIX}_{name}_count{labels} "
+                    f"{histogram['count']}"
+                )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        """Write all recorded values in the Prometheus text format to a file.
+
+        The file is replaced at once, so a collector never reads half of it.
+
+        :param path: Path of the file to write.
+        """
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as metrics_file:
+            metrics_file.write(self.to_prometheus())
+        os.replace(temp_path, path)
+
+
+# The registry used by all instrumented code.
+REGISTRY = MetricsRegistry(
+    enabled=os.environ.get("CUBECRYPTO_METRICS", "0") == "1"
+)
+
+
+def timed(operation: str,
+          get_labels: Optional[Callable[..., Dict[str, str]]] = None,
+          **labels: str) -> Callable:
+    """Time each call of the decorated function, when metrics are enabled.
+
+    :param operation: Name of the operation being timed.
+    :param get_labels: A function of the first argument, such as the
+        instance of a method, that returns labels only known at call time.
+    :param labels: Extra labels of the timing, for example the engine.
+    :return: The decorator.
+    """
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            # Skip the timing entirely when the metrics are off.
+            if not REGISTRY.enabled:
+                return function(*args, **kwargs)
+
+            call_labels = labels if get_labels is None \
+                else {**labels, **get_labels(args[0])}
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                REGISTRY.observe(
+                    OPERATION_SECONDS,
+                    time.perf_counter() - start,
+                    operation=operation,
+                    **call_labels
+                )
+        return wrapper
+    return decorator
+
+
+def count_processed(cube_count: int, byte_count: int, **labels: str):
+    """Count the cubes and bytes processed, when metrics are enabled.
+
+    :param cube_count: Number of cubes processed.
+    :param byte_count: Number of bytes held by these cubes.
+    :param labels: Labels of the counts, for example the engine.
+    """
+    if not REGISTRY.enabled:
+        return
+    REGISTRY.increment(CUBES_PROCESSED, cube_count, **labels)
+    REGISTRY.increment(BYTES_PROCESSED, byte_count, **labels)
@@ -1,34 +1,61 @@
 """Define the helper functions that may accessed by different parts."""
 
-import binascii
+from __future__ import annotations
+
+import codecs
 import math
 import random
 from collections import deque
-from typing import List
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, TYPE_CHECKING
+
+from src.helper.constant import CUBE_MOVE, Key, MOVE_ANGLE, \
+    WRONG_BINARY_LENGTH, WRONG_BINARY_STRING
+from src.helper.metrics import timed
+
+# Without NumPy the text conversions fall back to the standard library.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-import pandas as pd
+# Pandas is slow to import, so the functions building frames load it.
+if TYPE_CHECKING:
+    import pandas as pd
 
-from src.helper.constant import CUBE_MOVE, Key, MOVE_ANGLE
 
+@lru_cache(maxsize=None)
+def load_pandas():
+    """Import pandas on the first call and return the module."""
+    import pandas
 
-def generate_random_keys(length: int, max_index: int) -> List[Key]:
+    return pandas
+
+
+def generate_random_keys(length: int,
+                         max_index: int,
+                         rng: Optional[random.Random] = None) -> List[Key]:
     """Generate a random key with cube moves for a certain size cube.
 
     :param length: Desired number of moves of the key.
     :param max_index: Max index of the cube side.
+    :param rng: The generator to draw from, the module one if not given.
     :return: A list of random keys.
     """
+    rng = random if rng is None else rng
     return [
         Key(
-            move=random.choice(CUBE_MOVE),
-            angle=random.choice(MOVE_ANGLE),
-            index=random.randint(1, max_index)
+            move=rng.choice(CUBE_MOVE),
+            angle=rng.choice(MOVE_ANGLE),
+            index=rng.randint(1, max_index)
         ) for _ in range(length)
     ]
 
 
 def get_key_table(key: List[Key]) -> pd.DataFrame:
     """Get a list of keys as a DataFrame."""
+    pd = load_pandas()
+
     # Extract the values from NamedTuple to list.
     key_value_list = [[key.move, key.index, key.angle] for key in key]
 
@@ -42,6 +69,8 @@ def get_key_table(key: List[Key]) -> pd.DataFrame:
 
 def get_cube_layout(cube_side_length: int) -> pd.DataFrame:
     """Show the cube layout by returning a DataFrame."""
+    pd = load_pandas()
+
     # Create the pandas DataFrame filled with 0.
     return pd.DataFrame(
         data=0,
@@ -100,32 +129,86 @@ def get_frame_index(cube_side_length: int) -> list:
     return list(index_queue)
 
 
+# The bits of each byte value, for converting text without NumPy.
+_BYTE_BITS = tuple(format(value, "08b") for value in range(256))
+
+
+def _binary_to_bytes(input_binary: str) -> bytes:
+    """Pack a binary string whose length is a multiple of 8 into bytes."""
+    # Error check. Stripping the bits should leave nothing behind.
+    if input_binary.strip("01"):
+        raise ValueError(WRONG_BINARY_STRING)
+
+    if np is None:
+        return bytes(
+            int(input_binary[start: start + 8], 2)
+            for start in range(0, len(input_binary), 8)
+        )
+    return np.packbits(
+        np.frombuffer(input_binary.encode("ascii"), dtype=np.uint8)
+        - ord("0")
+    ).tobytes()
+
+
+@timed("string_to_binary")
 def string_to_binary(input_string: str) -> str:
-    """Convert Ascii string to binary string.
+    """Convert a string to the binary string of its UTF-8 bytes.
 
-    :param input_string: An input Ascii encoded string.
-    :return: The binary encoded equivalence of the input Ascii string.
+    :param input_string: An input string.
+    :return: Eight bits for each byte of the UTF-8 encoded input string.
     """
-    byte_from_str = binascii.a2b_qp(input_string)
-    binary_from_byte = bin(int.from_bytes(byte_from_str, byteorder="big"))
-    binary_from_byte = binary_from_byte.replace("b", "")
-    # Make sure whatever being returned is multiple of 8.
-    return f"{'0' * (8 - len(binary_from_byte) % 8)}{binary_from_byte}" \
-        if len(binary_from_byte) % 8 != 0 \
-        else binary_from_byte
+    input_bytes = input_string.encode("utf-8")
+    if np is None:
+        return "".join(map(_BYTE_BITS.__getitem__, input_bytes))
+    return (np.unpackbits(
+        np.frombuffer(input_bytes, dtype=np.uint8)
+    ) + ord("0")).tobytes().decode("ascii")
 
 
+@timed("binary_to_string")
 def binary_to_string(input_binary: str) -> str:
-    """Convert a binary string to Ascii string.
+    """Convert a binary string of UTF-8 bytes back to the string.
 
-    :param input_binary: An input binary encoded string.
-    :return: The Ascii encoded equivalence of the input binary string.
+    :param input_binary: An input binary string, which is filled with zeros
+        at the front when its length is not a multiple of 8.
+    :return: The string decoded from the bytes of the input binary string.
     """
-    binary_from_str = int(input_binary, 2)
-    byte_from_binary = binary_from_str.to_bytes(
-        length=(binary_from_str.bit_length() + 7) // 8, byteorder="big"
-    )
-    return byte_from_binary.decode("utf-8")
+    return _binary_to_bytes(
+        "0" * (-len(input_binary) % 8) + input_binary
+    ).decode("utf-8")
+
+
+def iter_string_to_binary(input_strings: Iterable[str]) -> Iterator[str]:
+    """Convert a string given in chunks to binary strings, chunk by chunk.
+
+    :param input_strings: The chunks of the input string.
+    :return: A generator of the binary string of each chunk.
+    """
+    for input_string in input_strings:
+        yield string_to_binary(input_string=input_string)
+
+
+def iter_binary_to_string(input_binaries: Iterable[str]) -> Iterator[str]:
+    """Convert a binary string given in chunks of any length back to text.
+
+    The bits that do not fill a byte, and the bytes that do not finish a
+    character, are kept for the next chunk.
+
+    :param input_binaries: The chunks of the input binary string.
+    :return: A generator of the decoded text of each chunk.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    for input_binary in input_binaries:
+        input_binary = pending + input_binary
+        full_size = len(input_binary) // 8 * 8
+        pending = input_binary[full_size:]
+        yield decoder.decode(_binary_to_bytes(input_binary[:full_size]))
+
+    # Error check. The input should end on a whole character.
+    if pending:
+        raise ValueError(WRONG_BINARY_LENGTH)
+    yield decoder.decode(b"", final=True)
 
 
 def xor(str_one: str, str_two: str) -> str:
@@ -0,0 +1,51 @@
+import numpy as np
+
+from src.analyzers.avalanche_analyzer import AvalancheAnalyzer
+from src.engine.batch import encrypt_states
+from src.helper.constant import Key, WRONG_LINEAR_MAP_SIZE
+from src.helper.utility import generate_random_keys
+
+
+class TestAvalancheAnalyzer:
+    # Set up the key and the analyzer.
+    key = generate_random_keys(length=10, max_index=1)
+    analyzer = AvalancheAnalyzer(key=key, cube_side_length=3)
+
+    def test_flip_count(self):
+        # Flip each input bit of a random cube and count the changes.
+        state = np.random.default_rng(0).integers(
+            0, 2, size=(1, 216), dtype=np.uint8
+        )
+        flipped = np.repeat(state, 216, axis=0) ^ np.eye(216, dtype=np.uint8)
+        difference = encrypt_states(
+            states=flipped, key=self.key, cube_side_length=3
+        ) ^ encrypt_states(states=state, key=self.key, cube_side_length=3)
+
+        np.testing.assert_array_equal(
+            self.analyzer.get_avalanche_matrix(), difference.astype(bool)
+        )
+        np.testing.assert_array_equal(
+            self.analyzer.get_flip_count(), difference.sum(axis=1)
+        )
+
+    def test_summary_without_xor_spread(self):
+        # With one key, a random bit is spread to the five message faces.
+        analyzer = AvalancheAnalyzer(
+            key=[Key(move="left", angle=90, index=1)], cube_side_length=2
+        )
+        flip_count = analyzer.get_flip_count()
+        assert sorted(set(flip_count)) == [1, 6]
+        summary = analyzer.get_summary()
+        assert summary["min_flip"] == 1
+        assert summary["max_flip"] == 6
+        assert summary["min_dependency"] == 1
+
+
+class TestAvalancheAnalyzerErrorCheck:
+    def test_large_cube(self):
+        # The dense map of a cube of side 100 would take about 7 GB.
+        try:
+            AvalancheAnalyzer(key=[], cube_side_length=100)
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_LINEAR_MAP_SIZE
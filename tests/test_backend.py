@@ -0,0 +1,72 @@
+import random
+
+from src.encbit.encryption import Encryption as BitEncryption
+from src.encitem.encryption import Encryption as ItemEncryption
+from src.engine.backend import BACKENDS, get_backend, get_backend_names, \
+    register_backend
+from src.engine.numpy_cube import NumpyCube
+from src.helper.constant import WRONG_BACKEND
+from src.helper.utility import generate_random_keys
+
+
+def _encrypt(protocol_class, backend: str, key: list, seed: int):
+    """Encrypt the same message with the same random bits on a backend."""
+    random.seed(seed)
+    encryption = protocol_class(
+        message="Cubes all the way down!", cube_side_length=3, backend=backend
+    )
+    encryption.encrypt(key=key)
+    return encryption
+
+
+class TestBackend:
+    # Set up a key for the side length.
+    key = generate_random_keys(length=8, max_index=1)
+
+    def test_names(self):
+        assert {"pandas", "numpy"}.issubset(get_backend_names())
+
+    def test_bit_backend(self):
+        reference = _encrypt(BitEncryption, "pandas", self.key, seed=0)
+        for backend in get_backend_names():
+            encryption = _encrypt(BitEncryption, backend, self.key, seed=0)
+            assert encryption.get_current_binary() == \
+                reference.get_current_binary()
+            assert encryption.get_decrypted_str() == \
+                "Cubes all the way down!"
+
+    def test_item_backend(self):
+        reference = _encrypt(ItemEncryption, "pandas", self.key, seed=1)
+        for backend in get_backend_names():
+            encryption = _encrypt(ItemEncryption, backend, self.key, seed=1)
+            assert encryption.get_current_content() == \
+                reference.get_current_content()
+            assert encryption.get_decrypted_str() == "cubesallthewaydown"
+
+    def test_register(self):
+        def get_column_cube(cube_input, cube_side_length, item):
+            return NumpyCube(
+                cube_input=cube_input,
+                cube_side_length=cube_side_length,
+                item=item,
+                layout="column"
+            )
+
+        register_backend(name="column", backend=get_column_cube)
+        try:
+            assert get_backend(name="column") is get_column_cube
+            encryption = _encrypt(BitEncryption, "column", self.key, seed=0)
+            assert encryption.get_current_binary() == _encrypt(
+                BitEncryption, "pandas", self.key, seed=0
+            ).get_current_binary()
+        finally:
+            del BACKENDS["column"]
+
+
+class TestBackendErrorCheck:
+    def test_backend(self):
+        try:
+            get_backend(name="fortran")
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_BACKEND
@@ -0,0 +1,129 @@
+import random
+
+import numpy as np
+
+from src.encbit.cube import Cube
+from src.engine.batch import decrypt_states, decrypt_states_by_row, \
+    encrypt_states, encrypt_states_by_row, get_key_batch, xor_random_face
+from src.helper.constant import WRONG_KEY_COUNT
+from src.helper.utility import generate_random_keys
+
+
+class TestBatch:
+    # Set up random cube contents and a key.
+    states = np.random.default_rng(0).integers(
+        0, 2, size=(5, 216), dtype=np.uint8
+    )
+    key = generate_random_keys(length=10, max_index=1)
+
+    def test_xor(self):
+        cube = Cube(
+            cube_input="".join(map(str, self.states[0])), cube_side_length=3
+        )
+        cube.xor()
+        assert "".join(map(str, xor_random_face(
+            states=self.states, cube_side_length=3
+        )[0])) == cube.content
+
+    def test_encrypt(self):
+        cube = Cube(
+            cube_input="".join(map(str, self.states[0])), cube_side_length=3
+        )
+        for each_key in self.key:
+            cube.xor()
+            cube.shift_cubie_content()
+            cube.shift(key=each_key)
+        assert "".join(map(str, encrypt_states(
+            states=self.states, key=self.key, cube_side_length=3
+        )[0])) == cube.content
+
+    def test_decrypt(self):
+        key = generate_random_keys(length=20, max_index=2)
+        states = np.array(
+            [[random.randint(0, 1) for _ in range(384)] for _ in range(3)],
+            dtype=np.uint8
+        )
+        np.testing.assert_array_equal(
+            decrypt_states(
+                states=encrypt_states(
+                    states=states, key=key, cube_side_length=4
+                ),
+                key=key,
+                cube_side_length=4
+            ),
+            states
+        )
+
+    def test_empty(self):
+        states = np.zeros((0, 216), dtype=np.uint8)
+        for function in [encrypt_states, decrypt_states]:
+            assert function(
+                states=states, key=self.key, cube_side_length=3
+            ).shape == (0, 216)
+
+
+class TestBatchByRow:
+    # Set up random cube contents and keys of different lengths.
+    states = np.random.default_rng(1).integers(
+        0, 2, size=(6, 384), dtype=np.uint8
+    )
+    keys = [
+        generate_random_keys(length=length, max_index=2)
+        for length in [0, 1, 5, 10, 10, 3]
+    ]
+
+    def test_key_batch(self):
+        key_array, active = get_key_batch(keys=self.keys)
+        assert key_array.shape == (6, 10, 3)
+        assert active.sum(axis=1).tolist() == [0, 1, 5, 10, 10, 3]
+
+    def test_encrypt(self):
+        key_array, active = get_key_batch(keys=self.keys)
+        encrypted = encrypt_states_by_row(
+            states=self.states,
+            key_array=key_array,
+            active=active,
+            cube_side_length=4
+        )
+        for state, key, each_encrypted in zip(
+                self.states, self.keys, encrypted):
+            np.testing.assert_array_equal(
+                encrypt_states(
+                    states=state[None], key=key, cube_side_length=4
+                )[0],
+                each_encrypted
+            )
+
+    def test_decrypt(self):
+        key_array, active = get_key_batch(keys=self.keys)
+        np.testing.assert_array_equal(
+            decrypt_states_by_row(
+                states=encrypt_states_by_row(
+                    states=self.states,
+                    key_array=key_array,
+                    active=active,
+                    cube_side_length=4
+                ),
+                key_array=key_array,
+                active=active,
+                cube_side_length=4
+            ),
+            self.states
+        )
+
+
+class TestBatchByRowErrorCheck:
+    def test_key_count(self):
+        key_array, active = get_key_batch(
+            keys=[generate_random_keys(length=2, max_index=1)]
+        )
+        try:
+            encrypt_states_by_row(
+                states=np.zeros((2, 96), dtype=np.uint8),
+                key_array=key_array,
+                active=active,
+                cube_side_length=2
+            )
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_KEY_COUNT
@@ -0,0 +1,54 @@
+import json
+import random
+
+from benchmarks.suite import compare, FULL_MESSAGE_SIZES, \
+    FULL_SIDE_LENGTHS, get_case, run_suite
+
+
+class TestBenchmarks:
+    # Run the quickest cases of the suite once.
+    results = run_suite(
+        cases=get_case(side_lengths=[2], message_sizes=[]),
+        repeat=1,
+        name_filter="cubie"
+    )
+
+    def test_run_suite(self):
+        assert [result["name"] for result in self.results["results"]] == \
+            ["cubie.rotate_by_angle"]
+        assert self.results["results"][0]["seconds"] > 0
+        # The results should be machine-readable.
+        assert json.loads(json.dumps(self.results)) == self.results
+
+    def test_get_case(self):
+        names = {
+            case.name
+            for case in get_case(side_lengths=[2, 3], message_sizes=[1024])
+        }
+        assert {
+            "cube.shift", "cube.xor", "cube.shift_cubie_content",
+            "encbit.encrypt", "encitem.decrypt", "key_analyzer.analyze"
+        } <= names
+
+    def test_lazy_case(self):
+        # Building the full sweep neither holds inputs nor reseeds random.
+        state = random.getstate()
+        cases = get_case(
+            side_lengths=FULL_SIDE_LENGTHS, message_sizes=FULL_MESSAGE_SIZES
+        )
+        assert random.getstate() == state
+        assert len(cases) > 1000
+
+    def test_compare(self):
+        baseline = {"results": [
+            {"name": "a", "params": {"n": 1}, "seconds": 1.0},
+            {"name": "b", "params": {}, "seconds": 1.0}
+        ]}
+        results = {"results": [
+            {"name": "a", "params": {"n": 1}, "seconds": 1.5},
+            {"name": "b", "params": {}, "seconds": 1.1},
+            {"name": "c", "params": {}, "seconds": 1.0}
+        ]}
+        comparison = compare(results=results, baseline=baseline)
+        assert [each["name"] for each in comparison] == ["a", "b"]
+        assert [each["regression"] for each in comparison] == [True, False]
@@ -1,4 +1,4 @@
-from src.analyzers.bit_analyzer import analyze_bit
+from src.analyzers.bit_analyzer import analyze_bit, analyze_bit_batch
 from src.helper.utility import generate_random_keys
 
 
@@ -11,3 +11,33 @@ def test_bit_analyzer():
         message_bits="0" * 180
     )
     assert result["0"] == 216
+
+
+def test_bit_analyzer_batch():
+    key = generate_random_keys(length=5, max_index=1)
+    message_bits = ["0" * 180, "1" * 180, "01" * 90]
+    random_bits = ["0" * 36, "1" * 36, "10" * 18]
+    result = analyze_bit_batch(
+        key=key,
+        side_length=3,
+        random_bits=random_bits,
+        message_bits=message_bits
+    )
+    for index in range(3):
+        assert analyze_bit(
+            key=key,
+            side_length=3,
+            random_bits=random_bits[index],
+            message_bits=message_bits[index]
+        ) == {"0": result["0"][index], "1": result["1"][index]}
+    assert result["summary"]["sample_size"] == 3
+
+
+def test_bit_analyzer_batch_generated():
+    key = generate_random_keys(length=10, max_index=2)
+    result = analyze_bit_batch(
+        key=key, side_length=4, sample_size=1000, batch_size=300, seed=0
+    )
+    assert len(result["1"]) == 1000
+    assert all(result["0"] + result["1"] == 384)
+    assert abs(result["summary"]["bias"]) < 0.05
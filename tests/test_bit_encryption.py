@@ -1,5 +1,7 @@
-from src.encbit.encryption import Encryption
+from src.encbit.cube import Cube
+from src.encbit.encryption import decrypt_many, encrypt_many, Encryption
 from src.helper.constant import Key
+from src.helper.utility import generate_random_keys
 
 
 # noinspection PyProtectedMember
@@ -29,3 +31,40 @@ class TestEncryptionOneCube:
 
     def test_decrypt(self):
         assert self.protocol.get_decrypted_str() == self.message
+
+
+class TestEncryptionMany:
+    # Set messages of different lengths and a key.
+    messages = ["A", "Hello", "AaBbCcDdEeFfGgHhIiJjKkLlMmNnOoPpQqRrSsTt" * 3]
+    key = generate_random_keys(length=10, max_index=1)
+    binaries = encrypt_many(messages=messages, key=key, cube_side_length=3)
+
+    def test_length(self):
+        assert [len(binary) for binary in self.binaries] == [
+            len(Encryption(
+                message=message, cube_side_length=3
+            ).get_current_binary())
+            for message in self.messages
+        ]
+
+    def test_cube(self):
+        # Each cube should decrypt with the reference cube.
+        cube = Cube(cube_input=self.binaries[0], cube_side_length=3)
+        for each_key in reversed(self.key):
+            cube.shift(key=each_key._replace(angle=360 - each_key.angle))
+            cube.shift_cubie_content_back()
+            cube.xor()
+        assert cube.message_content.rstrip("0")[:-1] == "01000001"
+
+    def test_decrypt(self):
+        assert decrypt_many(
+            binaries=self.binaries, key=self.key, cube_side_length=3
+        ) == self.messages
+
+    def test_empty(self):
+        assert encrypt_many(
+            messages=[], key=self.key, cube_side_length=3
+        ) == []
+        assert decrypt_many(
+            binaries=[], key=self.key, cube_side_length=3
+        ) == []
@@ -0,0 +1,58 @@
+import numpy as np
+
+from src.engine.batch import encrypt_states
+from src.engine.bitslice import decrypt_states_bitsliced, \
+    encrypt_states_bitsliced, pack_lanes, unpack_lanes
+from src.helper.utility import generate_random_keys
+
+
+class TestBitslice:
+    # Set up a batch that does not fill the last word.
+    states = np.random.default_rng(0).integers(
+        0, 2, size=(70, 216), dtype=np.uint8
+    )
+    key = generate_random_keys(length=10, max_index=1)
+
+    def test_pack_lanes(self):
+        lanes = pack_lanes(states=self.states)
+        assert lanes.shape == (216, 2)
+        assert lanes.dtype == np.uint64
+        assert int(lanes[5, 1]) == int("".join(
+            map(str, self.states[64:, 5][::-1])
+        ), 2)
+
+    def test_unpack_lanes(self):
+        np.testing.assert_array_equal(
+            unpack_lanes(lanes=pack_lanes(states=self.states), cube_count=70),
+            self.states
+        )
+
+    def test_encrypt(self):
+        np.testing.assert_array_equal(
+            encrypt_states_bitsliced(
+                states=self.states, key=self.key, cube_side_length=3
+            ),
+            encrypt_states(
+                states=self.states, key=self.key, cube_side_length=3
+            )
+        )
+
+    def test_decrypt(self):
+        np.testing.assert_array_equal(
+            decrypt_states_bitsliced(
+                states=encrypt_states_bitsliced(
+                    states=self.states, key=self.key, cube_side_length=3
+                ),
+                key=self.key,
+                cube_side_length=3
+            ),
+            self.states
+        )
+
+    def test_empty(self):
+        states = np.zeros((0, 216), dtype=np.uint8)
+        assert pack_lanes(states=states).shape == (216, 0)
+        for function in [encrypt_states_bitsliced, decrypt_states_bitsliced]:
+            assert function(
+                states=states, key=self.key, cube_side_length=3
+            ).shape == (0, 216)
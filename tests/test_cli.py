@@ -0,0 +1,106 @@
+import json
+
+from src.__main__ import main
+from src.helper.constant import WRONG_CHUNK_SIZE, WRONG_CUBE_SIDE_LENGTH, \
+    WRONG_KEY_SIDE_LENGTH, WRONG_WORKER_COUNT
+from src.helper.key_codec import read_key_header
+
+
+class TestCli:
+    def test_round_trip(self, tmp_path):
+        key_path = str(tmp_path / "cube.key")
+        assert main([
+            "keygen", "--side-length", "3", "--length", "5",
+            "--output", key_path
+        ]) == 0
+        with open(key_path, "rb") as key_file:
+            assert read_key_header(key_file.read()).key_count == 5
+
+        (tmp_path / "message.txt").write_bytes(b"Hello, cube!\n" * 100)
+        assert main([
+            "encrypt", "--key", key_path,
+            "--input", str(tmp_path / "message.txt"),
+            "--output", str(tmp_path / "message.ccub"),
+            "--chunk-size", "100", "--codec", "zlib"
+        ]) == 0
+        assert main([
+            "decrypt", "--key", key_path,
+            "--input", str(tmp_path / "message.ccub"),
+            "--output", str(tmp_path / "decrypted.txt")
+        ]) == 0
+        assert (tmp_path / "decrypted.txt").read_bytes() == \
+            b"Hello, cube!\n" * 100
+
+    def test_append(self, tmp_path):
+        key_path = str(tmp_path / "cube.key")
+        main(["keygen", "--side-length", "2", "--output", key_path])
+        for line in [b"first line\n", b"second line\n"]:
+            (tmp_path / "line.txt").write_bytes(line)
+            assert main([
+                "append", "--key", key_path,
+                "--input", str(tmp_path / "line.txt"),
+                "--output", str(tmp_path / "log.ccub")
+            ]) == 0
+        assert main([
+            "decrypt", "--key", key_path,
+            "--input", str(tmp_path / "log.ccub"),
+            "--output", str(tmp_path / "log.txt")
+        ]) == 0
+        assert (tmp_path / "log.txt").read_bytes() == \
+            b"first line\nsecond line\n"
+
+    def test_side_length(self, tmp_path, capsys):
+        key_path = str(tmp_path / "cube.key")
+        main(["keygen", "--side-length", "3", "--output", key_path])
+        assert main([
+            "encrypt", "--key", key_path, "--side-length", "4",
+            "--input", key_path, "--output", str(tmp_path / "out")
+        ]) == 1
+        assert WRONG_KEY_SIDE_LENGTH in capsys.readouterr().err
+
+    def test_decrypt_side_length(self, tmp_path, capsys):
+        for side_length in ["2", "3"]:
+            main([
+                "keygen", "--side-length", side_length,
+                "--output", str(tmp_path / f"{side_length}.key")
+            ])
+        main([
+            "encrypt", "--key", str(tmp_path / "2.key"),
+            "--input", str(tmp_path / "2.key"),
+            "--output", str(tmp_path / "out")
+        ])
+        assert main([
+            "decrypt", "--key", str(tmp_path / "3.key"),
+            "--input", str(tmp_path / "out"),
+            "--output", str(tmp_path / "decrypted")
+        ]) == 1
+        assert WRONG_KEY_SIDE_LENGTH in capsys.readouterr().err
+
+    def test_keygen_side_length(self, tmp_path, capsys):
+        assert main([
+            "keygen", "--side-length", "1",
+            "--output", str(tmp_path / "cube.key")
+        ]) == 1
+        assert WRONG_CUBE_SIDE_LENGTH in capsys.readouterr().err
+
+    def test_stream_argument(self, tmp_path, capsys):
+        key_path = str(tmp_path / "cube.key")
+        main(["keygen", "--side-length", "2", "--output", key_path])
+        for command in ["encrypt", "append"]:
+            for option, error in [("--chunk-size", WRONG_CHUNK_SIZE),
+                                  ("--workers", WRONG_WORKER_COUNT)]:
+                assert main([
+                    command, "--key", key_path, "--input", key_path,
+                    "--output", str(tmp_path / "out"), option, "0"
+                ]) == 1
+                assert error in capsys.readouterr().err
+        assert not (tmp_path / "out").exists()
+        assert main(["bench", "--chunk-size", "-1"]) == 1
+        assert WRONG_CHUNK_SIZE in capsys.readouterr().err
+
+    def test_bench(self, capsys):
+        assert main(["bench", "--side-length", "2", "--size", "1000"]) == 0
+        result = json.loads(capsys.readouterr().out)
+        assert result["correct"]
+        # Each cube holds ten bytes, plus one cube for the padding.
+        assert result["cubes"] == 101
@@ -0,0 +1,60 @@
+import numpy as np
+
+from src.analyzers.cycle_analyzer import CycleAnalyzer, get_cycle_length
+from src.encbit.cube import Cube
+from src.helper.constant import Key, WRONG_CUBE_INDEX
+from src.helper.key_codec import keys_to_array
+from src.helper.utility import generate_random_keys
+
+
+class TestCycleAnalyzer:
+    def test_cycle_length(self):
+        np.testing.assert_array_equal(
+            get_cycle_length(permutations=np.array([[1, 2, 0, 3, 5, 4]])),
+            [[3, 3, 3, 1, 2, 2]]
+        )
+
+    def test_order(self):
+        # Four quarter turns of any layer return the cube to the start, the
+        # outer layer moves the bits of 12 ring and 9 face cubies in 4-cycles.
+        result = CycleAnalyzer(cube_side_length=3).analyze(
+            key=[Key(move="right", angle=90, index=1)]
+        )
+        assert result["order"] == 4
+        assert result["cycle_length"] == {1: 132, 4: 21}
+        assert result["fixed_points"] == 132
+        assert result["cycle_count"] == 153
+
+    def test_replay(self):
+        # Repeating the key order times gives back the input.
+        key = generate_random_keys(length=4, max_index=1)
+        result = CycleAnalyzer(cube_side_length=2).analyze(key=key)
+        cube_input = "".join(str(index % 2) for index in range(96))
+        cube = Cube(cube_input=cube_input, cube_side_length=2)
+        for _ in range(result["order"]):
+            for each_key in key:
+                cube.shift(key=each_key)
+        assert cube.content == cube_input
+
+    def test_screen(self):
+        analyzer = CycleAnalyzer(cube_side_length=4, with_shift=True)
+        keys = [generate_random_keys(length=5, max_index=2) for _ in range(20)]
+        screen = analyzer.screen(
+            key_array=np.stack([keys_to_array(key=key) for key in keys]),
+            max_order=1000,
+            chunk_size=6
+        )
+        for index, key in enumerate(keys):
+            result = analyzer.analyze(key=key)
+            assert screen["order"][index] == min(result["order"], 1001)
+            assert screen["fixed_points"][index] == result["fixed_points"]
+            assert screen["weak"][index] == (result["order"] <= 1000)
+
+    def test_wrong_index(self):
+        try:
+            CycleAnalyzer(cube_side_length=2).screen(
+                key_array=[[[0, 90, 2]]], max_order=10
+            )
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_CUBE_INDEX
@@ -0,0 +1,98 @@
+import numpy as np
+
+import src.helper.key_codec as key_codec
+from src.helper.constant import Key, WRONG_CUBE_MOVE, WRONG_KEY_DATA, \
+    WRONG_KEY_INDEX, WRONG_ROTATION_ANGLE
+from src.helper.utility import generate_random_keys
+
+
+class TestKeyCodec:
+    # Set up the test key.
+    key = [
+        Key(move="right", angle=90, index=1),
+        Key(move="top", angle=180, index=2),
+        Key(move="back", angle=270, index=1)
+    ]
+
+    def test_index_bits(self):
+        assert key_codec.get_index_bits(cube_side_length=2) == 1
+        assert key_codec.get_index_bits(cube_side_length=5) == 2
+        assert key_codec.get_index_bits(cube_side_length=16) == 4
+
+    def test_key_array(self):
+        key_array = key_codec.keys_to_array(key=self.key)
+        np.testing.assert_array_equal(
+            key_array, [[0, 90, 1], [2, 180, 2], [5, 270, 1]]
+        )
+        assert key_codec.array_to_keys(key_array=key_array) == self.key
+
+    def test_encode_size(self):
+        # Each key takes 3 + 2 + 2 bits on a 5 by 5 by 5 cube.
+        packed = key_codec.encode_keys(key=self.key, cube_side_length=5)
+        assert len(packed) == 4 + 1 + 1 + 1 + 3
+
+    def test_round_trip(self):
+        key = generate_random_keys(length=1000, max_index=8)
+        packed = key_codec.encode_keys(key=key, cube_side_length=16)
+        assert key_codec.decode_key_list(data=packed) == key
+        assert key_codec.read_key_header(data=packed) == \
+            key_codec.KeyHeader(side_length=16, key_count=1000, offset=8)
+
+    def test_round_trip_array(self):
+        key_array = key_codec.keys_to_array(key=self.key)
+        packed = key_codec.encode_keys(key=key_array, cube_side_length=4)
+        np.testing.assert_array_equal(
+            key_codec.decode_keys(data=packed), key_array
+        )
+
+    def test_full_turn(self):
+        packed = key_codec.encode_keys(
+            key=[Key(move="left", angle=360, index=1)], cube_side_length=3
+        )
+        assert key_codec.decode_key_list(data=packed) == \
+            [Key(move="left", angle=0, index=1)]
+
+    def test_empty(self):
+        packed = key_codec.encode_keys(key=[], cube_side_length=3)
+        assert key_codec.decode_key_list(data=packed) == []
+
+
+class TestKeyCodecErrorCheck:
+    def test_wrong_move(self):
+        try:
+            key_codec.encode_keys(
+                key=[Key(move="abracadabra", angle=90, index=1)],
+                cube_side_length=3
+            )
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_CUBE_MOVE
+
+    def test_wrong_index(self):
+        try:
+            key_codec.encode_keys(
+                key=[Key(move="left", angle=90, index=2)],
+                cube_side_length=3
+            )
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_KEY_INDEX
+
+    def test_wrong_angle(self):
+        try:
+            key_codec.encode_keys(
+                key=[Key(move="left", angle=45, index=1)],
+                cube_side_length=3
+            )
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_ROTATION_ANGLE
+
+    def test_wrong_data(self):
+        packed = key_codec.encode_keys(key=[], cube_side_length=3)
+        for data in [b"abracadabra", packed + b"\x00", packed[:-1]]:
+            try:
+                key_codec.decode_keys(data=data)
+                raise AssertionError("Error message did not raise.")
+            except ValueError as error:
+                assert str(error) == WRONG_KEY_DATA
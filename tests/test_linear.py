@@ -0,0 +1,53 @@
+import numpy as np
+
+from src.engine.batch import encrypt_states
+from src.engine.linear import apply_linear_map, compile_linear_map, \
+    get_dependency_count
+from src.helper.constant import WRONG_LINEAR_MAP_SIZE
+from src.helper.utility import generate_random_keys
+
+
+class TestLinear:
+    # Set up random cube contents and a key.
+    states = np.random.default_rng(0).integers(
+        0, 2, size=(4, 216), dtype=np.uint8
+    )
+    key = generate_random_keys(length=8, max_index=1)
+    linear_map = compile_linear_map(key=key, cube_side_length=3)
+
+    def test_compile_empty(self):
+        np.testing.assert_array_equal(
+            np.unpackbits(
+                compile_linear_map(key=[], cube_side_length=2), axis=1
+            ),
+            np.eye(96)
+        )
+
+    def test_apply(self):
+        np.testing.assert_array_equal(
+            apply_linear_map(linear_map=self.linear_map, states=self.states),
+            encrypt_states(states=self.states, key=self.key,
+                           cube_side_length=3)
+        )
+
+    def test_dependency_count(self):
+        matrix = np.unpackbits(self.linear_map, axis=1)
+        np.testing.assert_array_equal(
+            get_dependency_count(
+                linear_map=self.linear_map, axis=0, chunk_size=100
+            ),
+            matrix.sum(axis=0)
+        )
+        np.testing.assert_array_equal(
+            get_dependency_count(linear_map=self.linear_map, axis=1),
+            matrix.sum(axis=1)
+        )
+
+
+class TestLinearErrorCheck:
+    def test_map_size(self):
+        try:
+            compile_linear_map(key=[], cube_side_length=2, max_bytes=1000)
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_LINEAR_MAP_SIZE
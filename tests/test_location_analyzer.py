@@ -1,7 +1,10 @@
 import numpy as np
 
-from src.analyzers.location_analyzer import CubieLocationAnalyzer
+from src.analyzers.location_analyzer import CubieLocationAnalyzer, \
+    get_destination_table, get_location_table, iter_location, track_location
+from src.encbit.cube import Cube
 from src.helper.constant import CUBE_MOVE, Key, MOVE_ANGLE
+from src.helper.utility import generate_random_keys
 
 
 # noinspection PyProtectedMember
@@ -57,3 +60,61 @@ class TestCubieLocationAnalyzer:
         np.testing.assert_array_equal(
             analyzer.location_tracker(keys=keys), [0, 37, 110, 183]
         )
+
+    def test_location_table(self):
+        keys, table = get_location_table(cube_side_length=3)
+        assert table.shape == (len(keys), 216)
+        assert keys[0] == Key(move="right", angle=90, index=1)
+
+        # Every row should agree with the analyzer of each position.
+        for location in [0, 37, 100, 215]:
+            analyzer = CubieLocationAnalyzer(
+                cube_side_length=3, track_item_location=location
+            )
+            np.testing.assert_array_equal(
+                table[:, location],
+                [analyzer._get_location(key=key) for key in keys]
+            )
+
+    def test_destination_table(self):
+        keys, table = get_destination_table(cube_side_length=4)
+        # Each key only moves the items around, so each row is a permutation.
+        for row in table:
+            np.testing.assert_array_equal(np.sort(row), np.arange(384))
+
+    def test_location_tracker_full_turn(self):
+        analyzer = CubieLocationAnalyzer(
+            cube_side_length=3, track_item_location=0
+        )
+        assert analyzer.location_tracker(
+            keys=[Key(move="left", angle=360, index=1)]
+        ) == [0, 1]
+
+    def test_track_location(self):
+        keys = generate_random_keys(length=30, max_index=1)
+        locations = track_location(
+            cube_side_length=3, track_item_locations=range(216), keys=keys
+        )
+        assert locations.shape == (31, 216)
+
+        # Each column should agree with tracking the item on the cube.
+        for location in [0, 1, 150]:
+            cube = Cube(
+                cube_input="_" * 216,
+                cube_side_length=3,
+                track_location=location
+            )
+            expected = [location]
+            for key in keys:
+                cube.shift(key=key)
+                cube.shift_cubie_content()
+                expected.append(cube.get_tracked_location())
+            np.testing.assert_array_equal(locations[:, location], expected)
+
+    def test_iter_location(self):
+        keys = iter(generate_random_keys(length=10, max_index=2))
+        steps = list(iter_location(
+            cube_side_length=4, track_item_locations=[3, 7], keys=keys
+        ))
+        assert len(steps) == 11
+        np.testing.assert_array_equal(steps[0], [3, 7])
@@ -0,0 +1,155 @@
+from typing import Optional
+
+from src.encbit.encryption import Encryption as BitEncryption
+from src.encitem.encryption import Encryption as ItemEncryption
+from src.engine.backend import get_backend_names
+from src.helper.metrics import BYTES_PROCESSED, CUBES_PROCESSED, \
+    MetricsRegistry, OPERATION_SECONDS, REGISTRY
+from src.helper.utility import generate_random_keys
+
+
+def _get_operation(exported: dict,
+                   engine: str,
+                   backend: Optional[str] = None) -> dict:
+    """Map each timed operation of the engine to its number of calls."""
+    return {
+        histogram["labels"]["operation"]: histogram["count"]
+        for histogram in exported["histograms"][OPERATION_SECONDS]
+        if histogram["labels"].get("engine") == engine
+        and backend in (None, histogram["labels"].get("backend"))
+    }
+
+
+class TestMetrics:
+    def test_disabled(self):
+        registry = MetricsRegistry()
+        registry.increment("counter")
+        registry.observe("histogram", 0.1)
+        assert registry.to_dict() == {"counters": {}, "histograms": {}}
+
+    def test_counter(self):
+        registry = MetricsRegistry(enabled=True)
+        registry.increment("counter", engine="encbit")
+        registry.increment("counter", 2, engine="encbit")
+        registry.increment("counter", engine="encitem")
+        assert registry.to_dict()["counters"]["counter"] == [
+            {"labels": {"engine": "encbit"}, "value": 3},
+            {"labels": {"engine": "encitem"}, "value": 1}
+        ]
+
+    def test_histogram(self):
+        registry = MetricsRegistry(enabled=True)
+        registry.observe("histogram", 0.00002)
+        registry.observe("histogram", 0.2)
+        registry.observe("histogram", 10)
+        histogram = registry.to_dict()["histograms"]["histogram"][0]
+        assert histogram["count"] == 3
+        assert histogram["buckets"]["5e-05"] == 1
+        assert histogram["buckets"]["0.5"] == 2
+        assert histogram["buckets"]["+Inf"] == 3
+
+        # Reset and disable the registry.
+        registry.reset()
+        registry.disable()
+        registry.observe("histogram", 0.1)
+        assert registry.to_dict()["histograms"] == {}
+
+    def test_prometheus(self, tmp_path):
+        registry = MetricsRegistry(enabled=True)
+        registry.increment("counter", 5, engine="encbit")
+        registry.observe("histogram", 0.2, operation="shift")
+        path = tmp_path / "metrics.prom"
+        registry.write_prometheus(path=str(path))
+        text = path.read_text()
+        assert "# TYPE cubecrypto_counter counter" in text
+        assert 'cubecrypto_counter{engine="encbit"} 5' in text
+        assert "# TYPE cubecrypto_histogram histogram" in text
+        assert \
+            'cubecrypto_histogram_bucket{operation="shift",le="+Inf"} 1' \
+            in text
+        assert 'cubecrypto_histogram_count{operation="shift"} 1' in text
+
+    def test_prometheus_escape(self):
+        registry = MetricsRegistry(enabled=True)
+        registry.increment("counter", path='C:\\tmp\n"cube"')
+        assert 'cubecrypto_counter{path="C:\\\\tmp\\n\\"cube\\""} 1' \
+            in registry.to_prometheus()
+
+    def test_encbit(self):
+        REGISTRY.reset()
+        REGISTRY.enable()
+        try:
+            encryption = BitEncryption(
+                message="A", cube_side_length=2, backend="pandas"
+            )
+            encryption.encrypt(key=generate_random_keys(2, 1))
+            encryption.decrypt()
+            exported = REGISTRY.to_dict()
+        finally:
+            REGISTRY.disable()
+            REGISTRY.reset()
+
+        operation = _get_operation(exported=exported, engine="encbit")
+        assert operation["shift"] == 4
+        assert operation["xor"] == 4
+        assert operation["shift_content"] == 2
+        assert operation["shift_content_back"] == 2
+        assert operation["face_init"] > 0
+        assert exported["counters"][CUBES_PROCESSED] == [
+            {"labels": {"engine": "encbit", "operation": "encrypt"},
+             "value": 1},
+            {"labels": {"engine": "encbit", "operation": "decrypt"},
+             "value": 1}
+        ]
+        assert exported["counters"][BYTES_PROCESSED][0]["value"] == 12
+
+    def test_encitem(self):
+        REGISTRY.reset()
+        REGISTRY.enable()
+        try:
+            encryption = ItemEncryption(
+                message="abc", cube_side_length=2, backend="pandas"
+            )
+            encryption.encrypt(key=generate_random_keys(3, 1))
+            exported = REGISTRY.to_dict()
+        finally:
+            REGISTRY.disable()
+            REGISTRY.reset()
+
+        operation = _get_operation(exported=exported, engine="encitem")
+        assert operation["shift"] == 3
+        assert operation["shift_content"] == 3
+        assert exported["counters"][BYTES_PROCESSED][0]["value"] == 24
+
+    def test_backend(self):
+        # Every backend times the same operations of its cubes.
+        for backend in get_backend_names():
+            REGISTRY.reset()
+            REGISTRY.enable()
+            try:
+                encryption = BitEncryption(
+                    message="A", cube_side_length=2, backend=backend
+                )
+                encryption.encrypt(key=generate_random_keys(2, 1))
+                encryption.decrypt()
+                encryption = ItemEncryption(
+                    message="abc", cube_side_length=2, backend=backend
+                )
+                encryption.encrypt(key=generate_random_keys(3, 1))
+                exported = REGISTRY.to_dict()
+            finally:
+                REGISTRY.disable()
+                REGISTRY.reset()
+
+            operation = _get_operation(
+                exported=exported, engine="encbit", backend=backend
+            )
+            assert operation["shift"] == 4
+            assert operation["xor"] == 4
+            assert operation["shift_content"] == 2
+            assert operation["shift_content_back"] == 2
+            operation = _get_operation(
+                exported=exported, engine="encitem", backend=backend
+            )
+            assert operation["shift"] == 3
+            assert operation["shift_content"] == 3
@@ -0,0 +1,49 @@
+import numpy as np
+
+from src.analyzers.mixing_analyzer import MixingAnalyzer, \
+    recommend_key_length
+from src.encbit.cube import Cube
+from src.helper.constant import CUBE_MOVE, Key, MOVE_ANGLE
+
+
+# noinspection PyProtectedMember
+class TestMixingAnalyzer:
+    # Set up the analyzer.
+    analyzer = MixingAnalyzer(cube_side_length=2)
+
+    def test_step(self):
+        # Follow the first bit through every key on the actual cube.
+        cube_input = "".join(chr(0x100 + index) for index in range(96))
+        expected = np.zeros(96)
+        for move in CUBE_MOVE:
+            for angle in MOVE_ANGLE:
+                cube = Cube(cube_input=cube_input, cube_side_length=2)
+                cube.shift_cubie_content()
+                cube.shift(key=Key(move=move, angle=angle, index=1))
+                expected[cube.content.index(chr(0x100))] += 1 / 18
+
+        np.testing.assert_allclose(
+            self.analyzer._step(
+                distribution=self.analyzer._get_start(locations=[0])
+            )[:, 0],
+            expected
+        )
+
+    def test_distance(self):
+        distance = self.analyzer.get_distance(step=20, locations=[0, 50])
+        assert len(distance) == 20
+        assert distance[-1] < distance[0] < 1
+        assert distance[-1] < 0.01
+
+    def test_mixing_time(self):
+        mixing_time = self.analyzer.get_mixing_time(locations=[0, 50])
+        distance = self.analyzer.get_distance(
+            step=mixing_time, locations=[0, 50]
+        )
+        assert distance[-1] <= 0.25 < distance[-2]
+        assert self.analyzer.get_mixing_time(max_step=1) == -1
+
+    def test_recommend_key_length(self):
+        recommended = recommend_key_length(side_lengths=[2, 3, 4])
+        assert list(recommended) == [2, 3, 4]
+        assert recommended[2] < recommended[4]
@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from src.encbit.cube import Cube as BitCube
+from src.encitem.cube import Cube as ItemCube
+from src.engine.numpy_cube import LAYOUTS
+from src.helper.utility import generate_random_keys
+
+# The numba backend is optional, so skip these tests without Numba.
+pytest.importorskip("numba")
+
+from src.engine.numba_cube import NumbaCube  # noqa: E402
+
+
+class TestNumbaCube:
+    # Set up the inputs and a key.
+    bits = "".join(random.choice("01") for _ in range(216))
+    items = [chr(ord("a") + index % 26) for index in range(54)]
+    key = generate_random_keys(length=10, max_index=1)
+
+    def test_bit_cube(self):
+        for layout in LAYOUTS:
+            cube = BitCube(cube_input=self.bits, cube_side_length=3)
+            numba_cube = NumbaCube(
+                cube_input=self.bits, cube_side_length=3, layout=layout
+            )
+            for each_key in self.key:
+                for each_cube in [cube, numba_cube]:
+                    each_cube.xor()
+                    each_cube.shift_cubie_content()
+                    each_cube.shift(key=each_key)
+                assert numba_cube.content == cube.content
+
+    def test_bit_decrypt(self):
+        numba_cube = NumbaCube(cube_input=self.bits, cube_side_length=3)
+        for each_key in self.key:
+            numba_cube.xor()
+            numba_cube.shift_content()
+            numba_cube.shift(key=each_key)
+        for each_key in reversed(self.key):
+            numba_cube.shift(key=each_key._replace(angle=360 - each_key.angle))
+            numba_cube.shift_content_back()
+            numba_cube.xor()
+        assert numba_cube.content == self.bits
+
+    def test_item_cube(self):
+        cube = ItemCube(cube_input=self.items, cube_side_length=3)
+        numba_cube = NumbaCube(
+            cube_input=self.items, cube_side_length=3, item=True
+        )
+        for each_key in self.key:
+            for each_cube in [cube, numba_cube]:
+                each_cube.shift_content()
+                each_cube.shift(key=each_key)
+            assert numba_cube.content == cube.content
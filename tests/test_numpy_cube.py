@@ -0,0 +1,164 @@
+import random
+
+import numpy as np
+
+from src.encbit.cube import Cube as BitCube
+from src.encitem.cube import Cube as ItemCube
+from src.engine.numpy_cube import get_layout_permutation, LAYOUTS, NumpyCube
+from src.helper.constant import CUBE_MOVE, Key, WRONG_CUBE_INPUT, \
+    WRONG_CUBE_ITEM, WRONG_CUBE_LAYOUT, WRONG_UNDO_COUNT
+from src.helper.utility import generate_random_keys
+
+
+class TestNumpyCube:
+    # Set up the inputs and a key.
+    bits = "".join(random.choice("01") for _ in range(216))
+    items = [chr(ord("a") + index % 26) for index in range(54)]
+    key = generate_random_keys(length=10, max_index=1)
+
+    def test_bit_cube(self):
+        for layout in LAYOUTS:
+            cube = BitCube(cube_input=self.bits, cube_side_length=3)
+            numpy_cube = NumpyCube(
+                cube_input=self.bits, cube_side_length=3, layout=layout
+            )
+            for each_key in self.key:
+                for each_cube in [cube, numpy_cube]:
+                    each_cube.xor()
+                    each_cube.shift_cubie_content()
+                    each_cube.shift(key=each_key)
+                assert numpy_cube.content == cube.content
+            assert numpy_cube.random_content == cube.random_content
+
+    def test_bit_decrypt(self):
+        for layout in LAYOUTS:
+            numpy_cube = NumpyCube(
+                cube_input=self.bits, cube_side_length=3, layout=layout
+            )
+            for each_key in self.key:
+                numpy_cube.xor()
+                numpy_cube.shift_cubie_content()
+                numpy_cube.shift(key=each_key)
+            for each_key in reversed(self.key):
+                numpy_cube.shift(
+                    key=each_key._replace(angle=360 - each_key.angle)
+                )
+                numpy_cube.shift_cubie_content_back()
+                numpy_cube.xor()
+            assert numpy_cube.content == self.bits
+
+    def test_item_cube(self):
+        for layout in LAYOUTS:
+            cube = ItemCube(cube_input=self.items, cube_side_length=3)
+            numpy_cube = NumpyCube(
+                cube_input=self.items,
+                cube_side_length=3,
+                item=True,
+                layout=layout
+            )
+            for each_key in self.key:
+                for each_cube in [cube, numpy_cube]:
+                    each_cube.shift_content()
+                    each_cube.shift(key=each_key)
+                assert numpy_cube.content == cube.content
+
+    def test_layout(self):
+        # The column layout stores the first column of the top face first.
+        np.testing.assert_array_equal(
+            get_layout_permutation(
+                layout="column", cube_side_length=2, item=True
+            )[:4],
+            [0, 2, 1, 3]
+        )
+        cube = NumpyCube(
+            cube_input=self.bits, cube_side_length=3, layout="column"
+        )
+        assert "".join(map(str, cube.get_state())) == self.bits
+
+    def test_snapshot(self):
+        cube = NumpyCube(cube_input=self.bits, cube_side_length=3)
+        snapshot = cube.snapshot()
+        for each_key in self.key:
+            cube.xor()
+            cube.shift(key=each_key)
+        cube.restore(snapshot=snapshot)
+        assert cube.content == self.bits
+
+    def test_undo(self):
+        for layout in LAYOUTS:
+            cube = NumpyCube(
+                cube_input=self.bits,
+                cube_side_length=3,
+                layout=layout,
+                keep_history=True
+            )
+            contents = [cube.content]
+            for each_key in self.key:
+                cube.xor()
+                cube.shift_cubie_content()
+                cube.shift(key=each_key)
+                contents.append(cube.content)
+            assert cube.history_size == 30
+
+            # Undo one key of the encryption at a time.
+            for content in reversed(contents[:-1]):
+                cube.undo(count=3)
+                assert cube.content == content
+            assert cube.history_size == 0
+
+    def test_search(self):
+        # Visit every two basic keys from one state with undo.
+        bits = self.bits[:96] * 4
+        cube = NumpyCube(
+            cube_input=bits, cube_side_length=4, keep_history=True
+        )
+        basic_key = [
+            Key(move=move, angle=90, index=index)
+            for move in CUBE_MOVE for index in [1, 2]
+        ]
+        contents = set()
+        for first_key in basic_key:
+            cube.shift(key=first_key)
+            for second_key in basic_key:
+                cube.shift(key=second_key)
+                contents.add(cube.content)
+                cube.undo()
+            cube.undo()
+        assert cube.content == bits
+        assert len(contents) > len(basic_key)
+
+
+class TestNumpyCubeErrorCheck:
+    def test_wrong_input(self):
+        try:
+            NumpyCube(cube_input="0101", cube_side_length=2)
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_CUBE_INPUT
+
+    def test_wrong_undo(self):
+        try:
+            NumpyCube(cube_input="0" * 96, cube_side_length=2).undo()
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_UNDO_COUNT
+
+    def test_wrong_layout(self):
+        try:
+            NumpyCube(
+                cube_input="0" * 96, cube_side_length=2, layout="abracadabra"
+            )
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_CUBE_LAYOUT
+
+    def test_item_xor(self):
+        cube = NumpyCube(
+            cube_input=list(range(24)), cube_side_length=2, item=True
+        )
+        try:
+            cube.xor()
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_CUBE_ITEM
+        assert cube.content == list(range(24))
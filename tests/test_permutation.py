@@ -0,0 +1,141 @@
+import numpy as np
+
+from src.encbit.cube import Cube as BitCube
+from src.encitem.cube import Cube as ItemCube
+from src.engine import permutation
+from src.helper.constant import CUBE_MOVE, Key, MOVE_ANGLE, \
+    WRONG_CUBE_INDEX, WRONG_CUBE_MOVE
+
+
+class TestPermutation:
+    def test_bit_move_permutation(self):
+        for side_length in [2, 3, 4, 5]:
+            # Give every bit a different character to follow it.
+            size = permutation.get_cube_size(cube_side_length=side_length)
+            cube_input = "".join(chr(0x100 + index) for index in range(size))
+            for key in [
+                Key(move=move, angle=angle, index=index)
+                for move in CUBE_MOVE
+                for angle in MOVE_ANGLE
+                for index in range(1, side_length // 2 + 1)
+            ]:
+                cube = BitCube(
+                    cube_input=cube_input, cube_side_length=side_length
+                )
+                cube.shift(key=key)
+                np.testing.assert_array_equal(
+                    [ord(char) - 0x100 for char in cube.content],
+                    permutation.get_key_permutation(
+                        key=key, cube_side_length=side_length
+                    )
+                )
+
+    def test_item_move_permutation(self):
+        for side_length in [2, 3, 4, 5]:
+            for key in [
+                Key(move=move, angle=angle, index=index)
+                for move in CUBE_MOVE
+                for angle in MOVE_ANGLE
+                for index in range(1, side_length // 2 + 1)
+            ]:
+                cube = ItemCube(
+                    cube_input=list(range(side_length ** 2 * 6)),
+                    cube_side_length=side_length
+                )
+                cube.shift(key=key)
+                np.testing.assert_array_equal(
+                    cube.content,
+                    permutation.get_key_permutation(
+                        key=key, cube_side_length=side_length, item=True
+                    )
+                )
+
+    def test_compile_key(self):
+        key = [
+            Key(move="left", angle=90, index=1),
+            Key(move="top", angle=180, index=2),
+            Key(move="front", angle=270, index=1)
+        ]
+        compiled = permutation.compile_key(key=key, cube_side_length=4)
+        inverse = permutation.compile_key(
+            key=[
+                each_key._replace(angle=360 - each_key.angle)
+                for each_key in reversed(key)
+            ],
+            cube_side_length=4
+        )
+        np.testing.assert_array_equal(
+            permutation.invert_permutation(compiled), inverse
+        )
+        np.testing.assert_array_equal(
+            permutation.compose_permutation(compiled, inverse),
+            np.arange(384)
+        )
+
+    def test_key_slices(self):
+        for item in [False, True]:
+            for side_length in [2, 3, 4, 5, 6]:
+                for key in [
+                    Key(move=move, angle=angle, index=index)
+                    for move in CUBE_MOVE
+                    for angle in MOVE_ANGLE + [360]
+                    for index in range(1, side_length // 2 + 1)
+                ]:
+                    content = np.arange(permutation.get_cube_size(
+                        cube_side_length=side_length, item=item
+                    ))
+                    permutation.apply_key(
+                        content=content,
+                        key=key,
+                        cube_side_length=side_length,
+                        item=item
+                    )
+                    np.testing.assert_array_equal(
+                        content,
+                        permutation.get_key_permutation(
+                            key=key, cube_side_length=side_length, item=item
+                        )
+                    )
+
+    def test_inner_move_size(self):
+        # An inner move only changes four rows of cubies.
+        destination, source = permutation.get_move_slices(
+            move="front", index=1, cube_side_length=500
+        )
+        assert destination.size == source.size == 500 * 4 * 4
+        assert set(destination) == set(source)
+
+    def test_content_shift(self):
+        np.testing.assert_array_equal(
+            permutation.get_content_shift_permutation(cube_size=4),
+            [3, 0, 1, 2]
+        )
+
+
+class TestPermutationErrorCheck:
+    def test_wrong_move(self):
+        try:
+            permutation.get_move_permutation(
+                move="abracadabra", index=1, cube_side_length=3
+            )
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_CUBE_MOVE
+
+    def test_wrong_index(self):
+        try:
+            permutation.get_move_permutation(
+                move="left", index=2, cube_side_length=3
+            )
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_CUBE_INDEX
+
+    def test_wrong_slices_index(self):
+        try:
+            permutation.get_move_slices(
+                move="left", index=2, cube_side_length=3
+            )
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_CUBE_INDEX
@@ -0,0 +1,108 @@
+import numpy as np
+
+from src.engine.linear import compile_linear_map
+from src.engine.permutation import compile_key, \
+    get_content_shift_permutation, get_key_permutation
+from src.engine.prefix_cache import PrefixCache
+from src.helper.constant import Key, WRONG_CACHE_SIZE
+from src.helper.utility import generate_random_keys
+
+
+class TestPrefixCache:
+    # Set up a key shared by the prefixes.
+    key = generate_random_keys(length=8, max_index=2)
+
+    def test_compile(self):
+        cache = PrefixCache(cube_side_length=4)
+        for length in range(len(self.key) + 1):
+            np.testing.assert_array_equal(
+                cache.compile(key=self.key[:length]),
+                compile_key(key=self.key[:length], cube_side_length=4)
+            )
+
+    def test_reuse_prefix(self):
+        cache = PrefixCache(cube_side_length=4)
+        cache.compile(key=self.key)
+        assert (cache.hits, cache.misses) == (0, 8)
+        assert len(cache) == 8
+
+        # Only the new key is performed on top of the cached prefix.
+        cache.compile(key=self.key + [Key(move="right", angle=90, index=1)])
+        assert (cache.hits, cache.misses) == (8, 9)
+
+    def test_full_angle(self):
+        cache = PrefixCache(cube_side_length=2)
+        cache.compile(key=[Key(move="top", angle=90, index=1)])
+        cache.compile(key=[Key(move="top", angle=450, index=1)])
+        assert cache.hits == 1
+
+    def test_eviction(self):
+        cache = PrefixCache(cube_side_length=4, max_bytes=384 * 8 * 3)
+        cache.compile(key=self.key)
+        assert len(cache) == 3
+        assert cache.nbytes <= 384 * 8 * 3
+        np.testing.assert_array_equal(
+            cache.compile(key=self.key[:2]),
+            compile_key(key=self.key[:2], cube_side_length=4)
+        )
+
+    def test_tiny_budget(self):
+        # A budget under one state keeps only the state stored last.
+        key = generate_random_keys(length=6, max_index=1)
+        for max_bytes in [0, 500]:
+            cache = PrefixCache(cube_side_length=2, max_bytes=max_bytes)
+            for length in [3, 6, 4, 6]:
+                np.testing.assert_array_equal(
+                    cache.compile(key=key[:length]),
+                    compile_key(key=key[:length], cube_side_length=2)
+                )
+                assert len(cache) == 1
+
+    def test_linear(self):
+        key = generate_random_keys(length=5, max_index=1)
+        cache = PrefixCache(cube_side_length=3, linear=True)
+        cache.compile(key=key[:3])
+        np.testing.assert_array_equal(
+            cache.compile(key=key), compile_linear_map(
+                key=key, cube_side_length=3
+            )
+        )
+
+    def test_with_shift(self):
+        cache = PrefixCache(cube_side_length=4, with_shift=True)
+        permutation = np.arange(384)
+        for each_key in self.key:
+            permutation = permutation[get_content_shift_permutation(384)][
+                get_key_permutation(key=each_key, cube_side_length=4)
+            ]
+        np.testing.assert_array_equal(
+            cache.compile(key=self.key), permutation
+        )
+
+    def test_iter_extension(self):
+        cache = PrefixCache(cube_side_length=4)
+        extensions = [
+            Key(move=move, angle=90, index=1) for move in ["top", "left"]
+        ]
+        for extension, permutation in cache.iter_extension(
+                key=self.key, extensions=extensions):
+            np.testing.assert_array_equal(permutation, compile_key(
+                key=self.key + [extension], cube_side_length=4
+            ))
+        assert cache.misses == 10
+
+    def test_clear(self):
+        cache = PrefixCache(cube_side_length=4)
+        cache.compile(key=self.key)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.nbytes == 0
+
+
+class TestPrefixCacheErrorCheck:
+    def test_cache_size(self):
+        try:
+            PrefixCache(cube_side_length=4, max_bytes=-1)
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_CACHE_SIZE
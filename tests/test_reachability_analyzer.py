@@ -0,0 +1,50 @@
+from itertools import chain
+
+from src.analyzers.location_analyzer import CubieLocationAnalyzer
+from src.analyzers.reachability_analyzer import ReachabilityAnalyzer
+
+
+class TestReachabilityAnalyzer:
+    # Set up the analyzer.
+    analyzer = ReachabilityAnalyzer(cube_side_length=3)
+
+    def test_get_neighbor(self):
+        for location in [0, 1, 100, 215]:
+            assert self.analyzer.get_neighbor(location=location) == sorted(
+                set(CubieLocationAnalyzer(
+                    cube_side_length=3, track_item_location=location
+                ).get_all_location())
+            )
+
+    def test_reachable_size(self):
+        # Expand the locations one analyzer at a time.
+        locations = {1}
+        expected = []
+        for _ in range(4):
+            locations = set(chain.from_iterable(
+                CubieLocationAnalyzer(
+                    cube_side_length=3, track_item_location=location
+                ).get_all_location()
+                for location in locations
+            ))
+            expected.append(len(locations))
+
+        assert self.analyzer.get_reachable_size(
+            locations=[1], step=4
+        ) == expected
+
+    def test_cumulative_size(self):
+        sizes = self.analyzer.get_reachable_size(
+            locations=iter([0, 5]), step=6, cumulative=True
+        )
+        assert sizes == sorted(sizes)
+        assert sizes[0] == len(
+            {0, 5} | set(self.analyzer.get_neighbor(location=0))
+            | set(self.analyzer.get_neighbor(location=5))
+        )
+
+    def test_large_cube(self):
+        analyzer = ReachabilityAnalyzer(cube_side_length=16)
+        sizes = analyzer.get_reachable_size(locations=[0], step=3)
+        assert len(sizes) == 3
+        assert sizes[-1] <= 16 ** 2 * 24
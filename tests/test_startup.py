@@ -0,0 +1,88 @@
+import os
+import subprocess
+import sys
+
+from benchmarks.suite import ROOT, STARTUP_BUDGET, STARTUP_MODULES
+
+
+class TestStartup:
+    def test_no_pandas(self):
+        # The encryption path should import without loading pandas.
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                f"import sys; import {', '.join(STARTUP_MODULES)}; "
+                f"print('pandas' in sys.modules)"
+            ],
+            capture_output=True, check=True, cwd=ROOT, text=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_default_cipher(self):
+        # The default backend should encrypt without loading pandas.
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys; "
+                "from src.encbit.encryption import Encryption; "
+                "from src.helper.utility import generate_random_keys; "
+                "key = generate_random_keys(length=10, max_index=1); "
+                "encryption = Encryption(message='Cube', cube_side_length=3); "
+                "encryption.encrypt(key=key); encryption.decrypt(); "
+                "print(encryption.get_decrypted_str(), "
+                "'pandas' in sys.modules)"
+            ],
+            capture_output=True, check=True, cwd=ROOT, text=True,
+            env={key: value for key, value in os.environ.items()
+                 if key != "CUBECRYPTO_BACKEND"}
+        )
+        assert result.stdout.split() == ["Cube", "False"]
+
+    def test_import_time(self):
+        # Importing the modules takes a fraction of the pandas import time.
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import time; import numpy; start = time.perf_counter(); "
+                f"import {', '.join(STARTUP_MODULES)}; "
+                "module_time = time.perf_counter() - start; "
+                "start = time.perf_counter(); import pandas; "
+                "print(module_time / (time.perf_counter() - start))"
+            ],
+            capture_output=True, check=True, cwd=ROOT, text=True
+        )
+        assert float(result.stdout) < STARTUP_BUDGET
+
+    def test_display_helper(self):
+        # The display helpers still load pandas on first use.
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys; from src.helper.utility import get_cube_layout; "
+                "get_cube_layout(cube_side_length=2); "
+                "print('pandas' in sys.modules)"
+            ],
+            capture_output=True, check=True, cwd=ROOT, text=True
+        )
+        assert result.stdout.strip() == "True"
+
+    def test_no_numpy(self):
+        # Without NumPy the encryption falls back to the stdlib backend.
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import sys; sys.modules['numpy'] = None; "
+                "from src.encbit.encryption import Encryption; "
+                "from src.engine.backend import DEFAULT_BACKEND; "
+                "from src.helper.utility import generate_random_keys; "
+                "key = generate_random_keys(length=10, max_index=1); "
+                "encryption = Encryption(message='Cube', cube_side_length=3); "
+                "encryption.encrypt(key=key); encryption.decrypt(); "
+                "print(DEFAULT_BACKEND, encryption.get_decrypted_str(), "
+                "'numpy' in sys.modules and sys.modules['numpy'] is not None)"
+            ],
+            capture_output=True, check=True, cwd=ROOT, text=True,
+            env={key: value for key, value in os.environ.items()
+                 if key != "CUBECRYPTO_BACKEND"}
+        )
+        assert result.stdout.split() == ["stdlib", "Cube", "False"]
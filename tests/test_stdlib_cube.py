@@ -0,0 +1,95 @@
+import random
+
+from src.engine.numpy_cube import NumpyCube
+from src.engine.permutation import get_move_permutation
+from src.engine.stdlib_cube import get_move_tuple, StdlibCube
+from src.helper.constant import CUBE_MOVE, WRONG_CUBE_INPUT, \
+    WRONG_CUBE_ITEM, WRONG_CUBE_MOVE
+from src.helper.utility import generate_random_keys
+
+
+class TestStdlibCube:
+    # Set up the inputs and a key.
+    bits = "".join(random.choice("01") for _ in range(384))
+    items = [chr(ord("a") + index % 26) for index in range(96)]
+    key = generate_random_keys(length=10, max_index=2)
+
+    def test_move_tuple(self):
+        for side_length in [2, 3, 4, 5]:
+            for move in CUBE_MOVE:
+                for index in range(1, side_length // 2 + 1):
+                    for item in [False, True]:
+                        assert list(get_move_tuple(
+                            move=move,
+                            index=index,
+                            cube_side_length=side_length,
+                            item=item
+                        )) == list(get_move_permutation(
+                            move=move,
+                            index=index,
+                            cube_side_length=side_length,
+                            item=item
+                        ))
+
+    def test_bit_cube(self):
+        cube = StdlibCube(cube_input=self.bits, cube_side_length=4)
+        numpy_cube = NumpyCube(cube_input=self.bits, cube_side_length=4)
+        for each_key in self.key:
+            for each_cube in [cube, numpy_cube]:
+                each_cube.xor()
+                each_cube.shift_cubie_content()
+                each_cube.shift(key=each_key)
+            assert cube.content == numpy_cube.content
+        assert cube.message_content == numpy_cube.message_content
+        assert cube.random_content == numpy_cube.random_content
+
+    def test_bit_decrypt(self):
+        cube = StdlibCube(cube_input=self.bits, cube_side_length=4)
+        for each_key in self.key:
+            cube.xor()
+            cube.shift_content()
+            cube.shift(key=each_key)
+        for each_key in reversed(self.key):
+            cube.shift(key=each_key._replace(angle=360 - each_key.angle))
+            cube.shift_content_back()
+            cube.xor()
+        assert cube.content == self.bits
+
+    def test_item_cube(self):
+        cube = StdlibCube(
+            cube_input=self.items, cube_side_length=4, item=True
+        )
+        numpy_cube = NumpyCube(
+            cube_input=self.items, cube_side_length=4, item=True
+        )
+        for each_key in self.key:
+            for each_cube in [cube, numpy_cube]:
+                each_cube.shift_content()
+                each_cube.shift(key=each_key)
+            assert cube.content == numpy_cube.content
+
+
+class TestStdlibCubeErrorCheck:
+    def test_wrong_input(self):
+        try:
+            StdlibCube(cube_input="0101", cube_side_length=2)
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_CUBE_INPUT
+
+    def test_wrong_move(self):
+        try:
+            get_move_tuple(move="up", index=1, cube_side_length=2)
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_CUBE_MOVE
+
+    def test_item_xor(self):
+        cube = StdlibCube(
+            cube_input=list(range(24)), cube_side_length=2, item=True
+        )
+        try:
+            cube.xor()
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_CUBE_ITEM
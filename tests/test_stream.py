@@ -0,0 +1,264 @@
+import io
+import random
+
+import numpy as np
+
+from src.encbit.cube import Cube
+from src.engine.stream import AppendWriter, ContainerReader, \
+    CODECS, decrypt_bytes, decrypt_stream, encrypt_bytes, encrypt_stream, \
+    get_cube_bytes, read_container_header, write_container_header
+from src.helper.constant import WRONG_CHUNK_SIZE, WRONG_CONTAINER_CODEC, \
+    WRONG_CONTAINER_DATA, WRONG_KEY_SIDE_LENGTH, WRONG_WORKER_COUNT
+from src.helper.utility import generate_random_keys
+
+
+class TestStream:
+    # Set up a key and random data of a few sizes.
+    key = generate_random_keys(length=10, max_index=1)
+    data = [
+        bytes(random.getrandbits(8) for _ in range(size))
+        for size in [0, 1, 44, 45, 46, 1000]
+    ]
+
+    def test_round_trip(self):
+        for data in self.data:
+            container = encrypt_bytes(
+                data=data, key=self.key, cube_side_length=3
+            )
+            assert decrypt_bytes(data=container, key=self.key) == data
+
+    def test_chunk(self):
+        # Small chunks should split the cubes at any place.
+        for data in self.data:
+            container = io.BytesIO()
+            encrypt_stream(
+                source=io.BytesIO(data),
+                target=container,
+                key=self.key,
+                cube_side_length=3,
+                chunk_size=7
+            )
+            decrypted = io.BytesIO()
+            decrypt_stream(
+                source=io.BytesIO(container.getvalue()),
+                target=decrypted,
+                key=self.key,
+                chunk_size=1
+            )
+            assert decrypted.getvalue() == data
+
+    def test_workers(self):
+        data = self.data[-1] * 10
+        container = encrypt_bytes(
+            data=data, key=self.key, cube_side_length=2, workers=2
+        )
+        assert decrypt_bytes(data=container, key=self.key, workers=2) == data
+
+    def test_codec(self):
+        data = b"The same line of a log.\n" * 100
+        for codec in CODECS:
+            container = encrypt_bytes(
+                data=data, key=self.key, cube_side_length=3, codec=codec
+            )
+            assert read_container_header(
+                source=io.BytesIO(container)
+            ).codec == codec
+            assert decrypt_bytes(data=container, key=self.key) == data
+            if codec != "none":
+                assert len(container) < len(data) / 4
+
+    def test_version_one(self):
+        # Containers of the first version hold no codec.
+        container = encrypt_bytes(data=b"A", key=self.key, cube_side_length=2)
+        header = write_container_header(cube_side_length=2)
+        container = b"CCUB\x01\x02" + container[len(header):]
+        assert read_container_header(io.BytesIO(container)).offset == 6
+        assert decrypt_bytes(data=container, key=self.key) == b"A"
+
+    def test_layout(self):
+        # Each cube should decrypt with the reference cube.
+        container = encrypt_bytes(data=b"A", key=self.key, cube_side_length=2)
+        source = io.BytesIO(container)
+        header = read_container_header(source=source)
+        assert header.side_length == 2
+        assert len(container) == header.offset + get_cube_bytes(2)
+
+        cube = Cube(
+            cube_input="".join(map(str, np.unpackbits(
+                np.frombuffer(source.read(), dtype=np.uint8)
+            ))),
+            cube_side_length=2
+        )
+        for each_key in reversed(self.key):
+            cube.shift(key=each_key._replace(angle=360 - each_key.angle))
+            cube.shift_cubie_content_back()
+            cube.xor()
+        assert cube.message_content == "010000011" + "0" * 71
+
+    def test_error(self):
+        try:
+            decrypt_bytes(data=b"CKEY\x01\x02", key=self.key)
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_CONTAINER_DATA
+
+        try:
+            decrypt_bytes(
+                data=encrypt_bytes(
+                    data=b"A", key=self.key, cube_side_length=2
+                )[:-1],
+                key=self.key
+            )
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_CONTAINER_DATA
+
+        try:
+            encrypt_bytes(
+                data=b"A", key=self.key, cube_side_length=2, codec="gzip"
+            )
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_CONTAINER_CODEC
+
+        try:
+            encrypt_bytes(
+                data=b"A", key=self.key, cube_side_length=2, workers=0
+            )
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_WORKER_COUNT
+
+        try:
+            decrypt_stream(
+                source=io.BytesIO(encrypt_bytes(
+                    data=b"A", key=self.key, cube_side_length=2
+                )),
+                target=io.BytesIO(),
+                key=self.key,
+                chunk_size=0
+            )
+            raise AssertionError("Error message did not raise.")
+        except AssertionError as error:
+            assert str(error) == WRONG_CHUNK_SIZE
+
+
+class TestAppendWriter:
+    # Set up a key and the pieces appended one after another.
+    key = generate_random_keys(length=10, max_index=1)
+    pieces = [
+        bytes(random.getrandbits(8) for _ in range(size))
+        for size in [0, 5, 1, 44, 100]
+    ]
+
+    def test_flush(self):
+        target, data = io.BytesIO(), b""
+        writer = AppendWriter(target=target, key=self.key, cube_side_length=3)
+        for piece in self.pieces:
+            writer.write(data=piece, chunk_size=7)
+            writer.flush()
+            data += piece
+            assert decrypt_bytes(data=target.getvalue(), key=self.key) == data
+
+        # The container is as long as one encrypted at once.
+        assert len(target.getvalue()) == len(encrypt_bytes(
+            data=data, key=self.key, cube_side_length=3
+        ))
+
+    def test_no_flush(self):
+        # Every write leaves a container that decrypts without a flush.
+        target, data = io.BytesIO(), b""
+        writer = AppendWriter(target=target, key=self.key, cube_side_length=3)
+        assert decrypt_bytes(data=target.getvalue(), key=self.key) == b""
+        for piece in self.pieces:
+            writer.write(data=piece, chunk_size=7)
+            data += piece
+            assert decrypt_bytes(data=target.getvalue(), key=self.key) == data
+
+    def test_reopen(self):
+        target = io.BytesIO(
+            encrypt_bytes(
+                data=self.pieces[3], key=self.key, cube_side_length=3
+            )
+        )
+        with AppendWriter(target=target, key=self.key) as writer:
+            assert writer.side_length == 3
+            writer.write(data=self.pieces[4])
+        assert decrypt_bytes(data=target.getvalue(), key=self.key) == \
+            self.pieces[3] + self.pieces[4]
+
+    def test_only_new_cubes(self):
+        target = io.BytesIO()
+        with AppendWriter(target=target, key=self.key, cube_side_length=2) \
+                as writer:
+            writer.write(data=bytes(25))
+        before = target.getvalue()
+
+        # The full cubes before the last one are left as they were.
+        with AppendWriter(target=target, key=self.key) as writer:
+            assert writer.write(data=bytes(10)) == 1
+        assert target.getvalue()[:len(before) - get_cube_bytes(2)] == \
+            before[:-get_cube_bytes(2)]
+
+    def test_error(self):
+        target = io.BytesIO(
+            encrypt_bytes(data=b"A", key=self.key, cube_side_length=2)
+        )
+        try:
+            AppendWriter(target=target, key=self.key, cube_side_length=3)
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_KEY_SIDE_LENGTH
+
+        try:
+            AppendWriter(target=io.BytesIO(), key=self.key)
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_CONTAINER_DATA
+
+        try:
+            AppendWriter(
+                target=io.BytesIO(encrypt_bytes(
+                    data=b"A", key=self.key, cube_side_length=2, codec="zlib"
+                )),
+                key=self.key
+            )
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_CONTAINER_CODEC
+
+
+class TestContainerReader:
+    # Set up a container of a few cubes.
+    key = generate_random_keys(length=10, max_index=1)
+    data = bytes(random.getrandbits(8) for _ in range(300))
+    reader = ContainerReader(
+        source=io.BytesIO(
+            encrypt_bytes(data=data, key=key, cube_side_length=3)
+        ),
+        key=key
+    )
+
+    def test_size(self):
+        # Each cube holds 180 bits, plus one cube for the padding.
+        assert self.reader.cube_count == 14
+        assert len(self.reader) == 300
+
+    def test_read(self):
+        for start, stop in [(0, 1), (22, 23), (44, 46), (100, 250),
+                            (299, 300), (0, None), (-5, None), (290, 400),
+                            (50, 10)]:
+            assert self.reader.read(start=start, stop=stop) == \
+                self.data[start:stop]
+
+    def test_error(self):
+        try:
+            ContainerReader(
+                source=io.BytesIO(encrypt_bytes(
+                    data=b"A", key=self.key, cube_side_length=2
+                )[:-1]),
+                key=self.key
+            )
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_CONTAINER_DATA
@@ -1,7 +1,8 @@
 import pandas as pd
 
 import src.helper.utility as utility
-from src.helper.constant import CUBE_MOVE, Key, MOVE_ANGLE
+from src.helper.constant import CUBE_MOVE, Key, MOVE_ANGLE, \
+    WRONG_BINARY_LENGTH, WRONG_BINARY_STRING
 
 
 class TestUtility:
@@ -57,3 +58,42 @@ class TestUtility:
 
     def test_binary_to_string(self):
         assert utility.binary_to_string(input_binary="01000001") == "A"
+
+    def test_any_text(self):
+        # Equal signs, leading zero bytes and non-ASCII text are kept.
+        for text in ["a=3D", "\x00A", "caf\u00e9 \u2713", ""]:
+            assert utility.binary_to_string(
+                input_binary=utility.string_to_binary(input_string=text)
+            ) == text
+        assert utility.string_to_binary(input_string="\x00A") == \
+            "00000000" "01000001"
+
+    def test_iter_binary(self):
+        text = "caf\u00e9 \u2713"
+        binary = "".join(utility.iter_string_to_binary(
+            input_strings=[text[:4], text[4:]]
+        ))
+        assert binary == utility.string_to_binary(input_string=text)
+
+        # The chunks may split bytes and characters anywhere.
+        chunks = [binary[start: start + 5] for start in range(0, 80, 5)]
+        assert "".join(
+            utility.iter_binary_to_string(input_binaries=chunks)
+        ) == text
+
+
+class TestUtilityErrorCheck:
+    def test_binary_length(self):
+        try:
+            list(utility.iter_binary_to_string(input_binaries=["0100"]))
+            raise AssertionError("Error message did not raise.")
+        except ValueError as error:
+            assert str(error) == WRONG_BINARY_LENGTH
+
+    def test_binary_string(self):
+        for binary in ["01000012", "0100 001", "0100_001"]:
+            try:
+                utility.binary_to_string(input_binary=binary)
+                raise AssertionError("Error message did not raise.")
+            except ValueError as error:
+                assert str(error) == WRONG_BINARY_STRING